@@ -0,0 +1,9 @@
+"""
+Offline benchmarks for the resume-parser backend.
+
+Run from the backend/ directory:
+    python -m benchmarks.variety   project variety scorer vs. the old Node helper
+    python -m benchmarks.corpus    write a synthetic resume corpus
+    python -m benchmarks.parse     per-stage parse timings, with baseline checks
+    python -m benchmarks.openai_stub  OpenAI client limits and retries vs. a stub server
+"""
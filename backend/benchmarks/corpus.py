@@ -0,0 +1,230 @@
+"""
+benchmarks/corpus.py
+
+Generate synthetic resumes for benchmarking the parser, offline.
+
+Each resume is laid out the way resume_parser.py expects (name on the first
+line, contact line, upper-case section headers) and written as .txt, .docx,
+text-layer .pdf or .png (a rendered PDF page, which goes through OCR).
+
+Usage (from backend/):
+    python -m benchmarks.corpus OUT_DIR [--count 50] [--formats txt,docx,pdf]
+        [--size 3] [--sections EDUCATION,SKILLS,PROJECTS,EXPERIENCE] [--seed 0]
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import fitz
+from docx import Document
+
+FORMATS = ("txt", "docx", "pdf", "png")
+SECTIONS = (
+    "EDUCATION",
+    "TECHNICAL SKILLS",
+    "PROJECTS",
+    "EXPERIENCE",
+    "LEADERSHIP & ACTIVITIES",
+    "ADDITIONAL INFORMATION",
+)
+
+_FIRST = "Alex Jordan Priya Wei Maria Omar Chen Fatima Lucas Aisha Diego Hana Noah Sofia".split()
+_LAST = "Nguyen Patel Garcia Smith Kim Okafor Rossi Silva Cohen Tanaka Brown Haddad".split()
+_CITIES = [
+    ("Tempe", "AZ"), ("Phoenix", "AZ"), ("San Jose", "CA"), ("Austin", "TX"),
+    ("Seattle", "WA"), ("Boston", "MA"), ("Denver", "CO"), ("New York", "NY"),
+]
+_SCHOOLS = ["Arizona State University", "University of Arizona", "State College", "Tech Institute"]
+_DEGREES = [
+    "B.S. Computer Science", "Bachelor of Science in Computer Engineering",
+    "M.S. Data Science", "Master of Science in Software Engineering",
+    "BA Mathematics", "Ph.D. Electrical Engineering", "Associate of Arts",
+]
+_DATES = ["May 2024", "2019 – 2023", "Expected 12/2025", "December 2022", "Aug 2018 – May 2022", "2021"]
+_SKILLS = (
+    "Python Java C++ JavaScript TypeScript React Node.js SQL PostgreSQL MongoDB Docker "
+    "Kubernetes AWS Git Linux FastAPI Flask Django PyTorch TensorFlow Pandas Rust Go"
+).split()
+_VERBS = "Built Designed Implemented Led Optimized Deployed Automated Refactored Launched Scaled".split()
+_OBJECTS = [
+    "a REST API serving 10k requests per day", "a React dashboard for sales analytics",
+    "a machine learning pipeline for image classification", "a chess engine with alpha-beta search",
+    "an Android app for campus events", "a distributed cache in Go", "CI pipelines with GitHub Actions",
+    "a recommendation system using collaborative filtering", "a compiler front end for a toy language",
+    "an IoT sensor network with Arduino", "a startup MVP with 500 beta users",
+]
+_PROJECT_NAMES = [
+    "Chess Engine", "Campus Events App", "Sales Dashboard", "Image Classifier",
+    "Toy Compiler", "Sensor Network", "Budget Tracker", "Resume Parser",
+]
+_EMPLOYERS = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries"]
+
+
+def _bullets(rng: random.Random, count: int) -> List[str]:
+    return [f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)}" for _ in range(count)]
+
+
+def _section_lines(rng: random.Random, header: str, size: int) -> List[str]:
+    if header == "EDUCATION":
+        lines = []
+        for _ in range(max(1, size // 2)):
+            lines.append(f"{rng.choice(_DEGREES)}, {rng.choice(_SCHOOLS)}, {rng.choice(_DATES)}")
+        lines.append(f"GPA: {rng.uniform(2.5, 4.0):.2f}")
+        return lines
+    if header == "TECHNICAL SKILLS":
+        return [", ".join(rng.sample(_SKILLS, min(len(_SKILLS), 4 + 2 * size)))]
+    if header == "PROJECTS":
+        lines = []
+        for _ in range(size):
+            start = rng.randint(2018, 2023)
+            lines.append(f"{rng.choice(_PROJECT_NAMES)} ({start}–{start + 1}):")
+            lines.extend(_bullets(rng, rng.randint(2, 4)))
+        return lines
+    if header == "EXPERIENCE":
+        lines = []
+        for _ in range(size):
+            city, state = rng.choice(_CITIES)
+            lines.append(f"Software Engineer Intern, {rng.choice(_EMPLOYERS)}, {city}, {state}")
+            lines.extend(_bullets(rng, rng.randint(2, 5)))
+        return lines
+    return _bullets(rng, size)
+
+
+def generate_resume(
+    rng: random.Random,
+    size: int = 3,
+    sections: Sequence[str] = SECTIONS,
+) -> str:
+    """
+    Build the text of one synthetic resume.
+
+    Args:
+        rng: Random source.
+        size: Entries per section (degrees, projects, jobs, bullets).
+        sections: Section headers to include, in order.
+
+    Returns:
+        The resume text.
+    """
+    first, last = rng.choice(_FIRST), rng.choice(_LAST)
+    city, state = rng.choice(_CITIES)
+    lines = [
+        f"{first} {last}",
+        f"📍 {city}, {state} | {first.lower()}.{last.lower()}@example.com | "
+        f"({rng.randint(200, 989)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        "",
+    ]
+    for header in sections:
+        lines.append(header)
+        lines.extend(_section_lines(rng, header, size))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _pdf_document(text: str) -> fitz.Document:
+    """Lay the text out on as many Letter pages as it needs."""
+    doc = fitz.open()
+    lines = text.splitlines()
+    per_page = 50
+    for start in range(0, max(len(lines), 1), per_page):
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((54, 54), "\n".join(lines[start:start + per_page]), fontsize=10)
+    return doc
+
+
+def write_resume(text: str, path: Path) -> Path:
+    """
+    Write resume text in the format given by the path's extension.
+
+    Args:
+        text: Resume text.
+        path: Output path ending in .txt, .docx, .pdf or .png.
+
+    Returns:
+        The path written.
+    """
+    ext = path.suffix.lower().lstrip(".")
+    if ext == "txt":
+        path.write_text(text, encoding="utf-8")
+    elif ext == "docx":
+        document = Document()
+        for line in text.splitlines():
+            document.add_paragraph(line)
+        document.save(str(path))
+    elif ext == "pdf":
+        with _pdf_document(text) as doc:
+            doc.save(str(path))
+    elif ext == "png":
+        # Only the first page is rendered; OCR'd images are single-page.
+        with _pdf_document(text) as doc:
+            doc[0].get_pixmap(dpi=150).save(str(path))
+    else:
+        raise ValueError(f"Unsupported format: {path.suffix}")
+    return path
+
+
+def generate_corpus(
+    out_dir: Path,
+    count: int,
+    formats: Sequence[str] = ("txt", "docx", "pdf"),
+    size: int = 3,
+    sections: Sequence[str] = SECTIONS,
+    seed: int = 0,
+) -> Dict[str, List[Path]]:
+    """
+    Write count resumes per format into out_dir.
+
+    The same count texts are written in every format, so stage timings are
+    comparable across formats.
+
+    Args:
+        out_dir: Directory to write into (created if missing).
+        count: Number of resumes per format.
+        formats: Any of FORMATS.
+        size: Entries per section.
+        sections: Section headers to include.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        Mapping of format to the written paths.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats: {', '.join(sorted(unknown))}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    texts = [generate_resume(rng, size, sections) for _ in range(count)]
+    return {
+        fmt: [write_resume(text, out_dir / f"resume_{i:04d}.{fmt}") for i, text in enumerate(texts)]
+        for fmt in formats
+    }
+
+
+def parse_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated command-line option."""
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--formats", default="txt,docx,pdf")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--sections", default=",".join(SECTIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    written = generate_corpus(
+        args.out_dir, args.count, parse_list(args.formats), args.size,
+        parse_list(args.sections), args.seed,
+    )
+    for fmt, paths in written.items():
+        print(f"{fmt}: {len(paths)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
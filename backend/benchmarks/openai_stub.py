@@ -0,0 +1,215 @@
+"""
+benchmarks/openai_stub.py
+
+Drive openai_client against a local OpenAI-compatible stub server that
+injects 429 and 5xx failures, and check that concurrency, request rate and
+retries behave as configured.
+
+Usage (from backend/):
+    python -m benchmarks.openai_stub [--calls 200] [--error-rate 0.2]
+        [--latency 0.05] [--concurrency 8] [--rpm 1200]
+
+Exits with status 1 if a call fails, more than --concurrency requests were
+in flight at once, or the sustained request rate exceeded --rpm (beyond the
+allowed burst and 5% for timing jitter).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+
+class StubState:
+    """Counters shared by the stub's request handler threads."""
+
+    def __init__(self, error_rate: float, latency: float, seed: int, malformed_rate: float = 0.0) -> None:
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.arrivals: List[float] = []
+        self.failures_sent = 0
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "stub",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+
+def _batch_content(prompt: str, state: StubState) -> str:
+    """Answer a batched scoring prompt, leaving out some entries at malformed_rate."""
+    entries = {}
+    for key in re.findall(r"^(R\d+):", prompt, re.MULTILINE):
+        with state.lock:
+            malformed = state.rng.random() < state.malformed_rate
+        if not malformed:
+            entries[key] = {"score": 75, "evidence": ["stub evidence"]}
+    return json.dumps(entries)
+
+
+def make_handler(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def _send(self, status: int, body: dict, headers: dict = {}) -> None:
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with state.lock:
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+                state.arrivals.append(time.monotonic())
+                roll = state.rng.random()
+            try:
+                time.sleep(state.latency)
+                if roll < state.error_rate / 2:
+                    with state.lock:
+                        state.failures_sent += 1
+                    self._send(429, {"error": {"message": "rate limited", "type": "rate_limit"}},
+                               {"retry-after-ms": "50"})
+                elif roll < state.error_rate:
+                    with state.lock:
+                        state.failures_sent += 1
+                    self._send(503, {"error": {"message": "overloaded", "type": "server_error"}})
+                else:
+                    prompt = request["messages"][-1]["content"]
+                    if request.get("response_format", {}).get("type") == "json_object":
+                        content = _batch_content(prompt, state)
+                    elif "Return ONLY the number" in prompt:
+                        content = "75"
+                    else:
+                        content = "• stub evidence"
+                    self._send(200, _completion(content))
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+def start_stub(state: StubState) -> ThreadingHTTPServer:
+    """
+    Serve the stub on a free localhost port in a daemon thread.
+
+    Args:
+        state: Shared counters and failure settings.
+
+    Returns:
+        The running server; its port is server.server_address[1].
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def max_rate(arrivals: List[float], window: float) -> float:
+    """
+    Highest number of arrivals in any window, per minute.
+
+    Args:
+        arrivals: Monotonic arrival times.
+        window: Window length in seconds.
+
+    Returns:
+        Peak requests per minute.
+    """
+    arrivals = sorted(arrivals)
+    peak, start = 0, 0
+    for end, t in enumerate(arrivals):
+        while t - arrivals[start] > window:
+            start += 1
+        peak = max(peak, end - start + 1)
+    return peak * 60.0 / window
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rpm", type=float, default=1200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    state = StubState(args.error_rate, args.latency, args.seed)
+    server = start_stub(state)
+
+    # openai_client reads its limits, and the SDK its base URL, from the environment.
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["OPENAI_MAX_CONCURRENCY"] = str(args.concurrency)
+    os.environ["OPENAI_REQUESTS_PER_MINUTE"] = str(args.rpm)
+    import openai_client
+
+    async def run() -> List[object]:
+        calls = [
+            openai_client.chat_completion(
+                "score",
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": f"Requirement {i}. Return ONLY the number."}],
+                max_tokens=5,
+            )
+            for i in range(args.calls)
+        ]
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    start = time.perf_counter()
+    responses = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    failed = [r for r in responses if isinstance(r, BaseException)]
+    # The bucket allows OPENAI_BURST back-to-back calls, so measure the
+    # sustained rate over windows long enough to amortize that burst.
+    window = max(5.0, 4 * openai_client.OPENAI_BURST * 60.0 / args.rpm)
+    peak_rpm = max_rate(state.arrivals, window)
+    retries = openai_client.RETRIES.value(operation="score")
+
+    print(f"calls:            {args.calls} in {elapsed:.2f} s ({args.calls / elapsed:.1f}/s)")
+    print(f"requests sent:    {len(state.arrivals)} ({state.failures_sent} failed by the stub, {retries:.0f} retried)")
+    print(f"max in flight:    {state.max_in_flight} (limit {args.concurrency})")
+    print(f"peak rate:        {peak_rpm:.0f}/min over {window:.1f} s windows (limit {args.rpm:.0f})")
+    print(f"failed calls:     {len(failed)}")
+    for error in failed[:5]:
+        print(f"  {type(error).__name__}: {error}")
+
+    problems = bool(failed)
+    problems |= state.max_in_flight > args.concurrency
+    # Allow the bucket's burst on top of the limit, plus 5% for arrival jitter.
+    problems |= peak_rpm > 1.05 * args.rpm + openai_client.OPENAI_BURST * 60.0 / window
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
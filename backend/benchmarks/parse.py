@@ -0,0 +1,207 @@
+"""
+benchmarks/parse.py
+
+Time each stage of resume parsing on a synthetic corpus and compare the
+result against a saved baseline.
+
+Stages are the steps parse_resume runs, timed through the same functions:
+text extraction, the single-pass scan_text, spaCy NER (only for resumes
+that need it), degree classification and project splitting, plus the
+whole parse_resume call ("total"). For each format and stage the runner
+reports p50/p90/p99 latency, and per format the throughput of full
+parses. benchmarks/parse_baseline.json holds a reference run with the
+default options.
+
+Usage (from backend/):
+    python -m benchmarks.parse [--count 50] [--formats txt,docx,pdf] [--size 3]
+        [--repeat 3] [--corpus DIR] [--save-baseline FILE]
+        [--baseline FILE] [--threshold 0.25]
+
+    python -m benchmarks.parse --baseline benchmarks/parse_baseline.json
+
+With --baseline, the run exits with status 1 if any stage's p50 is more
+than --threshold (fractional) above the baseline. Baselines are machine
+specific; save one on the machine that checks it.
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import resume_parser
+from benchmarks.corpus import SECTIONS, generate_corpus, parse_list
+
+STAGES = ("extraction", "scan", "ner", "degrees", "projects", "total")
+PERCENTILES = (50, 90, 99)
+
+
+def _timed(fn: Callable, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def time_stages(path: str) -> Dict[str, float]:
+    """
+    Time every parsing stage for one file.
+
+    Args:
+        path: Resume file path.
+
+    Returns:
+        Seconds spent in each of STAGES; "ner" is left out when the regex
+        scan finds both name and location, as parse_resume skips it then.
+    """
+    timings = {}
+    text, timings["extraction"] = _timed(resume_parser.parseFileAtPathToText, path)
+    scan, timings["scan"] = _timed(resume_parser.scan_text, text)
+    if not scan["name"] or not scan["location"]:
+        _, timings["ner"] = _timed(resume_parser.ner_doc, text)
+    _, timings["degrees"] = _timed(resume_parser.classify_degree_lines, scan["degree_lines"])
+    sections = scan["sections"]
+    _, timings["projects"] = _timed(
+        lambda: (
+            resume_parser.split_projects_by_bullets(sections.get("PROJECTS", "")),
+            resume_parser.split_projects_by_bullets(sections.get("EXPERIENCE", "")),
+        )
+    )
+    _, timings["total"] = _timed(resume_parser.parse_resume, path)
+    return timings
+
+
+def summarize(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    """
+    Reduce per-stage samples (seconds) to percentile latencies in ms.
+
+    Args:
+        samples: Seconds per call, by stage.
+
+    Returns:
+        {stage: {"p50_ms": ..., "p90_ms": ..., "p99_ms": ...}}
+    """
+    summary = {}
+    for stage, values in samples.items():
+        if not values:
+            continue
+        ms = np.asarray(values) * 1000
+        summary[stage] = {f"p{p}_ms": round(float(np.percentile(ms, p)), 4) for p in PERCENTILES}
+    return summary
+
+
+def run(paths_by_format: Dict[str, List[Path]], repeat: int) -> Dict[str, dict]:
+    """
+    Time all stages over the corpus.
+
+    Each file is parsed once untimed first so one-off model loading does
+    not count towards the results.
+
+    Args:
+        paths_by_format: Corpus files grouped by format.
+        repeat: Timed passes over each file.
+
+    Returns:
+        {format: {"docs_per_s": ..., "stages": summarize(...)}}
+    """
+    results = {}
+    for fmt, paths in paths_by_format.items():
+        for path in paths:
+            resume_parser.parse_resume(str(path))
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        for _ in range(repeat):
+            for path in paths:
+                for stage, seconds in time_stages(str(path)).items():
+                    samples[stage].append(seconds)
+        total = sum(samples["total"])
+        results[fmt] = {
+            "docs_per_s": round(len(samples["total"]) / total, 2) if total else 0.0,
+            "stages": summarize(samples),
+        }
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    List the stages whose p50 regressed beyond the threshold.
+
+    Args:
+        results: Output of run().
+        baseline: A previously saved run() output.
+        threshold: Allowed fractional slowdown, e.g. 0.25 for 25%.
+        min_delta_ms: Absolute slack, so sub-microsecond noise never fails.
+
+    Returns:
+        One message per regression; empty if none.
+    """
+    regressions = []
+    for fmt, result in results.items():
+        for stage, stats in result["stages"].items():
+            base = baseline.get(fmt, {}).get("stages", {}).get(stage)
+            if not base:
+                continue
+            now, before = stats["p50_ms"], base["p50_ms"]
+            if now > before * (1 + threshold) and now - before > min_delta_ms:
+                regressions.append(f"{fmt}/{stage}: p50 {now:.3f} ms vs baseline {before:.3f} ms")
+    return regressions
+
+
+def print_report(results: Dict[str, dict]) -> None:
+    header = f"{'format':<7}{'stage':<12}" + "".join(f"{f'p{p} ms':>11}" for p in PERCENTILES)
+    print(header)
+    for fmt, result in results.items():
+        for stage, stats in result["stages"].items():
+            print(f"{fmt:<7}{stage:<12}" + "".join(f"{stats[f'p{p}_ms']:>11.3f}" for p in PERCENTILES))
+        print(f"{fmt:<7}{'throughput':<12}{result['docs_per_s']:>11.1f} docs/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--formats", default="txt,docx,pdf")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--sections", default=",".join(SECTIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--corpus", type=Path, help="Write the corpus here instead of a temp dir")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    args = parser.parse_args()
+
+    formats = parse_list(args.formats)
+    if "png" in formats and importlib.util.find_spec("easyocr") is None:
+        print("png: skipped (easyocr is not installed)")
+        formats.remove("png")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = generate_corpus(
+            args.corpus or Path(tmp), args.count, formats, args.size,
+            parse_list(args.sections), args.seed,
+        )
+        results = run(corpus, args.repeat)
+
+    print_report(results)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""
+benchmarks/variety.py
+
+Compare the in-process variety scorer against the old per-candidate
+Node subprocess (utils/calc_variety.js): wall time and score parity.
+
+Usage (from backend/):
+    python -m benchmarks.variety [--candidates 200] [--seed 0] [--tolerance 0.01]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from project_scores import variety_score, variety_scores
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+VARIETY_JS = BACKEND_DIR / "utils" / "calc_variety.js"
+
+_VOCAB = (
+    "built designed deployed react node python flask django api rest graphql "
+    "database postgres mongodb machine learning model classifier dataset web "
+    "mobile app android ios swift kotlin unity game engine chess rust docker "
+    "kubernetes aws cloud pipeline scraper dashboard analytics startup users "
+    "revenue arduino robot sensor embedded compiler parser cli tool library"
+).split()
+
+
+def synthetic_candidates(count: int, seed: int) -> List[List[str]]:
+    """
+    Generate project lists with a realistic spread of sizes.
+
+    Args:
+        count: Number of candidates.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        One list of project strings per candidate.
+    """
+    rng = random.Random(seed)
+    candidates = []
+    for _ in range(count):
+        projects = []
+        for _ in range(rng.randint(0, 6)):
+            words = rng.choices(_VOCAB, k=rng.randint(4, 40))
+            projects.append(" ".join(words).capitalize() + ".")
+        candidates.append(projects)
+    return candidates
+
+
+def subprocess_variety(projects: List[str]) -> Optional[float]:
+    """
+    Score one candidate through the Node helper, as main.py used to.
+
+    Args:
+        projects: The candidate's project strings.
+
+    Returns:
+        The printed score (0.0 when the script prints nothing), or None if
+        Node or its dependencies are unavailable.
+    """
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tf:
+        json.dump({"projects": projects}, tf)
+        tmp_path = tf.name
+    try:
+        result = subprocess.run(
+            ["node", str(VARIETY_JS), tmp_path],
+            capture_output=True, text=True, cwd=BACKEND_DIR,
+        )
+    except FileNotFoundError:
+        return None
+    finally:
+        os.unlink(tmp_path)
+    if result.returncode != 0:
+        return None
+    out = result.stdout.strip()
+    return float(out) if out else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.01)
+    args = parser.parse_args()
+
+    candidates = synthetic_candidates(args.candidates, args.seed)
+
+    start = time.perf_counter()
+    batched = variety_scores(candidates)
+    batch_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [variety_score(projects) for projects in candidates]
+    single_s = time.perf_counter() - start
+
+    print(f"candidates:          {len(candidates)}")
+    print(f"python batch:        {batch_s * 1000:9.2f} ms")
+    print(f"python per-candidate:{single_s * 1000:9.2f} ms")
+
+    start = time.perf_counter()
+    reference = []
+    for projects in candidates:
+        score = subprocess_variety(projects)
+        if score is None:
+            print("node subprocess:     unavailable (install node and run npm install)")
+            return 0
+        reference.append(score)
+    node_s = time.perf_counter() - start
+    print(f"node subprocess:     {node_s * 1000:9.2f} ms")
+    print(f"speedup (batch):     {node_s / batch_s:9.1f}x")
+
+    mismatches = [
+        (i, ref, got)
+        for i, (ref, got) in enumerate(zip(reference, batched))
+        if abs(ref - got) > args.tolerance
+    ]
+    max_diff = max((abs(r - g) for r, g in zip(reference, batched)), default=0.0)
+    print(f"max |node - python|: {max_diff:.4f}")
+    for i, ref, got in mismatches[:10]:
+        print(f"  candidate {i}: node={ref:.2f} python={got:.2f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""
+entrepreneurial.py
+
+Keyword part of the entrepreneurial signal.
+
+A resume's keyword hits are the number of ENTREPRENEURIAL_KEYWORDS_PATH
+keywords (default data/entrepreneurial_keywords.txt) found in its text,
+projects, skills, experience and degrees. A keyword counts where the
+frontend's original /\bkeyword\b/i regex matched: ASCII letters match
+either case, other characters only themselves, and \b is an ASCII word
+boundary. All keywords are found in one pass with an Aho-Corasick
+automaton. Hits become a 0–100 keyword score, 100 * (1 - e^(-hits/ALPHA)),
+and the entrepreneurial score is the mean of project uniqueness, project
+variety and keyword score.
+
+KEYWORDS_VERSION fingerprints the keyword list and MATCHER_VERSION;
+candidates scored with a different list or matcher are rescored in the
+background.
+"""
+
+import hashlib
+import math
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+KEYWORDS_PATH = os.getenv(
+    "ENTREPRENEURIAL_KEYWORDS_PATH",
+    str(Path(__file__).resolve().parent / "data" / "entrepreneurial_keywords.txt"),
+)
+
+# Lower values make the keyword score rise faster with each hit.
+ALPHA = 1.8
+
+# Bump when matching changes, so stored keyword hits are recounted.
+MATCHER_VERSION = 2
+
+# Lowercases ASCII letters only, keeping every other character (and so
+# every position) as it is, like a non-Unicode JavaScript /i regex.
+_FOLD_CASE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _is_word(char: str) -> bool:
+    return char.isascii() and (char.isalnum() or char == "_")
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a keyword list.
+
+    The goto and failure functions are folded into one transition dict per
+    state, so scanning costs one dict lookup per character. A match only
+    counts with a word boundary at each end, as \b requires: "ran" is
+    found in "ran a shop" but not in "operand", and a keyword edge that is
+    not a word character, like "™", needs a word character beside it.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to find; blank ones are ignored.
+        """
+        self.keywords: List[str] = [k for k in (k.strip() for k in keywords) if k]
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword.translate(_FOLD_CASE):
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].append(index)
+
+        # Breadth-first, so each state's failure target is complete before
+        # its children need it. Missing transitions fall back to the root.
+        fail = [0] * len(goto)
+        self._delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = list(goto[0].values())
+        for state in queue:
+            self._delta[state] = {**self._delta[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = self._delta[fail[state]].get(char, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+                queue.append(child)
+        self._outputs = outputs
+
+        # Boundary checks per keyword: length, and whether each end is a word character.
+        self._lengths = [len(k) for k in self.keywords]
+        self._word_start = [_is_word(k[0]) for k in self.keywords]
+        self._word_end = [_is_word(k[-1]) for k in self.keywords]
+
+    def find(self, text: str) -> List[int]:
+        """
+        Find which keywords occur in a text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Indices into self.keywords of the keywords found, ascending.
+        """
+        text = text.translate(_FOLD_CASE)
+        delta, outputs = self._delta, self._outputs
+        found = set()
+        state = 0
+        last = len(text) - 1
+        for position, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            for index in outputs[state]:
+                if index in found:
+                    continue
+                # A boundary: the characters on either side of it differ in
+                # being word characters; the text's edges count as non-word.
+                after = position < last and _is_word(text[position + 1])
+                if after == self._word_end[index]:
+                    continue
+                start = position - self._lengths[index] + 1
+                before = start > 0 and _is_word(text[start - 1])
+                if before == self._word_start[index]:
+                    continue
+                found.add(index)
+        return sorted(found)
+
+    def count(self, text: str) -> int:
+        """Number of keywords that occur in a text."""
+        return len(self.find(text))
+
+
+def load_keywords(path: str) -> List[str]:
+    """Read a keyword file: one keyword per line, blank lines and #-comments skipped."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def keywords_version(keywords: Iterable[str]) -> str:
+    """Short fingerprint of a keyword list and MATCHER_VERSION."""
+    fingerprint = "\n".join([f"matcher {MATCHER_VERSION}", *keywords])
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).hexdigest()
+
+
+KEYWORDS = load_keywords(KEYWORDS_PATH)
+KEYWORDS_VERSION = keywords_version(KEYWORDS)
+MATCHER = KeywordMatcher(KEYWORDS)
+
+
+def _as_text(value) -> str:
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    return " ".join(str(item) for item in value)
+
+
+def signal_text(
+    text: Optional[str],
+    projects: Optional[list],
+    skills,
+    experience: Optional[list],
+    degrees_earned: Optional[list],
+) -> str:
+    """
+    Join the resume fields the keywords are looked for in.
+
+    Args:
+        text: Full resume text.
+        projects: Project strings.
+        skills: Skills text or list.
+        experience: Experience strings.
+        degrees_earned: [degree, details] pairs; the details are included.
+
+    Returns:
+        The fields joined with spaces.
+    """
+    degrees = [degree[1] for degree in degrees_earned or [] if len(degree) > 1 and degree[1]]
+    return " ".join([
+        text or "",
+        _as_text(projects),
+        _as_text(skills),
+        _as_text(experience),
+        _as_text(degrees),
+    ])
+
+
+def keyword_score(hits: int) -> float:
+    """0–100 keyword score for a number of keyword hits."""
+    return round(100 * (1 - math.exp(-hits / ALPHA)), 2)
@@ -0,0 +1,239 @@
+"""
+geocoder.py
+
+Offline geocoding of candidate locations, and the grid index behind
+radius queries.
+
+Locations are looked up in a gazetteer of cities loaded once from
+GAZETTEER_PATH: by default the bundled data/gazetteer.csv (the US and
+Indian cities of GeoNames cities1000, with Indian states as postal codes,
+plus former names like Bombay), or a GeoNames cities dump (cities500.txt,
+cities15000.txt, ...) for other countries.
+
+Each geocoded candidate also gets a grid cell, a GRID_DEGREES square of
+latitude and longitude. A radius query first keeps the candidates in the
+cells the circle touches (an indexed IN on job_id and geo_cell) and only
+then computes exact haversine distances for those.
+"""
+
+import csv
+import math
+import os
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+GAZETTEER_PATH = os.getenv(
+    "GAZETTEER_PATH", str(Path(__file__).resolve().parent / "data" / "gazetteer.csv")
+)
+
+# Side of a grid cell, in degrees.
+GRID_DEGREES = 1.0
+_GRID_COLUMNS = int(round(360 / GRID_DEGREES))
+
+# Radius queries touching more cells than this skip the grid prefilter.
+MAX_QUERY_CELLS = 400
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = 69.0
+
+# Names that may follow a city in place of a state.
+COUNTRY_ALIASES = {
+    "us": "US", "usa": "US", "u s": "US", "u s a": "US",
+    "united states": "US", "united states of america": "US",
+    "india": "IN",
+}
+
+_ZIP_RE = re.compile(r"\b\d{5}(?:-\d{4})?\b|\b\d{6}\b")
+_ABBREVIATIONS = [(re.compile(r"^st\b\.?"), "saint"), (re.compile(r"^ft\b\.?"), "fort"), (re.compile(r"^mt\b\.?"), "mount")]
+_NON_WORD_RE = re.compile(r"[^\w\s-]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+class Place(NamedTuple):
+    lat: float
+    lng: float
+    admin1: str
+    admin1_name: str
+    country: str
+    population: int
+
+
+_places: Optional[Dict[str, List[Place]]] = None
+_load_lock = threading.Lock()
+
+
+def normalize(name: str) -> str:
+    """Lowercase, strip accents and punctuation, and expand St./Ft./Mt."""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower().strip()
+    for pattern, replacement in _ABBREVIATIONS:
+        name = pattern.sub(replacement, name)
+    return _SPACE_RE.sub(" ", _NON_WORD_RE.sub(" ", name)).strip()
+
+
+def _read_csv(path: str):
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield (row["name"], row["lat"], row["lng"], row["admin1"],
+                   row.get("admin1_name", ""), row["country"], row.get("population") or 0)
+
+
+def _read_geonames(path: str):
+    # Tab-separated GeoNames dump: name, asciiname, latitude, longitude,
+    # country code, admin1 code and population are columns 1, 2, 4, 5, 8,
+    # 10 and 14.
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) < 15:
+                continue
+            for name in dict.fromkeys((cols[1], cols[2])):
+                yield name, cols[4], cols[5], cols[10], "", cols[8], cols[14] or 0
+
+
+def _load() -> Dict[str, List[Place]]:
+    """Load the gazetteer on first use, indexed by normalized city name."""
+    global _places
+    with _load_lock:
+        if _places is None:
+            reader = _read_geonames if GAZETTEER_PATH.endswith(".txt") else _read_csv
+            places: Dict[str, List[Place]] = {}
+            for name, lat, lng, admin1, admin1_name, country, population in reader(GAZETTEER_PATH):
+                places.setdefault(normalize(name), []).append(Place(
+                    float(lat), float(lng), admin1, admin1_name, country, int(population),
+                ))
+            for matches in places.values():
+                matches.sort(key=lambda place: -place.population)
+            _places = places
+    return _places
+
+
+def _matches_region(place: Place, region: str) -> bool:
+    return (
+        region == place.admin1.lower()
+        or region == normalize(place.admin1_name)
+        or COUNTRY_ALIASES.get(region, region.upper()) == place.country
+    )
+
+
+def _find(city: str, regions: List[str]) -> Optional[Place]:
+    """
+    Find a city, preferring the most populous one in the given regions.
+
+    Args:
+        city: Normalized city name.
+        regions: Normalized state, state code or country names that follow
+            the city; places must match one of them if any are given.
+
+    Returns:
+        The place, or None.
+    """
+    matches = _load().get(city)
+    if not matches:
+        return None
+    if not regions:
+        return matches[0]
+    for region in regions:
+        for place in matches:
+            if _matches_region(place, region):
+                return place
+    return None
+
+
+@lru_cache(maxsize=4096)
+def geocode(location: Optional[str]) -> Optional[Tuple[float, float]]:
+    """
+    Look up the coordinates of a free-text location.
+
+    Understands "City, ST", "City, State", "City, Country" (with or
+    without a ZIP code) and "City ST". Without a state or country the
+    most populous city of that name wins.
+
+    Args:
+        location: Location as parsed from a resume or typed by a user.
+
+    Returns:
+        (latitude, longitude), or None if the location is not in the
+        gazetteer.
+    """
+    if not location:
+        return None
+    parts = [normalize(part) for part in _ZIP_RE.sub(" ", location).split(",")]
+    parts = [part for part in parts if part]
+    if not parts:
+        return None
+
+    if len(parts) > 1:
+        place = _find(parts[0], parts[1:])
+    else:
+        # No comma: try the whole string as a city, then split a trailing
+        # state or country off it ("Tempe AZ", "New York New York").
+        words = parts[0].split()
+        place = _find(parts[0], [])
+        for split in range(len(words) - 1, 0, -1):
+            if place is not None:
+                break
+            place = _find(" ".join(words[:split]), [" ".join(words[split:])])
+    return (place.lat, place.lng) if place else None
+
+
+def grid_cell(lat: float, lng: float) -> int:
+    """Id of the grid cell containing a point."""
+    row = min(int((lat + 90) // GRID_DEGREES), int(180 / GRID_DEGREES) - 1)
+    column = int((lng + 180) // GRID_DEGREES) % _GRID_COLUMNS
+    return row * _GRID_COLUMNS + column
+
+
+def cells_within(lat: float, lng: float, miles: float) -> Optional[List[int]]:
+    """
+    List the grid cells a circle overlaps.
+
+    Args:
+        lat: Latitude of the center.
+        lng: Longitude of the center.
+        miles: Radius.
+
+    Returns:
+        Cell ids covering the circle's bounding box, or None if that is more
+        than MAX_QUERY_CELLS (or reaches a pole) and the caller should scan
+        without the prefilter.
+    """
+    lat_span = miles / MILES_PER_DEGREE_LAT
+    south, north = lat - lat_span, lat + lat_span
+    if south <= -90 or north >= 90:
+        return None
+    widest = math.cos(math.radians(max(abs(south), abs(north))))
+    lng_span = miles / (MILES_PER_DEGREE_LAT * widest)
+
+    rows = range(int((south + 90) // GRID_DEGREES), int((north + 90) // GRID_DEGREES) + 1)
+    first = int((lng - lng_span + 180) // GRID_DEGREES)
+    last = int((lng + lng_span + 180) // GRID_DEGREES)
+    if len(rows) * (last - first + 1) > MAX_QUERY_CELLS or last - first + 1 >= _GRID_COLUMNS:
+        return None
+    return [row * _GRID_COLUMNS + column % _GRID_COLUMNS for row in rows for column in range(first, last + 1)]
+
+
+def haversine_miles(lat: float, lng: float, lats: Sequence[float], lngs: Sequence[float]) -> np.ndarray:
+    """
+    Great-circle distances from one point to many.
+
+    Args:
+        lat: Latitude of the origin.
+        lng: Longitude of the origin.
+        lats: Latitudes of the other points.
+        lngs: Longitudes of the other points.
+
+    Returns:
+        Distance in miles to each point.
+    """
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lngs, dtype=np.float64)) - math.radians(lng)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
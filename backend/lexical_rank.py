@@ -0,0 +1,169 @@
+"""
+lexical_rank.py
+
+Offline BM25 relevance of candidates to job requirements, used to decide
+which candidates are worth sending to OpenAI and to give the others a
+local estimate instead.
+
+Each candidate is one document built from its stored resume text plus its
+parsed skills, projects and experience, each counted again with its
+FIELD_WEIGHTS weight, so a requirement term found under SKILLS counts for
+more than the same term in passing.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from project_scores import tokenize
+
+# Standard BM25 term-frequency saturation and length normalization.
+K1 = 1.2
+B = 0.75
+
+# Extra weight for terms in parsed sections, on top of the full text.
+FIELD_WEIGHTS = {"text": 1.0, "skills": 2.0, "projects": 1.0, "experience": 1.0}
+
+
+class BM25Index:
+    """
+    BM25 over a fixed set of candidate documents.
+
+    Built once per request from the job's candidates; scoring a requirement
+    is one column slice of a sparse term-frequency matrix. Scores are
+    normalized to 0–100 against the best score any document could get for
+    that requirement, so they do not depend on who else applied.
+    """
+
+    def __init__(self, documents: Dict[int, Dict[str, object]]) -> None:
+        """
+        Index candidate documents.
+
+        Args:
+            documents: Per candidate id, field name (see FIELD_WEIGHTS) to
+                text or list of strings. Missing fields are skipped.
+        """
+        self.ids: List[int] = list(documents)
+        self._row_of = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        self._vocab: Dict[str, int] = {}
+        rows, columns, weights = [], [], []
+        for row, fields in enumerate(documents.values()):
+            for field, weight in FIELD_WEIGHTS.items():
+                value = fields.get(field)
+                if not value:
+                    continue
+                text = value if isinstance(value, str) else "\n".join(value)
+                term_ids = [self._vocab.setdefault(t, len(self._vocab)) for t in tokenize(text)]
+                columns.extend(term_ids)
+                rows.extend([row] * len(term_ids))
+                weights.extend([weight] * len(term_ids))
+
+        # Duplicate (row, term) entries are summed into weighted counts.
+        self._tf = sparse.csc_matrix(
+            (np.asarray(weights, dtype=np.float64),
+             (np.asarray(rows, dtype=np.int64), np.asarray(columns, dtype=np.int64))),
+            shape=(len(self.ids), len(self._vocab)),
+        )
+        lengths = np.asarray(self._tf.sum(axis=1)).ravel()
+        avg = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+        self._norm = K1 * (1 - B + B * lengths / avg)
+        df = np.diff(self._tf.indptr)
+        n = len(self.ids)
+        self._idf = np.log(1 + (n - df + 0.5) / (df + 0.5))
+        self._unseen_idf = float(np.log(1 + (n + 0.5) / 0.5))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _query(self, requirement: str):
+        terms = list(dict.fromkeys(tokenize(requirement)))
+        columns = [self._vocab[t] for t in terms if t in self._vocab]
+        best = sum(self._idf[self._vocab[t]] if t in self._vocab else self._unseen_idf for t in terms)
+        return terms, columns, best * (K1 + 1)
+
+    def relevance(self, requirement: str) -> np.ndarray:
+        """
+        Score every document against one requirement.
+
+        Args:
+            requirement: Requirement text.
+
+        Returns:
+            0–100 relevance per document, in the order of self.ids. All
+            zeros if the requirement has no searchable words.
+        """
+        _, columns, best = self._query(requirement)
+        if not columns or best <= 0:
+            return np.zeros(len(self.ids))
+        tf = self._tf[:, columns].toarray()
+        saturated = tf * (K1 + 1) / (tf + self._norm[:, None])
+        return saturated @ self._idf[columns] * (100.0 / best)
+
+    def matched_terms(self, doc_id: int, requirement: str) -> List[str]:
+        """
+        List the requirement's words that appear in one document.
+
+        Args:
+            doc_id: Candidate id.
+            requirement: Requirement text.
+
+        Returns:
+            Matching terms, in requirement order.
+        """
+        row = self._row_of[doc_id]
+        terms, _, _ = self._query(requirement)
+        return [t for t in terms if t in self._vocab and self._tf[row, self._vocab[t]] > 0]
+
+
+def candidate_document(candidate) -> Dict[str, object]:
+    """Collect a Candidate's indexable fields for BM25Index."""
+    return {
+        "text": candidate.text,
+        "skills": candidate.skills,
+        "projects": candidate.projects,
+        "experience": candidate.experience,
+    }
+
+
+def select_top(
+    relevance: Dict[int, float],
+    top_k: Optional[int] = None,
+    min_score: Optional[float] = None,
+) -> List[int]:
+    """
+    Pick the candidates to send on for full evaluation.
+
+    Args:
+        relevance: Overall 0–100 local relevance per candidate id.
+        top_k: Keep at most this many, best first; None for no limit.
+        min_score: Keep only candidates at or above this relevance; None
+            for no cutoff.
+
+    Returns:
+        Selected candidate ids, best first (ties by id).
+    """
+    ranked = sorted(relevance, key=lambda doc_id: (-relevance[doc_id], doc_id))
+    if min_score is not None:
+        ranked = [doc_id for doc_id in ranked if relevance[doc_id] >= min_score]
+    if top_k is not None:
+        ranked = ranked[:top_k]
+    return ranked
+
+
+def rank(index: BM25Index, requirements: Iterable[str]) -> Dict[str, Dict[int, float]]:
+    """
+    Score every indexed candidate against every requirement.
+
+    Args:
+        index: The job's candidates.
+        requirements: Requirement texts.
+
+    Returns:
+        Per requirement, 0–100 relevance per candidate id, rounded to two
+        decimals.
+    """
+    return {
+        requirement: dict(zip(index.ids, np.round(index.relevance(requirement), 2).tolist()))
+        for requirement in requirements
+    }
@@ -0,0 +1,195 @@
+"""
+llm_cache.py
+
+Persistent cache of OpenAI results in the llm_cache table.
+
+Entries are keyed by operation, model, prompt-template version,
+requirement text and a hash of the anonymized resume, so a result is only
+reused when the exact same question is asked about the exact same text.
+Bump the caller's prompt version whenever a template changes.
+
+The table holds about LLM_CACHE_MAX_ENTRIES entries (default 50000): every
+LLM_CACHE_EVICT_EVERY stores (default 200) the least recently used entries
+beyond that bound are evicted. A hit only rewrites an entry's last use
+time once it is older than LLM_CACHE_TOUCH_SECONDS (default 3600), so most
+hits need no write. Hits and misses are counted in the llm_cache_requests
+metric.
+
+lookup() and store() block on the database; async code should await
+alookup() and astore(), which run them in a worker thread.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import func
+
+import metrics
+import models
+from database import SessionLocal
+
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+LLM_CACHE_EVICT_EVERY = int(os.getenv("LLM_CACHE_EVICT_EVERY", "200"))
+LLM_CACHE_TOUCH_SECONDS = float(os.getenv("LLM_CACHE_TOUCH_SECONDS", "3600"))
+
+# Stores since the last eviction check, in this process.
+_stores_since_evict = 0
+_evict_lock = threading.Lock()
+
+CACHE_REQUESTS = metrics.Counter(
+    "llm_cache_requests",
+    "LLM cache lookups, by operation and hit or miss.",
+    ["operation", "result"],
+)
+
+
+def resume_hash(text: str) -> str:
+    """Hex SHA-256 of a resume's (anonymized) text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(operation: str, model: str, prompt_version: int, requirement: str, resume_digest: str = "") -> str:
+    """
+    Build the cache key for one result.
+
+    Args:
+        operation: Which call produced it (e.g. "score").
+        model: OpenAI model name.
+        prompt_version: Version of the prompt template.
+        requirement: Requirement text.
+        resume_digest: resume_hash() of the resume, or "" if none is involved.
+
+    Returns:
+        Hex SHA-256 over all the parts.
+    """
+    parts = json.dumps([operation, model, prompt_version, requirement, resume_digest])
+    return hashlib.sha256(parts.encode("utf-8")).hexdigest()
+
+
+def lookup(
+    operation: str,
+    model: str,
+    prompt_version: int,
+    requirements: List[str],
+    resume_digest: str = "",
+) -> Dict[str, str]:
+    """
+    Fetch cached results for several requirements against one resume.
+
+    Args:
+        operation: Which call produced them.
+        model: OpenAI model name.
+        prompt_version: Version of the prompt template.
+        requirements: Requirement texts to look up.
+        resume_digest: resume_hash() of the resume, or "".
+
+    Returns:
+        Cached response per requirement found; misses are left out.
+    """
+    if not requirements:
+        return {}
+    keys = {cache_key(operation, model, prompt_version, r, resume_digest): r for r in requirements}
+    with SessionLocal() as db:
+        rows = (
+            db.query(models.LLMCacheEntry.key, models.LLMCacheEntry.response, models.LLMCacheEntry.last_used_at)
+              .filter(models.LLMCacheEntry.key.in_(keys))
+              .all()
+        )
+        now = datetime.now(timezone.utc)
+        cutoff = now.replace(tzinfo=None) - timedelta(seconds=LLM_CACHE_TOUCH_SECONDS)
+        stale = [row.key for row in rows if row.last_used_at.replace(tzinfo=None) < cutoff]
+        if stale:
+            db.query(models.LLMCacheEntry).filter(
+                models.LLMCacheEntry.key.in_(stale)
+            ).update({"last_used_at": now}, synchronize_session=False)
+            db.commit()
+
+    hits = {keys[row.key]: row.response for row in rows}
+    CACHE_REQUESTS.inc(len(hits), operation=operation, result="hit")
+    CACHE_REQUESTS.inc(len(keys) - len(hits), operation=operation, result="miss")
+    return hits
+
+
+def store(
+    operation: str,
+    model: str,
+    prompt_version: int,
+    responses: Dict[str, str],
+    resume_digest: str = "",
+) -> None:
+    """
+    Save results for several requirements against one resume. Every
+    LLM_CACHE_EVICT_EVERY stores, entries over the size bound are evicted.
+
+    Args:
+        operation: Which call produced them.
+        model: OpenAI model name.
+        prompt_version: Version of the prompt template.
+        responses: Serialized result per requirement text.
+        resume_digest: resume_hash() of the resume, or "".
+    """
+    if not responses:
+        return
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        for requirement, response in responses.items():
+            db.merge(models.LLMCacheEntry(
+                key=cache_key(operation, model, prompt_version, requirement, resume_digest),
+                operation=operation,
+                model=model,
+                prompt_version=prompt_version,
+                requirement=requirement,
+                resume_hash=resume_digest,
+                response=response,
+                created_at=now,
+                last_used_at=now,
+            ))
+        db.commit()
+
+    global _stores_since_evict
+    with _evict_lock:
+        _stores_since_evict += 1
+        due = _stores_since_evict >= LLM_CACHE_EVICT_EVERY
+        if due:
+            _stores_since_evict = 0
+    if due:
+        evict()
+
+
+def evict() -> int:
+    """
+    Delete the least recently used entries beyond LLM_CACHE_MAX_ENTRIES.
+
+    Returns:
+        Number of entries deleted.
+    """
+    with SessionLocal() as db:
+        excess = db.query(func.count(models.LLMCacheEntry.key)).scalar() - LLM_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return 0
+        oldest = (
+            db.query(models.LLMCacheEntry.key)
+              .order_by(models.LLMCacheEntry.last_used_at)
+              .limit(excess)
+              .subquery()
+        )
+        db.query(models.LLMCacheEntry).filter(
+            models.LLMCacheEntry.key.in_(oldest.select())
+        ).delete(synchronize_session=False)
+        db.commit()
+        return excess
+
+
+async def alookup(*args, **kwargs) -> Dict[str, str]:
+    """lookup() in a worker thread, so the event loop is not blocked."""
+    return await asyncio.to_thread(lookup, *args, **kwargs)
+
+
+async def astore(*args, **kwargs) -> None:
+    """store() in a worker thread, so the event loop is not blocked."""
+    await asyncio.to_thread(store, *args, **kwargs)
@@ -1,27 +1,122 @@
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+import asyncio
+import base64
+import gzip
+import hashlib
 import json
-import shutil
+import multiprocessing
+import queue
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 import openai
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, Query, status
+from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from sqlalchemy import and_, event, false, func, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+import metrics
+import migrations
 import models
 from database import SessionLocal, engine
-from resume_parser import parse_resume
+import entrepreneurial
+import geocoder
+import lexical_rank
+import llm_cache
+import ocr_service
+import openai_client
+import search_index
+from resume_parser import IMAGE_EXTENSIONS, PARSER_VERSION, getExt, parse_resume
+from project_scores import UniquenessIndex, variety_scores
 
+try:
+    import orjson
+except ImportError:  # optional; json is used instead
+    orjson = None
+
+
+# Separators allowed between the digits of a phone number, so that
+# "(480) 555-0100", "480.555.0100" and "4805550100" all match.
+_PHONE_SEPARATORS = r"[\s().\-]*"
+
+
+def redaction_pattern(
+    name: Optional[str],
+    email: Optional[str],
+    phone: Optional[str],
+    location: Optional[str],
+) -> Optional[re.Pattern]:
+    """
+    Compiles one alternation matching a candidate's identifying details.
+
+    Covers the email, the full name with any spacing, each part of the name
+    on its own (in Title or UPPER case, to spare ordinary words), the phone
+    number with any separators and an optional +1, and the location with
+    any spacing or commas. Longer alternatives come first so they win.
+
+    Args:
+        name (Optional[str]): Full name.
+        email (Optional[str]): Email address.
+        phone (Optional[str]): Phone number.
+        location (Optional[str]): Location or address.
+
+    Returns:
+        Optional[re.Pattern]: The pattern, or None if there is nothing to redact.
+    """
+    alternatives = []
+    # Characters a match can start with; checked first so most positions
+    # are rejected without trying every alternative.
+    initials = set()
+
+    if email:
+        alternatives.append(f"(?i:{re.escape(email)})")
+        initials.update((email[0].lower(), email[0].upper()))
+
+    name_parts = (name or "").split()
+    if name_parts:
+        alternatives.append("(?i:" + r"\s+".join(map(re.escape, name_parts)) + ")")
+        initials.update((name_parts[0][0].lower(), name_parts[0][0].upper()))
+
+    location_parts = [part for part in re.split(r"[\s,]+", location or "") if part]
+    if location_parts:
+        alternatives.append("(?i:" + r"[\s,]+".join(map(re.escape, location_parts)) + ")")
+        initials.update((location_parts[0][0].lower(), location_parts[0][0].upper()))
+
+    if phone:
+        digits = re.sub(r"\D", "", phone)
+        if len(digits) == 11 and digits.startswith("1"):
+            digits = digits[1:]
+        if len(digits) >= 7:
+            country = r"(?:\+?1" + _PHONE_SEPARATORS + ")?" if len(digits) == 10 else ""
+            alternatives.append(r"(?<!\d)" + country + r"\(?" + _PHONE_SEPARATORS.join(digits) + r"(?!\d)")
+            initials.update(("+", "1", "(", digits[0]))
+        else:
+            alternatives.append(f"(?i:{re.escape(phone)})")
+            initials.update((phone[0].lower(), phone[0].upper()))
+
+    if len(name_parts) > 1:
+        for part in dict.fromkeys(p.strip(".,") for p in name_parts):
+            if len(part) > 1 and part[0].isalpha():
+                forms = dict.fromkeys((part[0].upper() + part[1:].lower(), part.upper()))
+                alternatives.append(r"(?<!\w)(?:" + "|".join(map(re.escape, forms)) + r")(?!\w)")
+                initials.add(part[0].upper())
+
+    if not alternatives:
+        return None
+    lookahead = "(?=[" + "".join(map(re.escape, sorted(initials))) + "])"
+    return re.compile(lookahead + "(?:" + "|".join(alternatives) + ")")
 
-import subprocess
-import tempfile
-import json
 
 def anonymize_text(
     full_text: str,
@@ -33,85 +128,133 @@ def anonymize_text(
     """
     Replaces personally identifiable information in the input text with a standard redaction label.
 
+    All details are replaced in a single pass (see redaction_pattern).
+
     Args:
         full_text (str): The input string to be anonymized.
-        name (Optional[str]): Name to be redacted.
+        name (Optional[str]): Name to be redacted, including first-name-only mentions.
         email (Optional[str]): Email address to be redacted.
-        phone (Optional[str]): Phone number to be redacted.
+        phone (Optional[str]): Phone number to be redacted, however it is formatted.
         location (Optional[str]): Location or address to be redacted.
 
     Returns:
         str: A redacted version of the input string with sensitive information replaced by [REDACTED].
     """
     clean = full_text or ""
-    for value in (name, email, phone, location):
-        if value:
-            clean = re.sub(re.escape(value), "[REDACTED]", clean, flags=re.IGNORECASE)
-    return clean
+    pattern = redaction_pattern(name, email, phone, location)
+    return pattern.sub("[REDACTED]", clean) if pattern else clean
 
-def calc_uniq_score(
-    db: Session,
-    this_candidate_id: int,
-    this_projects: list[str],
-) -> float:
-    """
-    Computes a 0–100 uniqueness score by
-    TF-IDF (natural) + cosine-similarity (compute-cosine-similarity).
+# One incremental TF-IDF corpus of projects per job. Each is filled lazily
+# from the database and kept in step with it by _sync_uniqueness_index.
+uniqueness_indexes: dict[int, UniquenessIndex] = {}
+
+
+def _sync_uniqueness_index(db: Session, job_id: int) -> UniquenessIndex:
     """
-    # Load every other candidate’s projects
-    rows = (
-        db.query(models.Candidate.id, models.Candidate.projects)
-          .filter(models.Candidate.id != this_candidate_id)
-         .all()
-    )
-    other_projects = [r.projects or [] for r in rows]
+    Bring a job's in-memory uniqueness index in line with the candidates table.
+
+    Only candidates the index has not seen are loaded, so after the first
+    call this costs one id-only query plus the rows added since.
 
-    # Dump into a temp JSON
-    payload = {
-        "thisProjects": this_projects,
-        "otherProjects": other_projects,
+    Args:
+        db (Session): Active database session.
+        job_id (int): Job whose candidates form the corpus.
+
+    Returns:
+        UniquenessIndex: The synced index for the job.
+    """
+    index = uniqueness_indexes.setdefault(job_id, UniquenessIndex())
+    db_ids = {
+        row.id
+        for row in db.query(models.Candidate.id).filter(models.Candidate.job_id == job_id)
     }
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as tf:
-        json.dump(payload, tf)
-        tf.flush()
-        tmp_path = tf.name
+    indexed_ids = set(index.ids())
 
-    # Invoke Node helper
-    try:
-        result = subprocess.run(
-            ["node", "utils/calc_uniq.js", tmp_path],
-            capture_output=True,
-            text=True,
-            check=True
+    for stale_id in indexed_ids - db_ids:
+        index.remove(stale_id)
+
+    missing = list(db_ids - indexed_ids)
+    for start in range(0, len(missing), 500):
+        rows = (
+            db.query(models.Candidate.id, models.Candidate.projects)
+              .filter(models.Candidate.id.in_(missing[start:start + 500]))
+              .all()
         )
-        score = float(result.stdout.strip())
-    except Exception as e:
-        score = 0.0
+        for row in rows:
+            index.add(row.id, row.projects or [])
 
-    return score
+    return index
+
+
+def rescore_job_uniqueness(db: Session, job_id: int) -> dict[int, float]:
+    """
+    Recomputes every candidate's 0–100 project uniqueness within a job
+    (TF-IDF + mean cosine similarity to the job's other candidates) and
+    writes all scores back in one bulk UPDATE. Commits the session, along
+    with any pending changes.
 
-def calc_variety_score(this_projects: list[str]) -> float:
+    Args:
+        db (Session): Active database session.
+        job_id (int): Job whose candidates are rescored.
+
+    Returns:
+        dict[int, float]: Mapping of candidate ID to its new uniqueness score.
+    """
+    with metrics.SCORING_SECONDS.time(scorer="uniqueness"):
+        scores = _sync_uniqueness_index(db, job_id).score_all()
+    if scores:
+        db.execute(
+            update(models.Candidate),
+            [
+                {"id": candidate_id, "project_uniqueness": score}
+                for candidate_id, score in scores.items()
+            ],
+        )
+    update_entrepreneurial_scores(db, [job_id])
+    db.commit()
+    return scores
+
+
+def update_entrepreneurial_scores(db: Session, job_ids: List[int]) -> None:
     """
-    Computes a 0–100 variety score by comparing each project
-    to every other in the same candidate via TF-IDF + cosine.
+    Recomputes the entrepreneurial score of the jobs' candidates from their
+    stored uniqueness, variety and keyword scores, in one UPDATE. Does not
+    commit.
+
+    Args:
+        db (Session): Active database session.
+        job_ids (List[int]): Jobs whose candidates are updated.
     """
-    # Dump candidate's own projects into temp JSON
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as tf:
-        json.dump({"projects": this_projects}, tf)
-        tf.flush()
-        tmp_path = tf.name
+    Candidate = models.Candidate
+    db.execute(
+        update(Candidate)
+        .where(Candidate.job_id.in_(job_ids))
+        .values(entrepreneurial_score=func.round(
+            (Candidate.project_uniqueness + Candidate.project_variety + Candidate.keyword_score) / 3, 2
+        ))
+    )
 
-    # Call Node helper
+def calc_variety_scores(projects_per_candidate: list[list[str]]) -> list[float]:
+    """
+    Computes 0–100 variety scores for a batch of candidates by comparing each
+    candidate's projects to one another via TF-IDF + cosine.
+
+    Args:
+        projects_per_candidate (list[list[str]]): Each candidate's project strings.
+
+    Returns:
+        list[float]: Variety score per candidate, in order. All 0.0 if scoring
+        fails; the error is printed with its traceback.
+    """
     try:
-        result = subprocess.run(
-            ["node", "utils/calc_variety.js", tmp_path],
-            capture_output=True, text=True, check=True
-        )
-        score = float(result.stdout.strip())
-    except Exception as e:
-        score = 0.0
+        with metrics.SCORING_SECONDS.time(scorer="variety"):
+            scores = variety_scores(projects_per_candidate)
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        scores = [0.0] * len(projects_per_candidate)
 
-    return round(score, 2)
+    return scores
 
 # Load environment variables from .env and configure OpenAI
 env_path = Path(__file__).resolve().parent / ".env"
@@ -130,8 +273,21 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
     allow_credentials=True,
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+@app.get("/metrics")
+def get_metrics():
+    """
+    Exposes parse-stage, OCR, scoring, DB commit and OpenAI latencies in
+    the Prometheus text format.
+
+    Returns:
+        Response: Plain-text metrics exposition.
+    """
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # expose key‐presence to frontend
 @app.get("/api/config")
 def get_config():
@@ -139,12 +295,17 @@ def get_config():
 
 # Initialize database schema
 models.Base.metadata.create_all(bind=engine)
+migrations.upgrade(engine)
+search_index.install(engine)
 
 # Configure and create upload directory
 BASE_DIR = Path(__file__).resolve().parent
 UPLOAD_DIR = BASE_DIR / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Uploads are streamed to disk (and hashed) in chunks of this many bytes.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 # Mount static files endpoint
 app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
 
@@ -163,6 +324,18 @@ def get_db():
         db.close()
 
 
+@event.listens_for(SessionLocal, "before_commit")
+def _commit_started(session: Session) -> None:
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _commit_finished(session: Session) -> None:
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        metrics.DB_COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+
 def extract_text(path: str) -> str:
     """
     Extracts raw text content from a file using the resume parser.
@@ -182,126 +355,1228 @@ def extract_text(path: str) -> str:
         return ""
 
 
+# Worker processes that parse uploaded resumes; sized to the machine.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 1)))
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Returns the process pool used for resume parsing, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor: Pool with PARSE_WORKERS worker processes.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def submit_parse(path: str, text: Optional[str] = None) -> Future:
+    """
+    Queues one resume on the parse pool. The worker's stage timings are
+    merged into this process's metrics when it finishes.
+
+    Args:
+        path (str): Path of the stored resume.
+        text (Optional[str]): Already-extracted text (e.g. from OCR), if any.
+
+    Returns:
+        Future: Resolves to the parse_resume output.
+    """
+    return metrics.submit_and_merge(get_parse_pool(), parse_resume, path, text)
+
+
+async def parse_uploads(paths: List[str]) -> List[dict]:
+    """
+    Parses a batch of stored resumes in parallel.
+
+    Image resumes are OCR'd by the shared OCR pool first; every resume is
+    then parsed in the parse pool, so no worker loads its own OCR model.
+
+    Args:
+        paths (List[str]): Paths of the stored resume files.
+
+    Returns:
+        List[dict | BaseException]: parse_resume output for each path, in
+        order, or the exception that file failed with.
+    """
+    async def parse_one(path: str) -> dict:
+        text = None
+        if getExt(path) in IMAGE_EXTENSIONS:
+            text = await ocr_service.submit_async(path)
+        return await asyncio.wrap_future(submit_parse(path, text))
+
+    return list(await asyncio.gather(*(parse_one(path) for path in paths), return_exceptions=True))
+
+
+def store_upload(uploaded_file: UploadFile) -> dict:
+    """
+    Streams an upload to disk while computing its SHA-256, and stores it by
+    content as "<sha256><ext>" in the upload directory. Identical files are
+    only kept once.
+
+    Args:
+        uploaded_file (UploadFile): The uploaded resume.
+
+    Returns:
+        dict: filename, size, sha256, stored_name and path of the stored file.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, suffix=".part", delete=False) as tmp:
+        for chunk in iter(lambda: uploaded_file.file.read(UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            tmp.write(chunk)
+            size += len(chunk)
+
+    sha256 = digest.hexdigest()
+    stored_name = f"{sha256}{getExt(uploaded_file.filename).lower()}"
+    destination_path = UPLOAD_DIR / stored_name
+    if destination_path.exists():
+        os.unlink(tmp.name)
+    else:
+        os.replace(tmp.name, destination_path)
+
+    return {
+        "filename": uploaded_file.filename,
+        "size": size,
+        "sha256": sha256,
+        "stored_name": stored_name,
+        "path": str(destination_path),
+    }
+
+
+def register_resume_files(db: Session, stored: List[dict]) -> dict[str, models.ResumeFile]:
+    """
+    Looks up (or adds) the ResumeFile row for each stored upload.
+
+    New rows are inserted with ON CONFLICT DO NOTHING and committed right
+    away, so concurrent uploads of the same file share one row instead of
+    failing on its primary key.
+
+    Args:
+        db (Session): Active database session.
+        stored (List[dict]): store_upload results.
+
+    Returns:
+        dict[str, models.ResumeFile]: Rows keyed by SHA-256. Rows whose
+        parsed field is set can be reused without parsing again.
+    """
+    new_rows = {
+        entry["sha256"]: {
+            "sha256": entry["sha256"],
+            "stored_name": entry["stored_name"],
+            "size": entry["size"],
+            "created_at": datetime.now(timezone.utc),
+        }
+        for entry in stored
+    }
+    if new_rows:
+        db.execute(
+            sqlite_insert(models.ResumeFile)
+            .values(list(new_rows.values()))
+            .on_conflict_do_nothing(index_elements=["sha256"])
+        )
+        db.commit()
+    return {
+        row.sha256: row
+        for row in db.query(models.ResumeFile).filter(models.ResumeFile.sha256.in_(new_rows))
+    }
+
+
+def release_unparsed_files(db: Session, hashes: set[str]) -> None:
+    """
+    Removes the ResumeFile rows and stored files of uploads that failed to
+    parse, unless a candidate or an unfinished ingestion still uses them.
+
+    Args:
+        db (Session): Active database session (not committed).
+        hashes (set[str]): SHA-256 of the files that failed.
+    """
+    if not hashes:
+        return
+    in_use = {
+        row.file_hash
+        for row in db.query(models.Candidate.file_hash).filter(models.Candidate.file_hash.in_(hashes))
+    } | {
+        row.file_hash
+        for row in db.query(models.IngestionFile.file_hash).filter(
+            models.IngestionFile.file_hash.in_(hashes),
+            models.IngestionFile.status.in_(("queued", "running")),
+        )
+    }
+    for resume_file in db.query(models.ResumeFile).filter(models.ResumeFile.sha256.in_(hashes - in_use)):
+        if resume_file.parsed is not None:
+            continue
+        resume_path = UPLOAD_DIR / resume_file.stored_name
+        if resume_path.exists():
+            resume_path.unlink()
+        db.delete(resume_file)
+
+
+def cached_parse(resume_file: Optional[models.ResumeFile]) -> Optional[dict]:
+    """
+    Returns a file's stored parse if it was produced by the current parser.
+
+    Args:
+        resume_file (Optional[models.ResumeFile]): The stored file, if any.
+
+    Returns:
+        Optional[dict]: The cached parse_resume output, or None on a miss.
+    """
+    if resume_file is None or resume_file.parser_version != PARSER_VERSION:
+        return None
+    return resume_file.parsed
+
+
+def remember_parse(resume_file: models.ResumeFile, parsed_data: dict) -> None:
+    """
+    Stores a file's parse_resume output, tagged with the current parser version.
+
+    Args:
+        resume_file (models.ResumeFile): The stored file.
+        parsed_data (dict): Output of parse_resume for the file.
+    """
+    resume_file.parsed = parsed_data
+    resume_file.parser_version = PARSER_VERSION
+
+
+def coordinate_fields(location: Optional[str]) -> dict:
+    """
+    Geocodes a location with the offline gazetteer.
+
+    Args:
+        location (Optional[str]): Parsed location (e.g., "Tempe, AZ").
+
+    Returns:
+        dict: latitude, longitude and geo_cell column values (all None if
+              the location is not in the gazetteer).
+    """
+    coords = geocoder.geocode(location)
+    if coords is None:
+        return {"latitude": None, "longitude": None, "geo_cell": None}
+    return {"latitude": coords[0], "longitude": coords[1], "geo_cell": geocoder.grid_cell(*coords)}
+
+
+def keyword_fields(parsed_data: dict) -> dict:
+    """
+    Counts entrepreneurial keywords in a parsed resume.
+
+    Args:
+        parsed_data (dict): Output of parse_resume.
+
+    Returns:
+        dict: keyword_hits, keyword_score and keywords_version column values.
+    """
+    hits = entrepreneurial.MATCHER.count(entrepreneurial.signal_text(
+        parsed_data["text"],
+        parsed_data.get("projects"),
+        parsed_data.get("skills"),
+        parsed_data.get("experience"),
+        parsed_data["degrees_earned"],
+    ))
+    return {
+        "keyword_hits": hits,
+        "keyword_score": entrepreneurial.keyword_score(hits),
+        "keywords_version": entrepreneurial.KEYWORDS_VERSION,
+    }
+
+
+def parsed_fields(parsed_data: dict) -> dict:
+    """
+    Maps parse_resume output onto Candidate column values.
+
+    Args:
+        parsed_data (dict): Output of parse_resume.
+
+    Returns:
+        dict: Keyword arguments for the parsed Candidate columns.
+    """
+    return {
+        "text": parsed_data["text"],
+        "anonymized_text": anonymize_text(
+            parsed_data["text"],
+            parsed_data["name"],
+            parsed_data.get("email"),
+            parsed_data.get("phone"),
+            parsed_data["location"],
+        ),
+        "name": parsed_data["name"],
+        "location": parsed_data["location"],
+        **coordinate_fields(parsed_data["location"]),
+        "email": parsed_data.get("email"),
+        "phone": parsed_data.get("phone"),
+        "gpa": parsed_data["gpa"],
+        "degrees_earned": parsed_data["degrees_earned"],
+        "degrees_in_progress": parsed_data["degrees_in_progress"],
+        "projects": parsed_data.get("projects", []),
+        "experience": parsed_data.get("experience", []),
+        "skills": parsed_data.get("skills", []),
+        **keyword_fields(parsed_data),
+    }
+
+
+def build_candidate(
+    meta: dict,
+    parsed_data: dict,
+    job_id: int,
+    project_variety: float,
+    upload_date: datetime,
+    file_hash: Optional[str] = None,
+) -> models.Candidate:
+    """
+    Builds an unsaved Candidate from parse_resume output.
+
+    Args:
+        meta (dict): File metadata (filename and size).
+        parsed_data (dict): Output of parse_resume for the file.
+        job_id (int): Job the candidate applies to.
+        project_variety (float): Precomputed project variety score.
+        upload_date (datetime): Upload timestamp to record.
+        file_hash (Optional[str]): SHA-256 of the stored resume file.
+
+    Returns:
+        models.Candidate: The new candidate; uniqueness is filled in by a job rescore.
+    """
+    return models.Candidate(
+        filename=meta["filename"],
+        file_hash=file_hash,
+        parsed_data=json.dumps(meta),
+        **parsed_fields(parsed_data),
+        scores={},
+        upload_date=upload_date,
+        job_id=job_id,
+        project_uniqueness=0,
+        project_variety=project_variety
+    )
+
+
 @app.post("/api/upload")
 async def upload_resumes(
+    response: Response,
     files: List[UploadFile] = File(...),
     job_id: int = Query(..., alias="jobId"),
+    background: bool = Query(False),
     db: Session = Depends(get_db)
 ):
     """
     Uploads resume files, parses them, stores extracted data in the database,
     and returns metadata for each successfully saved candidate.
 
+    Files are stored by content hash, and a file that has been uploaded
+    before reuses its stored parse (if made by the current parser version)
+    instead of being parsed again.
+
+    With background=true the files are only stored and queued; the response
+    (202 Accepted) carries an ingestion ID to poll at /api/ingestions/{id}.
+
     Args:
+        response (Response): Outgoing response, used to set 202 in background mode.
         files (List[UploadFile]): List of uploaded resume files.
         job_id (int): Identifier of the job to associate candidates with.
+        background (bool): Parse and score in background workers instead of in the request.
+        db (Session): Active database session provided by dependency injection.
+
+    Returns:
+        List[dict] | dict: Per file, in upload order, the new candidate ID and file
+        metadata, or the file metadata and an "error" if the file could not be
+        parsed; or, in background mode, the ingestion ID and file metadata.
+    """
+    stored = [store_upload(uploaded_file) for uploaded_file in files]
+    file_metadata = [{"filename": entry["filename"], "size": entry["size"]} for entry in stored]
+    resume_files = register_resume_files(db, stored)
+
+    if background:
+        ingestion = models.IngestionJob(
+            job_id=job_id,
+            status="queued",
+            files=[
+                models.IngestionFile(
+                    filename=entry["filename"],
+                    path=entry["path"],
+                    file_hash=entry["sha256"],
+                    size=entry["size"],
+                )
+                for entry in stored
+            ],
+        )
+        db.add(ingestion)
+        db.commit()
+        ingestion_queue.put(ingestion.id)
+
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"ingestion_id": ingestion.id, "files": file_metadata}
+
+    # Parse each distinct file once; files seen before reuse their stored parse.
+    to_parse = {
+        entry["sha256"]: entry["path"]
+        for entry in stored
+        if cached_parse(resume_files[entry["sha256"]]) is None
+    }
+    errors = {}
+    for sha256, parsed_data in zip(to_parse, await parse_uploads(list(to_parse.values()))):
+        if isinstance(parsed_data, BaseException):
+            errors[sha256] = f"{type(parsed_data).__name__}: {parsed_data}"
+        else:
+            remember_parse(resume_files[sha256], parsed_data)
+
+    ok = [i for i, entry in enumerate(stored) if entry["sha256"] not in errors]
+    parsed = [resume_files[stored[i]["sha256"]].parsed for i in ok]
+    variety = calc_variety_scores([p.get("projects", []) for p in parsed])
+    upload_date = datetime.now(timezone.utc)
+
+    candidates = [
+        build_candidate(file_metadata[i], parsed_data, job_id, variety_score, upload_date, stored[i]["sha256"])
+        for i, parsed_data, variety_score in zip(ok, parsed, variety)
+    ]
+
+    db.add_all(candidates)
+    db.flush()
+    results = [
+        {**meta, "error": errors[entry["sha256"]]} if entry["sha256"] in errors else None
+        for meta, entry in zip(file_metadata, stored)
+    ]
+    for i, candidate in zip(ok, candidates):
+        results[i] = {"id": candidate.id, **file_metadata[i]}
+    release_unparsed_files(db, set(errors))
+
+    # Every candidate's uniqueness depends on the whole job, so rescore it
+    # once for the batch; this also commits the new candidates.
+    rescore_job_uniqueness(db, job_id)
+
+    return results
+
+
+# Local queue of IngestionJob IDs waiting for the background worker. Job
+# state lives in the database, so the queue is rebuilt on startup.
+ingestion_queue: "queue.Queue[int]" = queue.Queue()
+
+
+def run_ingestion(ingestion_id: int) -> None:
+    """
+    Parses and scores every unfinished file of a background ingestion.
+
+    Files whose content was parsed before reuse that parse; the rest are
+    parsed concurrently in the parse pool (images are OCR'd by the OCR pool
+    first). Whatever has finished is written, together with its
+    per-file status, about once a second, so progress is visible while the
+    batch runs and a restart resumes from the files still outstanding.
+
+    Args:
+        ingestion_id (int): The IngestionJob to process.
+    """
+    db = SessionLocal()
+    try:
+        ingestion = db.query(models.IngestionJob).get(ingestion_id)
+        if not ingestion or ingestion.status in ("completed", "failed"):
+            return
+
+        now = datetime.now(timezone.utc)
+        ingestion.status = "running"
+        ingestion.started_at = ingestion.started_at or now
+        pending = [f for f in ingestion.files if f.status in ("queued", "running")]
+        for file_row in pending:
+            file_row.status = "running"
+            file_row.started_at = now
+        db.commit()
+
+        resume_files = {
+            row.sha256: row
+            for row in db.query(models.ResumeFile).filter(
+                models.ResumeFile.sha256.in_({f.file_hash for f in pending if f.file_hash})
+            )
+        }
+
+        # Files seen before reuse their stored parse; the rest are grouped by
+        # content so each distinct file is parsed once.
+        finished, groups = [], {}
+        for file_row in pending:
+            parsed_data = cached_parse(resume_files.get(file_row.file_hash))
+            if parsed_data is not None:
+                finished.append((file_row, parsed_data))
+            else:
+                groups.setdefault(file_row.file_hash or file_row.path, []).append(file_row)
+
+        in_flight = {}
+        for rows in groups.values():
+            path = rows[0].path
+            if getExt(path) in IMAGE_EXTENSIONS:
+                in_flight[ocr_service.submit(path)] = (rows, "ocr")
+            else:
+                in_flight[submit_parse(path)] = (rows, "parse")
+
+        while in_flight or finished:
+            done = []
+            if in_flight:
+                done, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+            for future in done:
+                rows, stage = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    for file_row in rows:
+                        file_row.status = "failed"
+                        file_row.error = f"{type(e).__name__}: {e}"
+                        file_row.finished_at = datetime.now(timezone.utc)
+                    continue
+                if stage == "ocr":
+                    in_flight[submit_parse(rows[0].path, result)] = (rows, "parse")
+                    continue
+                if rows[0].file_hash in resume_files:
+                    remember_parse(resume_files[rows[0].file_hash], result)
+                finished.extend((file_row, result) for file_row in rows)
+
+            if finished:
+                variety = calc_variety_scores([p.get("projects", []) for _, p in finished])
+                upload_date = datetime.now(timezone.utc)
+                candidates = [
+                    build_candidate(
+                        {"filename": file_row.filename, "size": file_row.size},
+                        parsed_data, ingestion.job_id, variety_score, upload_date,
+                        file_row.file_hash,
+                    )
+                    for (file_row, parsed_data), variety_score in zip(finished, variety)
+                ]
+                db.add_all(candidates)
+                db.flush()
+                for (file_row, _), candidate in zip(finished, candidates):
+                    file_row.status = "done"
+                    file_row.candidate_id = candidate.id
+                    file_row.finished_at = upload_date
+                finished = []
+            db.commit()
+
+        release_unparsed_files(db, {f.file_hash for f in pending if f.status == "failed" and f.file_hash})
+        ingestion.status = "completed"
+        ingestion.finished_at = datetime.now(timezone.utc)
+        # Commits the final status together with the refreshed scores.
+        rescore_job_uniqueness(db, ingestion.job_id)
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+        ingestion = db.query(models.IngestionJob).get(ingestion_id)
+        if ingestion:
+            ingestion.status = "failed"
+            ingestion.error = f"{type(e).__name__}: {e}"
+            ingestion.finished_at = datetime.now(timezone.utc)
+            db.commit()
+    finally:
+        db.close()
+
+
+def ingestion_worker() -> None:
+    """
+    Background thread loop: runs queued ingestions one at a time.
+    """
+    while True:
+        run_ingestion(ingestion_queue.get())
+        ingestion_queue.task_done()
+
+
+@app.on_event("startup")
+def start_ingestion_worker():
+    """
+    Starts the ingestion worker and re-queues batches interrupted by a restart.
+    """
+    db = SessionLocal()
+    try:
+        unfinished = (
+            db.query(models.IngestionJob.id)
+              .filter(models.IngestionJob.status.in_(("queued", "running")))
+              .order_by(models.IngestionJob.id)
+              .all()
+        )
+    finally:
+        db.close()
+
+    for row in unfinished:
+        ingestion_queue.put(row.id)
+
+    threading.Thread(target=ingestion_worker, name="ingestion-worker", daemon=True).start()
+
+
+# Background re-parse of stored resumes after PARSER_VERSION changes. Files
+# are parsed one at a time in small batches, each written in one short
+# transaction and followed by a pause, so uploads are never starved.
+REPARSE_BATCH_SIZE = int(os.getenv("REPARSE_BATCH_SIZE", "10"))
+REPARSE_PAUSE_SECONDS = float(os.getenv("REPARSE_PAUSE_SECONDS", "2"))
+
+
+def parse_stored_file(path: str) -> dict:
+    """
+    Parses one stored resume through the OCR and parse pools.
+
+    Args:
+        path (str): Path of the stored file.
+
+    Returns:
+        dict: parse_resume output for the file.
+    """
+    text = ocr_service.ocr_image(path) if getExt(path) in IMAGE_EXTENSIONS else None
+    return submit_parse(path, text).result()
+
+
+def reparse_stale_batch(db: Session, skip: set[str]) -> int:
+    """
+    Re-parses one batch of stored files whose parse predates PARSER_VERSION,
+    refreshes the candidates created from them, and rescores affected jobs.
+
+    Args:
+        db (Session): Active database session.
+        skip (set[str]): Hashes that failed to re-parse; updated in place so
+                         they are not retried in this process.
+
+    Returns:
+        int: Number of stale files examined (0 when nothing is left to do).
+    """
+    stale = (
+        db.query(models.ResumeFile)
+          .filter(or_(
+              models.ResumeFile.parser_version.is_(None),
+              models.ResumeFile.parser_version != PARSER_VERSION,
+          ))
+          .filter(models.ResumeFile.sha256.notin_(skip))
+          .order_by(models.ResumeFile.created_at)
+          .limit(REPARSE_BATCH_SIZE)
+          .all()
+    )
+    if not stale:
+        return 0
+
+    refreshed = {}
+    for resume_file in stale:
+        try:
+            refreshed[resume_file.sha256] = parse_stored_file(
+                str(UPLOAD_DIR / resume_file.stored_name)
+            )
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            skip.add(resume_file.sha256)
+            continue
+        remember_parse(resume_file, refreshed[resume_file.sha256])
+
+    candidates = (
+        db.query(models.Candidate.id, models.Candidate.job_id, models.Candidate.file_hash)
+          .filter(models.Candidate.file_hash.in_(refreshed))
+          .all()
+    )
+    variety = calc_variety_scores(
+        [refreshed[c.file_hash].get("projects", []) for c in candidates]
+    )
+    if candidates:
+        db.execute(
+            update(models.Candidate),
+            [
+                {"id": c.id, **parsed_fields(refreshed[c.file_hash]), "project_variety": v}
+                for c, v in zip(candidates, variety)
+            ],
+        )
+    db.commit()
+
+    # Projects may have changed, so rebuild those jobs' uniqueness corpora.
+    for job_id in {c.job_id for c in candidates}:
+        uniqueness_indexes.pop(job_id, None)
+        rescore_job_uniqueness(db, job_id)
+
+    return len(stale)
+
+
+def reparse_worker() -> None:
+    """
+    Background thread loop: re-parses stale stored files until none are left.
+    """
+    skip: set[str] = set()
+    while True:
+        db = SessionLocal()
+        try:
+            examined = reparse_stale_batch(db, skip)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            examined = 0
+        finally:
+            db.close()
+
+        if not examined:
+            return
+        time.sleep(REPARSE_PAUSE_SECONDS)
+
+
+@app.on_event("startup")
+def start_reparse_worker():
+    """
+    Starts the background re-parse of resumes parsed by an older parser version.
+    """
+    threading.Thread(target=reparse_worker, name="reparse-worker", daemon=True).start()
+
+
+@app.on_event("startup")
+def geocode_existing_candidates():
+    """
+    Fills in coordinates for candidates stored before geocoding at ingest.
+    """
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(models.Candidate.id, models.Candidate.location)
+              .filter(models.Candidate.location.isnot(None),
+                      models.Candidate.latitude.is_(None))
+              .all()
+        )
+        updates = []
+        for row in rows:
+            fields = coordinate_fields(row.location)
+            if fields["latitude"] is not None:
+                updates.append({"id": row.id, **fields})
+        if updates:
+            db.execute(update(models.Candidate), updates)
+            db.commit()
+    finally:
+        db.close()
+
+
+# Background recount of entrepreneurial keywords after the keyword list
+# changes, in batches of this many candidates per transaction.
+KEYWORD_RESCORE_BATCH_SIZE = int(os.getenv("KEYWORD_RESCORE_BATCH_SIZE", "500"))
+
+
+def rescore_keywords_batch(db: Session) -> int:
+    """
+    Recounts keywords for one batch of candidates counted with another
+    keyword list, and updates their jobs' entrepreneurial scores.
+
+    Args:
+        db (Session): Active database session.
+
+    Returns:
+        int: Number of candidates rescored; 0 once none are stale.
+    """
+    Candidate = models.Candidate
+    rows = (
+        db.query(Candidate.id, Candidate.job_id, Candidate.text, Candidate.projects,
+                 Candidate.skills, Candidate.experience, Candidate.degrees_earned)
+          .filter(or_(
+              Candidate.keywords_version.is_(None),
+              Candidate.keywords_version != entrepreneurial.KEYWORDS_VERSION,
+          ))
+          .order_by(Candidate.id)
+          .limit(KEYWORD_RESCORE_BATCH_SIZE)
+          .all()
+    )
+    if not rows:
+        return 0
+
+    with metrics.SCORING_SECONDS.time(scorer="keywords"):
+        updates = []
+        for row in rows:
+            hits = entrepreneurial.MATCHER.count(entrepreneurial.signal_text(
+                row.text, row.projects, row.skills, row.experience, row.degrees_earned,
+            ))
+            updates.append({
+                "id": row.id,
+                "keyword_hits": hits,
+                "keyword_score": entrepreneurial.keyword_score(hits),
+                "keywords_version": entrepreneurial.KEYWORDS_VERSION,
+            })
+    db.execute(update(Candidate), updates)
+    update_entrepreneurial_scores(db, list({row.job_id for row in rows}))
+    db.commit()
+    return len(rows)
+
+
+def keyword_rescore_worker() -> None:
+    """
+    Background thread: rescores stale candidates until none are left.
+    """
+    while True:
+        db = SessionLocal()
+        try:
+            rescored = rescore_keywords_batch(db)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            rescored = 0
+        finally:
+            db.close()
+        if not rescored:
+            return
+
+
+@app.on_event("startup")
+def start_keyword_rescore_worker():
+    """
+    Starts the background recount of entrepreneurial keywords for candidates
+    counted with a different keyword list.
+    """
+    threading.Thread(target=keyword_rescore_worker, name="keyword-rescore-worker", daemon=True).start()
+
+
+@app.get("/api/ingestions/{ingestion_id}")
+def get_ingestion(ingestion_id: int, db: Session = Depends(get_db)):
+    """
+    Reports the progress of a background ingestion, file by file.
+
+    Args:
+        ingestion_id (int): The ingestion ID returned by /api/upload?background=true.
+        db (Session): Active database session provided by dependency injection.
+
+    Returns:
+        dict: Overall status and counts, plus status, error, candidate ID and
+              parse duration for each file.
+
+    Raises:
+        HTTPException: If the ingestion does not exist.
+    """
+    ingestion = db.query(models.IngestionJob).get(ingestion_id)
+    if not ingestion:
+        raise HTTPException(status_code=404, detail="Ingestion not found")
+
+    def duration_ms(started, finished):
+        if not started or not finished:
+            return None
+        return round((finished - started).total_seconds() * 1000)
+
+    files = [
+        {
+            "filename": file_row.filename,
+            "size": file_row.size,
+            "status": file_row.status,
+            "error": file_row.error,
+            "candidate_id": file_row.candidate_id,
+            "duration_ms": duration_ms(file_row.started_at, file_row.finished_at),
+        }
+        for file_row in ingestion.files
+    ]
+
+    return {
+        "id": ingestion.id,
+        "job_id": ingestion.job_id,
+        "status": ingestion.status,
+        "error": ingestion.error,
+        "total": len(files),
+        "done": sum(f["status"] == "done" for f in files),
+        "failed": sum(f["status"] == "failed" for f in files),
+        "created_at": ingestion.created_at.isoformat(),
+        "started_at": ingestion.started_at.isoformat() if ingestion.started_at else None,
+        "finished_at": ingestion.finished_at.isoformat() if ingestion.finished_at else None,
+        "duration_ms": duration_ms(ingestion.started_at, ingestion.finished_at),
+        "files": files,
+    }
+
+
+
+
+# Fields /api/candidates can return, in response order, and the column each
+# is read from. "id" is always included.
+CANDIDATE_FIELDS = {
+    "filename": models.Candidate.filename,
+    "size": models.Candidate.parsed_data,
+    "text": models.Candidate.text,
+    "name": models.Candidate.name,
+    "location": models.Candidate.location,
+    "latitude": models.Candidate.latitude,
+    "longitude": models.Candidate.longitude,
+    "email": models.Candidate.email,
+    "phone": models.Candidate.phone,
+    "gpa": models.Candidate.gpa,
+    "degrees_earned": models.Candidate.degrees_earned,
+    "degrees_in_progress": models.Candidate.degrees_in_progress,
+    "projects": models.Candidate.projects,
+    "experience": models.Candidate.experience,
+    "scores": models.Candidate.scores,
+    "local_scores": models.Candidate.local_scores,
+    "skills": models.Candidate.skills,
+    "upload_date": models.Candidate.upload_date,
+    "project_uniqueness": models.Candidate.project_uniqueness,
+    "project_variety": models.Candidate.project_variety,
+    "keyword_hits": models.Candidate.keyword_hits,
+    "keyword_score": models.Candidate.keyword_score,
+    "entrepreneurial_score": models.Candidate.entrepreneurial_score,
+}
+
+# The full resume text is by far the largest field, so it is only sent on request.
+DEFAULT_CANDIDATE_FIELDS = [field for field in CANDIDATE_FIELDS if field != "text"]
+
+# Responses at least this large are gzipped for clients that accept it.
+GZIP_MIN_BYTES = 1024
+
+
+def dump_json(payload) -> bytes:
+    """
+    Serializes a response payload, with orjson when it is installed.
+
+    Args:
+        payload: JSON-compatible data.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def conditional_json_response(request: Request, payload, headers: Optional[dict] = None) -> Response:
+    """
+    Builds a JSON response with an ETag, answering 304 when the client's
+    If-None-Match already has it and gzipping large bodies.
+
+    Args:
+        request (Request): The incoming request, for its conditional and encoding headers.
+        payload: JSON-compatible response data.
+        headers (Optional[dict]): Extra response headers.
+
+    Returns:
+        Response: 200 with the (possibly gzipped) body, or an empty 304.
+    """
+    body = dump_json(payload)
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_etags or "*" in client_etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if len(body) >= GZIP_MIN_BYTES and "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def select_candidate_fields(fields: Optional[List[str]]) -> List[str]:
+    """
+    Validates requested field names against CANDIDATE_FIELDS.
+
+    Args:
+        fields (Optional[List[str]]): Requested names, or None for the defaults.
+
+    Returns:
+        List[str]: The fields to return, in response order ("id" is implied).
+
+    Raises:
+        HTTPException: If a name is not in CANDIDATE_FIELDS.
+    """
+    if fields is None:
+        return DEFAULT_CANDIDATE_FIELDS
+    requested = {field.strip() for field in fields if field.strip()} - {"id"}
+    unknown = requested - set(CANDIDATE_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [field for field in CANDIDATE_FIELDS if field in requested]
+
+
+def candidate_row_fields(row, fields: List[str]) -> dict:
+    """
+    Converts a projected candidate row into its response dictionary.
+
+    Args:
+        row: Row holding the id and the columns behind fields.
+        fields (List[str]): Requested CANDIDATE_FIELDS names, in response order.
+
+    Returns:
+        dict: The candidate's id and requested fields.
+    """
+    result = {"id": row.id}
+    for field in fields:
+        value = getattr(row, CANDIDATE_FIELDS[field].key)
+        if field == "size":
+            value = json.loads(value).get("size") if value else None
+        elif field == "upload_date":
+            value = value.isoformat()
+        result[field] = value
+    return result
+
+
+@app.get("/api/candidates")
+def list_candidates(
+    request: Request,
+    job_id: Optional[int] = Query(None, alias="jobId"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (default: all except text)",
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (default: everything)"),
+    after: Optional[int] = Query(None, description="Return candidates with ids above this cursor"),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieves a list of candidates, optionally filtered by job ID.
+
+    Candidates are ordered by id and paged by keyset: pass the
+    X-Next-Cursor header of one page as ?after= to get the next; the
+    header is absent on the last page. Only the requested fields are read
+    from the database. The response carries an ETag, and a request whose
+    If-None-Match matches it gets 304 Not Modified.
+
+    Args:
+        request (Request): The incoming request, for conditional and encoding headers.
+        job_id (Optional[int]): If provided, filters candidates by associated job ID.
+        fields (Optional[str]): Comma-separated names from CANDIDATE_FIELDS.
+        limit (Optional[int]): Maximum number of candidates to return.
+        after (Optional[int]): Only return candidates with a greater id.
         db (Session): Active database session provided by dependency injection.
 
     Returns:
-        List[dict]: List of metadata dictionaries for each processed candidate, including candidate ID and file metadata.
+        Response: JSON list of dictionaries containing candidate details.
+
+    Raises:
+        HTTPException: If fields names an unknown field.
+    """
+    selected = select_candidate_fields(fields.split(",") if fields is not None else None)
+    columns = list(dict.fromkeys([models.Candidate.id] + [CANDIDATE_FIELDS[f] for f in selected]))
+    query = db.query(*columns)
+
+    if job_id is not None:
+        query = query.filter(models.Candidate.job_id == job_id)
+    if after is not None:
+        query = query.filter(models.Candidate.id > after)
+    query = query.order_by(models.Candidate.id)
+
+    # Fetch one extra row to learn whether there is a next page.
+    rows = query.limit(limit + 1).all() if limit is not None else query.all()
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = str(rows[-1].id)
+
+    return conditional_json_response(
+        request,
+        [candidate_row_fields(row, selected) for row in rows],
+        headers,
+    )
+
+
+# Columns /api/candidates/query can sort by; "score:<nickname>" sorts by a
+# requirement score instead.
+SORTABLE_CANDIDATE_FIELDS = {
+    "gpa": models.Candidate.gpa,
+    "upload_date": models.Candidate.upload_date,
+    "project_uniqueness": models.Candidate.project_uniqueness,
+    "project_variety": models.Candidate.project_variety,
+    "keyword_hits": models.Candidate.keyword_hits,
+    "entrepreneurial_score": models.Candidate.entrepreneurial_score,
+    "name": models.Candidate.name,
+}
+
+
+class SortKey(BaseModel):
+    field: str
+    direction: Literal["asc", "desc"] = "desc"
+
+
+class CandidateQuery(BaseModel):
+    job_id: int
+    min_gpa: Optional[float] = None
+    max_gpa: Optional[float] = None
+    gpa_listed: bool = False
+    uploaded_after: Optional[datetime] = None
+    uploaded_before: Optional[datetime] = None
+    min_uniqueness: Optional[float] = None
+    max_uniqueness: Optional[float] = None
+    min_variety: Optional[float] = None
+    max_variety: Optional[float] = None
+    min_entrepreneurial: Optional[float] = None
+    max_entrepreneurial: Optional[float] = None
+    min_keyword_hits: Optional[int] = None
+    search: Optional[str] = None
+    search_mode: Literal["any", "all"] = "any"
+    within_miles: Optional[float] = Field(None, gt=0)
+    near: Optional[str] = None
+    near_lat: Optional[float] = Field(None, ge=-90, le=90)
+    near_lng: Optional[float] = Field(None, ge=-180, le=180)
+    sort: List[SortKey] = []
+    fields: Optional[List[str]] = None
+    limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = None
+
+
+def sort_expression(field: str):
     """
-    saved_candidates = []
+    Maps a sort field name onto the SQL expression to order by.
+
+    Args:
+        field (str): A SORTABLE_CANDIDATE_FIELDS name, or "score:<nickname>".
 
-    for uploaded_file in files:
-        destination_path = UPLOAD_DIR / uploaded_file.filename
+    Returns:
+        The column, or the requirement's OpenAI score, falling back to its
+        local estimate.
 
-        with open(destination_path, "wb") as file_out:
-            shutil.copyfileobj(uploaded_file.file, file_out)
+    Raises:
+        HTTPException: If the field cannot be sorted by.
+    """
+    if field.startswith("score:"):
+        nickname = field[len("score:"):]
+        if not nickname or '"' in nickname:
+            raise HTTPException(status_code=400, detail=f"Invalid score sort: {field}")
+        path = f'$."{nickname}"'
+        return func.coalesce(
+            func.json_extract(models.Candidate.scores, path),
+            func.json_extract(models.Candidate.local_scores, path),
+        )
+    if field not in SORTABLE_CANDIDATE_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Cannot sort by {field}")
+    return SORTABLE_CANDIDATE_FIELDS[field]
 
-        parsed_data = parse_resume(str(destination_path))
-        file_metadata = {
-            "filename": uploaded_file.filename,
-            "size": os.path.getsize(destination_path)
-        }
 
-        candidate = models.Candidate(
-            filename=uploaded_file.filename,
-            parsed_data=json.dumps(file_metadata),
-            text=parsed_data["text"],
-            name=parsed_data["name"],
-            location=parsed_data["location"],
-            email=parsed_data.get("email"),
-            phone=parsed_data.get("phone"),
-            gpa=parsed_data["gpa"],
-            degrees_earned=parsed_data["degrees_earned"],
-            degrees_in_progress=parsed_data["degrees_in_progress"],
-            projects=parsed_data.get("projects", []),
-            experience=parsed_data.get("experience", []),
-            skills=parsed_data.get("skills", []),
-            scores={},
-            upload_date=datetime.now(timezone.utc),
-            job_id=job_id,
-            project_uniqueness=0,
-            project_variety=0
-        )
+def as_utc(value: datetime) -> datetime:
+    """Converts a datetime to naive UTC, as upload dates are stored (naive input is taken as UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.replace(tzinfo=None)
 
-        db.add(candidate)
-        db.commit()
-        db.refresh(candidate)
 
-        # now that candidate.id exists, recompute uniqueness
-        uniq = calc_uniq_score(db, candidate.id, candidate.projects)
-        candidate.project_uniqueness = uniq
-        db.commit()
-        db.refresh(candidate)
+def keyset_after(keys: list, values: list):
+    """
+    Builds the condition for rows strictly after a cursor in a multi-key ordering.
 
-        # Compute variety across this candidate's own projects
-        variety = calc_variety_score(candidate.projects or [])
-        candidate.project_variety = variety
-        db.commit()
-        db.refresh(candidate)
+    NULLs sort as the smallest values, as SQLite orders them: first when
+    ascending, last when descending.
 
-        saved_candidates.append({"id": candidate.id, **file_metadata})
+    Args:
+        keys (list): (expression, "asc" or "desc") pairs, ending with a unique key.
+        values (list): The cursor row's value for each key.
 
-    return saved_candidates
+    Returns:
+        An OR of "equal on the earlier keys and after on this one" terms.
+    """
+    after_terms, equal_so_far = [], []
+    for (expression, direction), value in zip(keys, values):
+        if value is None:
+            after = expression.isnot(None) if direction == "asc" else None
+            equal = expression.is_(None)
+        else:
+            after = expression > value if direction == "asc" else or_(expression < value, expression.is_(None))
+            equal = expression == value
+        if after is not None:
+            after_terms.append(and_(*equal_so_far, after))
+        equal_so_far.append(equal)
+    return or_(*after_terms)
+
+
+def encode_cursor(values: list) -> str:
+    """Packs a row's sort values into an opaque, URL-safe cursor."""
+    plain = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(plain).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, keys: list) -> list:
+    """
+    Unpacks a cursor made by encode_cursor for the same sort keys.
 
-from fastapi import Response
+    Raises:
+        HTTPException: If the cursor is malformed or was made for other keys.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return [
+        datetime.fromisoformat(value)
+        if expression is models.Candidate.upload_date and value is not None
+        else value
+        for (expression, _), value in zip(keys, values)
+    ]
 
 
-@app.get("/api/candidates")
-def list_candidates(
-    job_id: Optional[int] = Query(None, alias="jobId"),
+@app.post("/api/candidates/query")
+def query_candidates(
+    body: CandidateQuery,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
-    Retrieves a list of candidates, optionally filtered by job ID.
+    Filters and sorts a job's candidates in SQL, one page at a time.
+
+    GPA bounds keep candidates without a GPA unless gpa_listed is set, as
+    the candidates page always has. Sorting follows body.sort, then id;
+    requirement scores sort with "score:<nickname>". Candidates without
+    the sort value come last when sorting descending and first when
+    ascending. within_miles keeps candidates within that radius of near
+    (a place) or of near_lat/near_lng. Pass next_cursor back as cursor,
+    with the same filters and sort, for the following page.
 
     Args:
-        job_id (Optional[int]): If provided, filters candidates by associated job ID.
+        body (CandidateQuery): Filters, sort keys, fields, page size and cursor.
+        request (Request): The incoming request, for conditional and encoding headers.
         db (Session): Active database session provided by dependency injection.
 
     Returns:
-        List[dict]: List of dictionaries containing candidate details.
-    """
-    query = db.query(models.Candidate)
-
-    if job_id is not None:
-        query = query.filter(models.Candidate.job_id == job_id)
+        Response: JSON {"candidates": [...], "total": matches, "next_cursor": str | None}.
 
-    candidates = query.all()
-
-    return [
-        {
-            "id": candidate.id,
-            **json.loads(candidate.parsed_data),
-            "text": candidate.text,
-            "name": candidate.name,
-            "location": candidate.location,
-            "email": candidate.email,
-            "phone": candidate.phone,
-            "gpa": candidate.gpa,
-            "degrees_earned": candidate.degrees_earned,
-            "degrees_in_progress": candidate.degrees_in_progress,
-            "projects": candidate.projects,
-            "experience": candidate.experience,
-            "scores": candidate.scores,
-            "skills": candidate.skills,
-            "upload_date": candidate.upload_date.isoformat(),
-            "project_uniqueness": candidate.project_uniqueness,
-            "project_variety":   candidate.project_variety,
-        }
-        for candidate in candidates
-    ]
+    Raises:
+        HTTPException: For unknown fields or sort keys, a malformed cursor,
+            or a radius without a known center.
+    """
+    selected = select_candidate_fields(body.fields)
+    keys = [(sort_expression(key.field), key.direction) for key in body.sort]
+    keys.append((models.Candidate.id, "asc"))
+
+    Candidate = models.Candidate
+    filters = [Candidate.job_id == body.job_id]
+    if body.gpa_listed:
+        filters.append(Candidate.gpa.isnot(None))
+    if body.min_gpa is not None:
+        filters.append(or_(Candidate.gpa.is_(None), Candidate.gpa >= body.min_gpa))
+    if body.max_gpa is not None:
+        filters.append(or_(Candidate.gpa.is_(None), Candidate.gpa <= body.max_gpa))
+    if body.uploaded_after is not None:
+        filters.append(Candidate.upload_date >= as_utc(body.uploaded_after))
+    if body.uploaded_before is not None:
+        filters.append(Candidate.upload_date <= as_utc(body.uploaded_before))
+    for column, low, high in (
+        (Candidate.project_uniqueness, body.min_uniqueness, body.max_uniqueness),
+        (Candidate.project_variety, body.min_variety, body.max_variety),
+        (Candidate.entrepreneurial_score, body.min_entrepreneurial, body.max_entrepreneurial),
+        (Candidate.keyword_hits, body.min_keyword_hits, None),
+    ):
+        if low is not None:
+            filters.append(column >= low)
+        if high is not None:
+            filters.append(column <= high)
+    if body.search:
+        matches = search_index.matching_ids(body.search.split(","), body.search_mode)
+        filters.append(Candidate.id.in_(matches) if matches is not None else false())
+    if body.within_miles is not None:
+        center = resolve_center(body.near, body.near_lat, body.near_lng)
+        in_range = candidates_within(db, body.job_id, *center, body.within_miles)
+        filters.append(Candidate.id.in_(list(in_range)) if in_range else false())
+
+    total = db.query(func.count(Candidate.id)).filter(*filters).scalar()
+
+    columns = list(dict.fromkeys([Candidate.id] + [CANDIDATE_FIELDS[f] for f in selected]))
+    sort_labels = [f"sort_{i}" for i in range(len(keys))]
+    query = db.query(*columns, *(expression.label(label) for (expression, _), label in zip(keys, sort_labels)))
+    query = query.filter(*filters)
+    if body.cursor:
+        query = query.filter(keyset_after(keys, decode_cursor(body.cursor, keys)))
+    query = query.order_by(*(
+        expression.asc() if direction == "asc" else expression.desc()
+        for expression, direction in keys
+    ))
+
+    # Fetch one extra row to learn whether there is a next page.
+    rows = query.limit(body.limit + 1).all()
+    next_cursor = None
+    if len(rows) > body.limit:
+        rows = rows[:body.limit]
+        next_cursor = encode_cursor([getattr(rows[-1], label) for label in sort_labels])
+
+    return conditional_json_response(request, {
+        "candidates": [candidate_row_fields(row, selected) for row in rows],
+        "total": total,
+        "next_cursor": next_cursor,
+    })
 
 
 class DeleteCandidatesRequest(BaseModel):
@@ -324,23 +1599,204 @@ async def delete_candidates(
         dict: Dictionary containing the list of successfully deleted candidate IDs.
     """
     deleted_ids = []
+    affected_jobs = set()
+    released_hashes = set()
 
     for candidate_id in request.ids:
         candidate = db.query(models.Candidate).get(candidate_id)
         if not candidate:
             continue
 
-        resume_path = UPLOAD_DIR / candidate.filename
-        if resume_path.exists():
-            resume_path.unlink()
+        if candidate.file_hash:
+            released_hashes.add(candidate.file_hash)
+        else:
+            resume_path = UPLOAD_DIR / candidate.filename
+            if resume_path.exists():
+                resume_path.unlink()
 
+        affected_jobs.add(candidate.job_id)
         db.delete(candidate)
         deleted_ids.append(candidate_id)
 
+    db.flush()
+
+    # Content-addressed files are shared; remove one (and its stored parse)
+    # only once no remaining candidate uses it.
+    still_used = {
+        row.file_hash
+        for row in db.query(models.Candidate.file_hash)
+                     .filter(models.Candidate.file_hash.in_(released_hashes))
+                     .distinct()
+    }
+    for sha256 in released_hashes - still_used:
+        resume_file = db.query(models.ResumeFile).get(sha256)
+        if not resume_file:
+            continue
+        resume_path = UPLOAD_DIR / resume_file.stored_name
+        if resume_path.exists():
+            resume_path.unlink()
+        db.delete(resume_file)
+
     db.commit()
+
+    # Removing candidates changes how unique the remaining ones are.
+    for job_id in affected_jobs:
+        rescore_job_uniqueness(db, job_id)
+
     return {"deleted": deleted_ids}
 
 
+def resume_stored_name(db: Session, candidate: models.Candidate) -> str:
+    """
+    Returns the name of a candidate's resume file within the upload directory.
+
+    Args:
+        db (Session): Active database session.
+        candidate (models.Candidate): The candidate.
+
+    Returns:
+        str: The content-addressed name, or the original filename for
+             candidates uploaded before files were stored by hash.
+    """
+    if candidate.file_hash:
+        resume_file = db.query(models.ResumeFile).get(candidate.file_hash)
+        if resume_file:
+            return resume_file.stored_name
+    return candidate.filename
+
+
+@app.get("/api/candidates/search")
+def search_candidates(
+    q: str = Query(..., description="Comma-separated words or phrases to search for"),
+    job_id: Optional[int] = Query(None, alias="jobId"),
+    mode: Literal["any", "all"] = Query("any", description="Match any term or all terms"),
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    db: Session = Depends(get_db),
+):
+    """
+    Searches candidates' resume text, skills, projects and experience.
+
+    Each term matches as a phrase whose last word may be a prefix. Results
+    are ranked by BM25 relevance (matches in skills weigh more) and carry
+    an HTML snippet around the best match, with matches in <mark>.
+
+    Args:
+        q (str): Comma-separated search terms.
+        job_id (Optional[int]): If provided, only searches this job's candidates.
+        mode (str): "any" for candidates matching at least one term, "all" for every term.
+        limit (Optional[int]): Maximum number of results.
+        db (Session): Active database session provided by dependency injection.
+
+    Returns:
+        List[dict]: {"id", "score", "snippet"} per match, best first.
+    """
+    return search_index.search(db, q.split(","), mode, job_id, limit)
+
+
+def resolve_center(
+    location: Optional[str],
+    lat: Optional[float],
+    lng: Optional[float],
+) -> tuple:
+    """
+    Works out the center of a radius query.
+
+    Args:
+        location (Optional[str]): Place to geocode (e.g., "Tempe, AZ").
+        lat (Optional[float]): Latitude, used with lng instead of location.
+        lng (Optional[float]): Longitude, used with lat instead of location.
+
+    Returns:
+        tuple: (latitude, longitude).
+
+    Raises:
+        HTTPException: If neither form is given or the location is unknown.
+    """
+    if lat is not None and lng is not None:
+        return lat, lng
+    if not location:
+        raise HTTPException(status_code=400, detail="Give a location or lat and lng")
+    coords = geocoder.geocode(location)
+    if coords is None:
+        raise HTTPException(status_code=422, detail=f"Unknown location: {location}")
+    return coords
+
+
+def candidates_within(db: Session, job_id: int, lat: float, lng: float, miles: float) -> dict:
+    """
+    Finds a job's candidates within a radius.
+
+    Candidates are first narrowed to the grid cells the circle overlaps
+    (indexed on job_id and geo_cell), then exact distances are computed
+    for those only.
+
+    Args:
+        db (Session): Active database session.
+        job_id (int): Job whose candidates to search.
+        lat (float): Latitude of the center.
+        lng (float): Longitude of the center.
+        miles (float): Radius in miles.
+
+    Returns:
+        dict: Distance in miles per candidate ID, for candidates in range.
+    """
+    Candidate = models.Candidate
+    query = db.query(Candidate.id, Candidate.latitude, Candidate.longitude).filter(Candidate.job_id == job_id)
+    cells = geocoder.cells_within(lat, lng, miles)
+    if cells is not None:
+        query = query.filter(Candidate.geo_cell.in_(cells))
+    else:
+        query = query.filter(Candidate.geo_cell.isnot(None))
+    rows = query.all()
+    if not rows:
+        return {}
+
+    ids, lats, lngs = zip(*rows)
+    distances = geocoder.haversine_miles(lat, lng, lats, lngs)
+    return {
+        candidate_id: round(distance, 2)
+        for candidate_id, distance in zip(ids, distances.tolist())
+        if distance <= miles
+    }
+
+
+@app.get("/api/candidates/nearby")
+def nearby_candidates(
+    job_id: int = Query(..., alias="jobId"),
+    miles: float = Query(..., gt=0),
+    location: Optional[str] = Query(None, description='Center as "City, ST"'),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lng: Optional[float] = Query(None, ge=-180, le=180),
+    db: Session = Depends(get_db),
+):
+    """
+    Lists a job's candidates within a radius of a place, nearest first.
+
+    Candidates whose location is missing or not in the offline gazetteer
+    are never in range.
+
+    Args:
+        job_id (int): Job whose candidates to search.
+        miles (float): Radius in miles.
+        location (Optional[str]): Center, geocoded like candidate locations.
+        lat (Optional[float]): Center latitude, used with lng instead of location.
+        lng (Optional[float]): Center longitude, used with lat instead of location.
+        db (Session): Active database session provided by dependency injection.
+
+    Returns:
+        List[dict]: {"id", "distance_miles"} per candidate in range.
+
+    Raises:
+        HTTPException: If no center is given or the location is unknown.
+    """
+    center_lat, center_lng = resolve_center(location, lat, lng)
+    distances = candidates_within(db, job_id, center_lat, center_lng, miles)
+    return [
+        {"id": candidate_id, "distance_miles": distance}
+        for candidate_id, distance in sorted(distances.items(), key=lambda item: (item[1], item[0]))
+    ]
+
+
 @app.get("/api/candidates/{candidate_id}")
 def get_candidate(candidate_id: int, db: Session = Depends(get_db)):
     """
@@ -366,6 +1822,8 @@ def get_candidate(candidate_id: int, db: Session = Depends(get_db)):
         "text": candidate.text,
         "name": candidate.name,
         "location": candidate.location,
+        "latitude": candidate.latitude,
+        "longitude": candidate.longitude,
         "email": candidate.email,
         "phone": candidate.phone,
         "gpa": candidate.gpa,
@@ -374,11 +1832,15 @@ def get_candidate(candidate_id: int, db: Session = Depends(get_db)):
         "projects": candidate.projects,
         "experience": candidate.experience,
         "scores": candidate.scores,
+        "local_scores": candidate.local_scores or {},
         "skills": candidate.skills,
-        "resume_url": f"/uploads/{candidate.filename}",
+        "resume_url": f"/uploads/{resume_stored_name(db, candidate)}",
         "upload_date": candidate.upload_date.isoformat(),
         "project_uniqueness": candidate.project_uniqueness,
         "project_variety":   candidate.project_variety,
+        "keyword_hits": candidate.keyword_hits,
+        "keyword_score": candidate.keyword_score,
+        "entrepreneurial_score": candidate.entrepreneurial_score,
     })
 
     return candidate_data
@@ -447,6 +1909,31 @@ def create_job(job: JobCreate, db: Session = Depends(get_db)):
     }
 
 
+@app.post("/api/jobs/{job_id}/rescore")
+def rescore_job(job_id: int, db: Session = Depends(get_db)):
+    """
+    Recomputes project uniqueness for every candidate in a job against the
+    job's current candidate pool.
+
+    Args:
+        job_id (int): The unique identifier of the job to rescore.
+        db (Session): Active database session provided by dependency injection.
+
+    Returns:
+        dict: The job ID and a mapping of candidate ID to new uniqueness score.
+
+    Raises:
+        HTTPException: If the job does not exist.
+    """
+    job = db.query(models.Job).get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    scores = rescore_job_uniqueness(db, job_id)
+
+    return {"job_id": job_id, "project_uniqueness": scores}
+
+
 # Badge schemas for serialization/deserialization
 class BadgeBase(BaseModel):
     title: str
@@ -532,6 +2019,13 @@ class ReqModel(BaseModel):
     requirements: List[str]
 
 
+OPENAI_MODEL = "gpt-4o-mini"
+
+# Part of every llm_cache key. Bump an operation's version whenever its
+# prompt changes so results cached under the old prompt stop being used.
+PROMPT_VERSIONS = {"nickname": 1, "score": 1, "explain": 1, "score_batch": 1}
+
+
 async def generate_nicknames(reqs: List[str]) -> dict[str, str]:
     """
     Generates short, human-readable nicknames for a list of requirement strings using OpenAI.
@@ -549,8 +2043,14 @@ async def generate_nicknames(reqs: List[str]) -> dict[str, str]:
         "Requirements:\n" + "\n".join(f"{i + 1}. {r}" for i, r in enumerate(reqs))
     )
 
-    response = openai.chat.completions.create(
-        model="gpt-4o-mini",
+    cache_requirement = json.dumps(reqs)
+    cached = await llm_cache.alookup("nickname", OPENAI_MODEL, PROMPT_VERSIONS["nickname"], [cache_requirement])
+    if cached:
+        return json.loads(cached[cache_requirement])
+
+    response = await openai_client.chat_completion(
+        "nickname",
+        model=OPENAI_MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.0,
         max_tokens=200,
@@ -567,7 +2067,12 @@ async def generate_nicknames(reqs: List[str]) -> dict[str, str]:
     except Exception as e:
         return {r: r for r in reqs}
 
-    return {item["text"]: item["nickname"] for item in parsed}
+    nicknames = {item["text"]: item["nickname"] for item in parsed}
+    await llm_cache.astore(
+        "nickname", OPENAI_MODEL, PROMPT_VERSIONS["nickname"],
+        {cache_requirement: json.dumps(nicknames)},
+    )
+    return nicknames
 
 
 async def score_requirement(req: str, resume: str) -> float:
@@ -587,18 +2092,27 @@ async def score_requirement(req: str, resume: str) -> float:
         "Return ONLY the number."
     )
 
-    response = openai.chat.completions.create(
-        model="gpt-4o-mini",
+    digest = llm_cache.resume_hash(resume)
+    cached = await llm_cache.alookup("score", OPENAI_MODEL, PROMPT_VERSIONS["score"], [req], digest)
+    if cached:
+        return float(cached[req])
+
+    response = await openai_client.chat_completion(
+        "score",
+        model=OPENAI_MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.0,
         max_tokens=5,
     )
 
     try:
-        return float(response.choices[0].message.content.strip())
+        score = float(response.choices[0].message.content.strip())
     except Exception:
         return 0.0
 
+    await llm_cache.astore("score", OPENAI_MODEL, PROMPT_VERSIONS["score"], {req: repr(score)}, digest)
+    return score
+
 
 async def explain_requirement(req: str, resume: str) -> str:
     """
@@ -631,19 +2145,331 @@ async def explain_requirement(req: str, resume: str) -> str:
         """
     )
 
-    response = openai.chat.completions.create(
-        model="gpt-4o-mini",
+    digest = llm_cache.resume_hash(resume)
+    cached = await llm_cache.alookup("explain", OPENAI_MODEL, PROMPT_VERSIONS["explain"], [req], digest)
+    if cached:
+        return cached[req]
+
+    response = await openai_client.chat_completion(
+        "explain",
+        model=OPENAI_MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.0,
         max_tokens=400,
     )
 
-    return response.choices[0].message.content.strip()
+    explanation = response.choices[0].message.content.strip()
+    await llm_cache.astore("explain", OPENAI_MODEL, PROMPT_VERSIONS["explain"], {req: explanation}, digest)
+    return explanation
+
+
+# "batch" scores all requirements for a candidate in one call; "pair" makes
+# one score call and one explain call per (candidate, requirement).
+REQUIREMENT_SCORING_MODE = os.getenv("REQUIREMENT_SCORING_MODE", "batch")
+
+# Extra batched attempts for requirements whose output was malformed, before
+# falling back to the per-pair calls for them.
+BATCH_SCORING_RETRIES = 1
+
+
+async def evaluate_requirement(req: str, resume: str) -> tuple[float, str]:
+    """
+    Scores and explains one requirement with two separate OpenAI calls.
+
+    Args:
+        req (str): Job requirement.
+        resume (str): Anonymized resume text.
+
+    Returns:
+        tuple[float, str]: The score and the bullet-point explanation.
+    """
+    score, reason = await asyncio.gather(
+        score_requirement(req, resume),
+        explain_requirement(req, resume),
+    )
+    return score, reason
+
+
+def parse_batch_scores(raw: str, keys: List[str]) -> dict[str, tuple[float, str]]:
+    """
+    Validates the JSON returned by a batched scoring call.
+
+    Args:
+        raw (str): Model output, expected to be a JSON object keyed by requirement
+            key, each value {"score": 0–100, "evidence": [1 to 3 strings]}.
+        keys (List[str]): Requirement keys that were asked for.
+
+    Returns:
+        dict[str, tuple[float, str]]: (score, bullet text) for each key whose entry
+        is well-formed. Missing or malformed entries are left out.
+    """
+    cleaned = re.sub(r"^```(?:json)?\n|\n```$", "", raw.strip())
+    try:
+        parsed = json.loads(cleaned)
+    except ValueError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+
+    valid = {}
+    for key in keys:
+        entry = parsed.get(key)
+        if not isinstance(entry, dict):
+            continue
+        score, evidence = entry.get("score"), entry.get("evidence")
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0 <= score <= 100:
+            continue
+        if not isinstance(evidence, list) or not 1 <= len(evidence) <= 3:
+            continue
+        bullets = [b.lstrip("•").strip() for b in evidence if isinstance(b, str)]
+        if len(bullets) != len(evidence) or not all(bullets):
+            continue
+        valid[key] = (float(score), "\n".join(f"• {b}" for b in bullets))
+    return valid
+
+
+async def score_requirements_batch(reqs: List[str], resume: str) -> dict[str, tuple[float, str]]:
+    """
+    Scores and explains all requirements for one resume in a single OpenAI call.
+
+    Results are cached per requirement in llm_cache, so only requirements
+    not already evaluated against this resume are sent. The output is
+    validated per requirement. Requirements whose entry is missing or
+    malformed are asked again in a smaller batch, and after
+    BATCH_SCORING_RETRIES such attempts fall back to evaluate_requirement.
+
+    Args:
+        reqs (List[str]): Job requirements.
+        resume (str): Anonymized resume text.
+
+    Returns:
+        dict[str, tuple[float, str]]: (score, bullet-point explanation) per requirement.
+    """
+    digest = llm_cache.resume_hash(resume)
+    unique_reqs = list(dict.fromkeys(reqs))
+    cached = await llm_cache.alookup("score_batch", OPENAI_MODEL, PROMPT_VERSIONS["score_batch"], unique_reqs, digest)
+    results = {req: tuple(json.loads(value)) for req, value in cached.items()}
+    answered: dict[str, tuple[float, str]] = {}
+    pending = [req for req in unique_reqs if req not in results]
+
+    for _ in range(1 + BATCH_SCORING_RETRIES):
+        if not pending:
+            break
+        keys = [f"R{i + 1}" for i in range(len(pending))]
+        prompt = (
+            "You are evaluating a resume against several job requirements.\n\n"
+            "Requirements:\n" + "\n".join(f"{key}: {req}" for key, req in zip(keys, pending)) + "\n\n"
+            "Return ONLY a JSON object with one entry per requirement key, e.g. "
+            '{"R1": {"score": 80, "evidence": ["...", "..."]}}.\n'
+            "- score: a number 0–100 rating how well the resume meets the requirement.\n"
+            "- evidence: 1 to 3 strings, each a distinct, literal piece of evidence from the resume "
+            "that directly supports the requirement. If there is little or no supporting evidence, "
+            "each string instead gives a distinct, literal reason for the lack of evidence.\n"
+            "Each evidence string must be 15 words or fewer, must not interpret or summarize, and "
+            "must not mention names, pronouns, or the word “resume”. Do not hallucinate anything, "
+            "only use what's on the resume, and do not pad with generic or tangential information.\n\n"
+            f"Here is the resume: {resume}"
+        )
+
+        response = await openai_client.chat_completion(
+            "score_batch",
+            model=OPENAI_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=150 * len(pending) + 50,
+            response_format={"type": "json_object"},
+        )
+
+        valid = parse_batch_scores(response.choices[0].message.content or "", keys)
+        for key, req in zip(keys, pending):
+            if key in valid:
+                answered[req] = valid[key]
+        pending = [req for key, req in zip(keys, pending) if key not in valid]
+
+    await llm_cache.astore(
+        "score_batch", OPENAI_MODEL, PROMPT_VERSIONS["score_batch"],
+        {req: json.dumps(result) for req, result in answered.items()},
+        digest,
+    )
+    results.update(answered)
+
+    # The per-pair calls cache their own successful results.
+    if pending:
+        fallback = await asyncio.gather(*(evaluate_requirement(req, resume) for req in pending))
+        results.update(zip(pending, fallback))
+    return results
+
+
+async def evaluate_candidate(reqs: List[str], resume: str, mode: str) -> dict[str, tuple[float, str]]:
+    """
+    Scores and explains every requirement for one resume.
+
+    Args:
+        reqs (List[str]): Job requirements.
+        resume (str): Anonymized resume text.
+        mode (str): "batch" for one call per resume, "pair" for two calls per requirement.
+
+    Returns:
+        dict[str, tuple[float, str]]: (score, bullet-point explanation) per requirement.
+    """
+    if mode == "batch":
+        return await score_requirements_batch(reqs, resume)
+    evaluations = await asyncio.gather(*(evaluate_requirement(req, resume) for req in reqs))
+    return dict(zip(reqs, evaluations))
+
+
+def anonymized_resume(candidate: models.Candidate) -> str:
+    """
+    Returns a candidate's resume text with identifying details masked, as sent to OpenAI.
+
+    Reads the copy stored at ingest. Candidates stored before it existed get
+    it computed and set here, to be saved with the caller's next commit.
+
+    Args:
+        candidate (models.Candidate): The candidate to anonymize.
+
+    Returns:
+        str: Anonymized resume text.
+    """
+    if candidate.anonymized_text is None:
+        candidate.anonymized_text = anonymize_text(
+            candidate.text,
+            candidate.name,
+            candidate.email,
+            candidate.phone,
+            candidate.location,
+        )
+    return candidate.anonymized_text
+
+
+def apply_evaluation(
+    candidate: models.Candidate,
+    evaluation: dict[str, tuple[float, str]],
+    nickname_map: dict[str, str],
+    source: str = "llm",
+) -> dict:
+    """
+    Records a candidate's requirement scores and builds its result entry.
+
+    OpenAI scores go in candidate.scores and replace any local estimate for
+    the requirement. Local estimates go in candidate.local_scores, so they
+    never overwrite an OpenAI score and keep their label after a reload.
+
+    Args:
+        candidate (models.Candidate): Candidate whose scores are updated (not committed).
+        evaluation (dict[str, tuple[float, str]]): (score, explanation) per requirement.
+        nickname_map (dict[str, str]): Requirement text to nickname.
+        source (str): "llm" for OpenAI scores, "local" for lexical estimates.
+
+    Returns:
+        dict: {"id": candidate id, "results": {nickname: {"score", "reason", "source"}}}.
+    """
+    requirement_scores: dict[str, dict] = {}
+    scores = dict(candidate.scores or {})
+    local_scores = dict(candidate.local_scores or {})
+
+    for requirement, nickname in nickname_map.items():
+        score, reason = evaluation[requirement]
+
+        requirement_scores[nickname] = {
+            "score": score,
+            "reason": reason,
+            "source": source,
+        }
+
+        # persist score only
+        if source == "local":
+            local_scores[nickname] = score
+        else:
+            scores[nickname] = score
+            local_scores.pop(nickname, None)
+
+    # Assign new dicts so SQLAlchemy sees the JSON column change.
+    candidate.scores = scores
+    candidate.local_scores = local_scores
+    return {
+        "id": candidate.id,
+        "results": requirement_scores
+    }
+
+
+def local_reason(index: lexical_rank.BM25Index, candidate_id: int, requirement: str) -> str:
+    """
+    Explains a lexical estimate in the same bullet format as OpenAI explanations.
+
+    Args:
+        index (lexical_rank.BM25Index): Index the estimate came from.
+        candidate_id (int): Candidate being explained.
+        requirement (str): Requirement text.
+
+    Returns:
+        str: Bullet points labeling the score as a local estimate and listing matched words.
+    """
+    matched = index.matched_terms(candidate_id, requirement)
+    evidence = f"Matched words: {', '.join(matched)}" if matched else "No requirement words found"
+    return f"• Local keyword estimate, not evaluated by AI\n• {evidence}"
+
+
+def prerank_candidates(
+    candidates: List[models.Candidate],
+    requirements: List[str],
+    top_k: Optional[int],
+    min_local_score: Optional[float],
+) -> tuple[List[models.Candidate], dict[int, dict[str, tuple[float, str]]]]:
+    """
+    Ranks candidates locally with BM25 and keeps only the best for OpenAI.
+
+    A candidate's overall relevance is its mean 0–100 BM25 relevance over
+    the requirements. Candidates that are not selected get that per-requirement
+    relevance as their score instead, with a reason saying so.
+
+    Args:
+        candidates (List[models.Candidate]): The job's candidates.
+        requirements (List[str]): Requirement texts.
+        top_k (Optional[int]): Send at most this many candidates to OpenAI.
+        min_local_score (Optional[float]): Send only candidates with at least this relevance.
+
+    Returns:
+        tuple: (candidates to evaluate with OpenAI, local (score, reason) per
+        requirement for every other candidate, by id). Everyone is selected
+        when both limits are None.
+    """
+    if top_k is None and min_local_score is None:
+        return candidates, {}
+
+    with metrics.SCORING_SECONDS.time(scorer="lexical"):
+        index = lexical_rank.BM25Index({c.id: lexical_rank.candidate_document(c) for c in candidates})
+        relevance = lexical_rank.rank(index, requirements)
+        overall = {
+            c.id: sum(relevance[req][c.id] for req in requirements) / len(requirements)
+            for c in candidates
+        }
+        selected = set(lexical_rank.select_top(overall, top_k, min_local_score))
+
+    local = {
+        c.id: {req: (relevance[req][c.id], local_reason(index, c.id, req)) for req in requirements}
+        for c in candidates
+        if c.id not in selected
+    }
+    return [c for c in candidates if c.id in selected], local
+
 
 @app.post("/api/requirements")
 async def process_requirements(
     body: ReqModel,
     job_id: int = Query(..., alias="jobId", description="Only score resumes for this job"),
+    mode: Literal["batch", "pair"] = Query(
+        REQUIREMENT_SCORING_MODE,
+        description="batch: one OpenAI call per candidate; pair: score and explain calls per requirement",
+    ),
+    top_k: Optional[int] = Query(
+        None, alias="topK", ge=0,
+        description="Only send the K locally best-matching candidates to OpenAI",
+    ),
+    min_local_score: Optional[float] = Query(
+        None, alias="minLocalScore", ge=0, le=100,
+        description="Only send candidates with at least this local (BM25) relevance to OpenAI",
+    ),
     db: Session = Depends(get_db)
 ):
     # fail early if no key configured
@@ -657,11 +2483,16 @@ async def process_requirements(
     Args:
         body (ReqModel): Request body containing a list of requirement strings.
         job_id (int): Job ID to filter candidates to be scored.
+        mode (str): "batch" or "pair" scoring (see evaluate_candidate).
+        top_k (Optional[int]): Pre-rank locally and send only this many candidates to OpenAI.
+        min_local_score (Optional[float]): Pre-rank locally and send only candidates
+            at or above this relevance (see prerank_candidates).
         db (Session): Active database session provided by dependency injection.
 
     Returns:
         dict: A mapping of requirements to nicknames and a list of candidate results,
-              each with scores and explanations per requirement.
+              each with scores and explanations per requirement. Each result's
+              "source" is "llm", or "local" for candidates not sent to OpenAI.
 
     Raises:
         HTTPException: If no requirements are provided.
@@ -679,34 +2510,22 @@ async def process_requirements(
               .all()
         )
 
-        results = []
-
-        for candidate in candidates:
-            anonymized_resume = anonymize_text(
-                candidate.text,
-                candidate.name,
-                candidate.email,
-                candidate.phone,
-                candidate.location,
-            )
-
-            requirement_scores: dict[str, dict] = {}
-
-            for requirement, nickname in nickname_map.items():
-                score = await score_requirement(requirement, anonymized_resume)
-                reason = await explain_requirement(requirement, anonymized_resume)
+        selected, local = prerank_candidates(candidates, list(nickname_map), top_k, min_local_score)
 
-                requirement_scores[nickname] = {
-                    "score": score,
-                    "reason": reason
-                }
+        # Candidates are evaluated concurrently; openai_client bounds how
+        # many calls are in flight and their rate.
+        evaluations = await asyncio.gather(*(
+            evaluate_candidate(list(nickname_map), anonymized_resume(candidate), mode)
+            for candidate in selected
+        ))
+        evaluated = {candidate.id: evaluation for candidate, evaluation in zip(selected, evaluations)}
 
-                candidate.scores[nickname] = score  # persist score only
-
-            results.append({
-                "id": candidate.id,
-                "results": requirement_scores
-            })
+        results = [
+            apply_evaluation(candidate, evaluated[candidate.id], nickname_map)
+            if candidate.id in evaluated
+            else apply_evaluation(candidate, local[candidate.id], nickname_map, source="local")
+            for candidate in candidates
+        ]
 
         db.commit()
 
@@ -719,3 +2538,111 @@ async def process_requirements(
         import traceback
         traceback.print_exc()
         raise
+
+
+def ndjson_line(event: dict) -> bytes:
+    """Encodes one event as a line of newline-delimited JSON."""
+    return (json.dumps(event) + "\n").encode("utf-8")
+
+
+@app.post("/api/requirements/stream")
+async def stream_requirements(
+    body: ReqModel,
+    job_id: int = Query(..., alias="jobId", description="Only score resumes for this job"),
+    mode: Literal["batch", "pair"] = Query(
+        REQUIREMENT_SCORING_MODE,
+        description="batch: one OpenAI call per candidate; pair: score and explain calls per requirement",
+    ),
+    top_k: Optional[int] = Query(
+        None, alias="topK", ge=0,
+        description="Only send the K locally best-matching candidates to OpenAI",
+    ),
+    min_local_score: Optional[float] = Query(
+        None, alias="minLocalScore", ge=0, le=100,
+        description="Only send candidates with at least this local (BM25) relevance to OpenAI",
+    ),
+):
+    """
+    Streaming variant of process_requirements, as newline-delimited JSON.
+
+    The first line is {"type": "mapping", "mapping": {requirement: nickname}}.
+    Candidates left to local scores by pre-ranking follow straight away.
+    Then, as each candidate finishes, its scores are committed and a line
+    {"type": "candidate", "id": ..., "results": {nickname: {"score", "reason", "source"}}}
+    is sent, or {"type": "error", "id": ..., "detail": ...} if scoring it
+    failed. The last line is {"type": "done", "scored": n, "failed": n}.
+
+    Args:
+        body (ReqModel): Request body containing a list of requirement strings.
+        job_id (int): Job ID to filter candidates to be scored.
+        mode (str): "batch" or "pair" scoring (see evaluate_candidate).
+        top_k (Optional[int]): Pre-rank locally and send only this many candidates to OpenAI.
+        min_local_score (Optional[float]): Pre-rank locally and send only candidates
+            at or above this relevance (see prerank_candidates).
+
+    Returns:
+        StreamingResponse: application/x-ndjson event stream.
+
+    Raises:
+        HTTPException: If no OpenAI key is configured or no requirements are provided.
+    """
+    if not has_openai_key:
+        raise HTTPException(status_code=503, detail="OpenAI API key not configured.")
+    requirements = body.requirements
+    if not requirements:
+        raise HTTPException(status_code=400, detail="No requirements provided")
+
+    # Errors up to here still get a proper status code; once streaming has
+    # started they can only be reported in the stream.
+    nickname_map = await generate_nicknames(requirements)
+
+    # The response outlives request-scoped dependencies, so the stream
+    # opens its own short sessions.
+    with SessionLocal() as db:
+        candidates = db.query(models.Candidate).filter(models.Candidate.job_id == job_id).all()
+        selected, local = prerank_candidates(candidates, list(nickname_map), top_k, min_local_score)
+        resumes = [(candidate.id, anonymized_resume(candidate)) for candidate in selected]
+        local_results = [
+            apply_evaluation(candidate, local[candidate.id], nickname_map, source="local")
+            for candidate in candidates
+            if candidate.id in local
+        ]
+        db.commit()
+
+    async def evaluate(candidate_id: int, resume: str):
+        try:
+            return candidate_id, await evaluate_candidate(list(nickname_map), resume, mode)
+        except Exception as e:
+            return candidate_id, e
+
+    async def events():
+        yield ndjson_line({"type": "mapping", "mapping": nickname_map})
+        for result in local_results:
+            yield ndjson_line({"type": "candidate", **result})
+
+        tasks = [asyncio.ensure_future(evaluate(candidate_id, resume)) for candidate_id, resume in resumes]
+        scored, failed = len(local_results), 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                candidate_id, evaluation = await next_done
+                if isinstance(evaluation, Exception):
+                    failed += 1
+                    yield ndjson_line({"type": "error", "id": candidate_id, "detail": str(evaluation)})
+                    continue
+
+                with SessionLocal() as db:
+                    candidate = db.get(models.Candidate, candidate_id)
+                    if candidate is None:  # deleted while it was being scored
+                        continue
+                    result = apply_evaluation(candidate, evaluation, nickname_map)
+                    db.commit()
+                scored += 1
+                yield ndjson_line({"type": "candidate", **result})
+
+            yield ndjson_line({"type": "done", "scored": scored, "failed": failed})
+        finally:
+            # Stop scoring if the client goes away mid-stream.
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
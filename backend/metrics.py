@@ -0,0 +1,310 @@
+"""
+metrics.py
+
+Minimal in-process latency histograms and counters, exposed in the
+Prometheus text format by the /metrics endpoint in main.py.
+
+Recording a sample is a lock, a bisect and two additions, so it costs
+about a microsecond whether or not anyone scrapes /metrics. All formatting
+happens in render(), at scrape time.
+
+Work done in worker processes (parse and OCR pools) is recorded in that
+process's own registry. Submit such calls with submit_and_merge(), which
+ships the worker's samples back and folds them into this process.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Upper bounds in seconds, from regex-sized work to slow OpenAI calls.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+_registry: Dict[str, "_Metric"] = {}
+_registry_lock = threading.Lock()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = ""
+    # Appended to the name on the HELP/TYPE lines, to match the sample names.
+    suffix = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: Dict[LabelValues, list] = {}
+        with _registry_lock:
+            if name in _registry:
+                raise ValueError(f"Metric {name} is already registered")
+            _registry[name] = self
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _snapshot_and_reset(self) -> Dict[LabelValues, list]:
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, optionally split by labels."""
+
+    kind = "counter"
+    suffix = "_total"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Add to the counter.
+
+        Args:
+            amount: Non-negative increment.
+            **labels: One value per label name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.setdefault(key, [0.0])
+            series[0] += amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            return self._series.get(key, [0.0])[0]
+
+    def _merge(self, series: Dict[LabelValues, list]) -> None:
+        with self._lock:
+            for key, (value,) in series.items():
+                self._series.setdefault(key, [0.0])[0] += value
+
+    def _render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, value[0]) for key, value in self._series.items())
+        return [
+            f"{self.name}{self.suffix}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Latency distribution in seconds, bucketed, optionally split by labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Record one sample.
+
+        Args:
+            value: Observed value, in seconds for latencies.
+            **labels: One value per label name.
+        """
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts (last one is +Inf), then sum.
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Observe the wall time of a with-block, even if it raises.
+
+        Args:
+            **labels: One value per label name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _merge(self, series: Dict[LabelValues, list]) -> None:
+        with self._lock:
+            for key, values in series.items():
+                mine = self._series.get(key)
+                if mine is None:
+                    self._series[key] = list(values)
+                else:
+                    for i, value in enumerate(values):
+                        mine[i] += value
+
+    def _render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(values)) for key, values in self._series.items())
+        lines = []
+        names = self.labelnames + ("le",)
+        for key, values in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), values):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(names, key + (le,))} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(values[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def render() -> str:
+    """
+    Format every registered metric in the Prometheus text exposition format.
+
+    Returns:
+        The /metrics response body.
+    """
+    with _registry_lock:
+        metrics = list(_registry.values())
+    lines = []
+    for metric in metrics:
+        name = metric.name + metric.suffix
+        lines.append(f"# HELP {name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        lines.extend(metric._render())
+    return "\n".join(lines) + "\n"
+
+
+def drain() -> Dict[str, Dict[LabelValues, list]]:
+    """
+    Take and clear this process's recorded samples.
+
+    Returns:
+        A picklable snapshot for merge(), keyed by metric name.
+    """
+    with _registry_lock:
+        metrics = list(_registry.values())
+    snapshot = {}
+    for metric in metrics:
+        series = metric._snapshot_and_reset()
+        if series:
+            snapshot[metric.name] = series
+    return snapshot
+
+
+def merge(snapshot: Dict[str, Dict[LabelValues, list]]) -> None:
+    """
+    Add a snapshot taken by drain() (usually in another process) to this
+    process's metrics. Unknown metric names are ignored.
+
+    Args:
+        snapshot: Output of drain().
+    """
+    for name, series in snapshot.items():
+        metric = _registry.get(name)
+        if metric is not None:
+            metric._merge(series)
+
+
+def call_and_drain(fn: Callable, *args):
+    """
+    Run fn in a worker process and return its result with the samples it
+    recorded, for the caller to merge().
+
+    Args:
+        fn: Picklable module-level function.
+        *args: Arguments for fn.
+
+    Returns:
+        Tuple of (fn's result, drain() snapshot).
+    """
+    return fn(*args), drain()
+
+
+def submit_and_merge(executor: Executor, fn: Callable, *args) -> Future:
+    """
+    Submit fn to a process pool and merge the samples it records here.
+
+    Args:
+        executor: Process pool to run fn in.
+        fn: Picklable module-level function.
+        *args: Arguments for fn.
+
+    Returns:
+        A Future resolving to fn's result, after its samples are merged.
+    """
+    inner = executor.submit(call_and_drain, fn, *args)
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def finish(done: Future) -> None:
+        try:
+            result, snapshot = done.result()
+        except BaseException as e:
+            future.set_exception(e)
+            return
+        merge(snapshot)
+        future.set_result(result)
+
+    inner.add_done_callback(finish)
+    return future
+
+
+# Metrics shared across modules.
+PARSE_STAGE_SECONDS = Histogram(
+    "resume_parse_stage_seconds",
+    "Time spent in each resume parsing stage.",
+    ["stage"],
+)
+OCR_SECONDS = Histogram(
+    "resume_ocr_seconds",
+    "Time to OCR one image in an OCR worker, excluding queueing.",
+)
+SCORING_SECONDS = Histogram(
+    "candidate_scoring_seconds",
+    "Time spent in each candidate scoring stage (uniqueness, variety, keywords, lexical) for a batch.",
+    ["scorer"],
+)
+DB_COMMIT_SECONDS = Histogram(
+    "db_commit_seconds",
+    "Time spent in SQLAlchemy session commits.",
+)
+OPENAI_REQUEST_SECONDS = Histogram(
+    "openai_request_seconds",
+    "Latency of OpenAI chat completion calls.",
+    ["operation"],
+)
+OPENAI_ERRORS = Counter(
+    "openai_request_errors",
+    "OpenAI chat completion calls that raised an error.",
+    ["operation"],
+)
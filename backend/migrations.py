@@ -0,0 +1,63 @@
+"""
+migrations.py
+
+Idempotent schema upgrades for existing databases.
+
+Base.metadata.create_all() creates missing tables but never alters tables
+that already exist, so columns and indexes added to models.py later would
+be missing from an older resumes.db. upgrade() adds them in place.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from database import Base
+
+
+def _column_ddl(engine: Engine, column) -> str:
+    """
+    Render an ADD COLUMN clause for a model column.
+
+    New columns are added as nullable; a scalar Python default becomes the
+    column's DEFAULT so existing rows get a value.
+
+    Args:
+        engine: Engine whose dialect compiles the column type.
+        column: The SQLAlchemy Column to add.
+
+    Returns:
+        The column definition, e.g. '"file_hash" VARCHAR(64) DEFAULT NULL'.
+    """
+    preparer = engine.dialect.identifier_preparer
+    ddl = f"{preparer.quote(column.name)} {column.type.compile(dialect=engine.dialect)}"
+    default = column.default
+    if default is not None and default.is_scalar and isinstance(default.arg, (int, float, str)):
+        ddl += f" DEFAULT {default.arg!r}" if isinstance(default.arg, str) else f" DEFAULT {default.arg}"
+    return ddl
+
+
+def upgrade(engine: Engine) -> None:
+    """
+    Add any model columns and indexes missing from existing tables.
+
+    Args:
+        engine: Engine bound to the application database.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in present:
+                    conn.execute(text(
+                        f"ALTER TABLE {engine.dialect.identifier_preparer.quote(table.name)} "
+                        f"ADD COLUMN {_column_ddl(engine, column)}"
+                    ))
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
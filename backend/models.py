@@ -8,6 +8,7 @@ from sqlalchemy import (
     Float,
     DateTime,
     ForeignKey,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship
@@ -48,42 +49,65 @@ class Candidate(Base):
     Attributes:
         id (int): Primary key.
         filename (str): Original filename of the uploaded resume.
+        file_hash (str | None): SHA-256 of the resume file (see ResumeFile).
         parsed_data (str): JSON string storing file metadata (e.g., filename and size).
         text (str | None): Raw text extracted from the resume.
+        anonymized_text (str | None): text with name, email, phone and location
+            redacted, as sent to OpenAI. Recomputed whenever those fields change.
         email (str | None): Candidate's email address.
         phone (str | None): Candidate's phone number.
         gpa (float | None): Parsed GPA on a 0.0–4.0 scale.
         name (str | None): Full name extracted from the resume.
         location (str | None): Parsed location (e.g., city, state).
+        latitude (float | None): Latitude of location from the offline gazetteer.
+        longitude (float | None): Longitude of location from the offline gazetteer.
+        geo_cell (int | None): geocoder.grid_cell() of the coordinates, for
+            radius queries.
         degrees_earned (List[List[str, str]] | None): Completed degrees with details.
         degrees_in_progress (List[List[str, str]] | None): Ongoing degrees with details.
         projects (List[dict]): Parsed project information.
         experience (List[dict]): Parsed work experience information.
-        scores (dict): Requirement-to-score map (e.g., {"Python": 87.5}).
+        scores (dict): Requirement-to-score map (e.g., {"Python": 87.5}), from OpenAI.
+        local_scores (dict | None): Local BM25 estimates for requirements the
+            candidate was not sent to OpenAI for, in the same shape as scores.
         skills (str | None): Free-text list or block of skills.
         upload_date (datetime): Timestamp of resume upload.
         job_id (int): Foreign key to the associated job.
         job (Job): Relationship to the associated job.
+        project_uniqueness (float): 0–100 project uniqueness within the job.
+        project_variety (float): 0–100 variety among the candidate's projects.
+        keyword_hits (int): Entrepreneurial keywords found in the resume.
+        keyword_score (float): 0–100 score for keyword_hits.
+        keywords_version (str | None): entrepreneurial.KEYWORDS_VERSION of the
+            keyword list keyword_hits was counted with.
+        entrepreneurial_score (float): Mean of project_uniqueness,
+            project_variety and keyword_score.
     """
     __tablename__ = "candidates"
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, index=True)
+    file_hash = Column(String(64), index=True, nullable=True)
     parsed_data = Column(Text)
 
     text = Column(Text, nullable=True)
+    anonymized_text = Column(Text, nullable=True)
     email = Column(String, index=True, nullable=True)
     phone = Column(String, index=True, nullable=True)
     gpa = Column(Float, nullable=True)
 
     name = Column(String, nullable=True)
     location = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geo_cell = Column(Integer, nullable=True)
     degrees_earned = Column(JSON, nullable=True)
     degrees_in_progress = Column(JSON, nullable=True)
 
     projects = Column(JSON, default=[])
     experience = Column(JSON, default=[])
     scores = Column(JSON, nullable=False, default={})
+    local_scores = Column(JSON, nullable=True, default={})
 
     skills = Column(Text, nullable=True)
     upload_date = Column(
@@ -98,6 +122,88 @@ class Candidate(Base):
     project_uniqueness = Column(Float, nullable=False, default=0)
     project_variety    = Column(Float, nullable=False, default=0)
 
+    keyword_hits          = Column(Integer, nullable=False, default=0)
+    keyword_score         = Column(Float, nullable=False, default=0)
+    keywords_version      = Column(String(16), nullable=True)
+    entrepreneurial_score = Column(Float, nullable=False, default=0)
+
+    # Serve per-job filters and sorts in /api/candidates/query, and the grid
+    # prefilter of radius queries.
+    __table_args__ = (
+        Index("ix_candidates_job_id_gpa", "job_id", "gpa"),
+        Index("ix_candidates_job_id_upload_date", "job_id", "upload_date"),
+        Index("ix_candidates_job_id_geo_cell", "job_id", "geo_cell"),
+        Index("ix_candidates_job_id_entrepreneurial_score", "job_id", "entrepreneurial_score"),
+    )
+
+class ResumeFile(Base):
+    """
+    Represents one distinct uploaded resume file, stored by content hash.
+
+    Uploads with identical bytes share one file on disk and one parse,
+    however many times and to however many jobs they are uploaded.
+
+    Attributes:
+        sha256 (str): Primary key; hex SHA-256 of the file contents.
+        stored_name (str): Filename under the upload directory ("<sha256><ext>").
+        size (int): File size in bytes.
+        parsed (dict | None): parse_resume output for the file, once parsed.
+        parser_version (int | None): resume_parser.PARSER_VERSION that produced
+            parsed; a different version means the parse is stale.
+        created_at (datetime): Timestamp the file was first stored.
+    """
+    __tablename__ = "resume_files"
+
+    sha256 = Column(String(64), primary_key=True)
+    stored_name = Column(String, nullable=False)
+    size = Column(Integer, nullable=False, default=0)
+    parsed = Column(JSON, nullable=True)
+    parser_version = Column(Integer, nullable=True, index=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+class LLMCacheEntry(Base):
+    """
+    A cached OpenAI result, keyed by everything that determines it.
+
+    Attributes:
+        key (str): Primary key; hex SHA-256 over model, operation, prompt
+            version, requirement text and resume hash.
+        operation (str): Which call produced it (e.g. "score", "explain").
+        model (str): OpenAI model name.
+        prompt_version (int): Version of the prompt template used.
+        requirement (str): Requirement text (or joined requirements).
+        resume_hash (str): Hex SHA-256 of the anonymized resume ("" if none).
+        response (str): The cached result, serialized by the caller.
+        created_at (datetime): When the entry was stored.
+        last_used_at (datetime): Last hit or store; oldest entries are evicted first.
+    """
+    __tablename__ = "llm_cache"
+
+    key = Column(String(64), primary_key=True)
+    operation = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    prompt_version = Column(Integer, nullable=False)
+    requirement = Column(Text, nullable=False)
+    resume_hash = Column(String(64), nullable=False, default="")
+    response = Column(Text, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    last_used_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True,
+    )
+
+
 class Badge(Base):
     """
     Represents a reusable job requirement badge.
@@ -114,3 +220,75 @@ class Badge(Base):
     title = Column(String(255), nullable=False)
     reqText = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class IngestionJob(Base):
+    """
+    Represents a batch of uploaded resumes being parsed in the background.
+
+    Attributes:
+        id (int): Primary key.
+        job_id (int): Foreign key to the job the resumes are uploaded to.
+        status (str): One of "queued", "running", "completed" or "failed".
+        error (str | None): Reason the batch failed as a whole, if it did.
+        created_at (datetime): Timestamp the batch was uploaded.
+        started_at (datetime | None): Timestamp processing first started.
+        finished_at (datetime | None): Timestamp processing ended.
+        files (List[IngestionFile]): The files in the batch.
+    """
+    __tablename__ = "ingestion_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), index=True)
+    status = Column(String, nullable=False, default="queued", index=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    files = relationship(
+        "IngestionFile",
+        back_populates="ingestion",
+        order_by="IngestionFile.id",
+        cascade="all, delete-orphan",
+    )
+
+
+class IngestionFile(Base):
+    """
+    Represents one uploaded resume within a background ingestion batch.
+
+    Attributes:
+        id (int): Primary key.
+        ingestion_id (int): Foreign key to the owning IngestionJob.
+        filename (str): Original filename of the uploaded resume.
+        path (str): Where the upload is stored on disk.
+        file_hash (str | None): SHA-256 of the file (see ResumeFile).
+        size (int): File size in bytes.
+        status (str): One of "queued", "running", "done" or "failed".
+        error (str | None): Parse error for this file, if any.
+        candidate_id (int | None): Candidate created from the file.
+        started_at (datetime | None): Timestamp parsing started.
+        finished_at (datetime | None): Timestamp parsing ended.
+    """
+    __tablename__ = "ingestion_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    ingestion_id = Column(
+        Integer, ForeignKey("ingestion_jobs.id", ondelete="CASCADE"), index=True
+    )
+    filename = Column(String, nullable=False)
+    path = Column(String, nullable=False)
+    file_hash = Column(String(64), nullable=True)
+    size = Column(Integer, nullable=False, default=0)
+    status = Column(String, nullable=False, default="queued")
+    error = Column(Text, nullable=True)
+    candidate_id = Column(Integer, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    ingestion = relationship("IngestionJob", back_populates="files")
@@ -0,0 +1,167 @@
+"""
+ocr_service.py
+
+OCR for image resumes, run in a dedicated pool of worker processes.
+
+Each worker loads one easyocr Reader when it starts and keeps it for its
+lifetime, so the model lives only in the OCR workers and never in the web
+process. The pool is created on the first OCR job.
+
+Configuration (environment variables):
+    OCR_WORKERS      Number of OCR worker processes (default 1). 0 runs OCR
+                     inline in the calling process, loading the reader there.
+    OCR_MAX_PENDING  Maximum jobs queued or running at once before callers
+                     block (default 4 per worker).
+
+submit() and the helpers built on it block the calling thread, so async
+code must use submit_async() instead.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Union
+
+import metrics
+
+OCR_LANGUAGES = ["en"]
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "1"))
+OCR_MAX_PENDING = int(os.getenv("OCR_MAX_PENDING", str(4 * max(OCR_WORKERS, 1))))
+
+# An image file path or its raw bytes.
+ImageSource = Union[str, bytes]
+
+# Reader held by this process (an OCR worker, or the caller when inline).
+_reader = None
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(OCR_MAX_PENDING)
+
+
+def _load_reader() -> None:
+    """Load the easyocr model into this process. Used as the pool initializer."""
+    global _reader
+    if _reader is None:
+        import easyocr
+        _reader = easyocr.Reader(OCR_LANGUAGES)
+
+
+def _run_ocr(image: ImageSource) -> str:
+    """
+    Recognize the text in one image with this process's reader.
+
+    Args:
+        image: Image file path or raw bytes.
+
+    Returns:
+        The recognized text fragments joined by spaces.
+    """
+    _load_reader()
+    with metrics.OCR_SECONDS.time():
+        # Extract the text portion of each OCR result tuple.
+        return " ".join(item[1] for item in _reader.readtext(image))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=OCR_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_load_reader,
+                )
+    return _pool
+
+
+def submit(image: ImageSource) -> Future:
+    """
+    Queue one image for OCR, blocking while OCR_MAX_PENDING jobs are in flight.
+
+    Never call this from the event loop: waiting for a slot (or OCR itself,
+    when OCR_WORKERS is 0) would stall every request. Use submit_async().
+
+    Args:
+        image: Image file path or raw bytes.
+
+    Returns:
+        A Future resolving to the recognized text.
+    """
+    if OCR_WORKERS <= 0:
+        future: Future = Future()
+        try:
+            future.set_result(_run_ocr(image))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    _slots.acquire()
+    try:
+        future = metrics.submit_and_merge(_get_pool(), _run_ocr, image)
+    except Exception:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
+async def submit_async(image: ImageSource) -> str:
+    """
+    OCR one image from async code without blocking the event loop.
+
+    Waiting for a slot, or inline OCR when OCR_WORKERS is 0, happens in a
+    worker thread.
+
+    Args:
+        image: Image file path or raw bytes.
+
+    Returns:
+        The recognized text.
+    """
+    future = await asyncio.to_thread(submit, image)
+    return await asyncio.wrap_future(future)
+
+
+def ocr_image(image: ImageSource) -> str:
+    """
+    OCR a single image and wait for the result.
+
+    Args:
+        image: Image file path or raw bytes.
+
+    Returns:
+        The recognized text.
+    """
+    return submit(image).result()
+
+
+def ocr_images(images: List[ImageSource]) -> List[str]:
+    """
+    OCR many images across the worker pool.
+
+    Args:
+        images: Image file paths or raw bytes.
+
+    Returns:
+        The recognized text for each image, in input order.
+    """
+    futures = [submit(image) for image in images]
+    return [future.result() for future in futures]
+
+
+def shutdown(wait: bool = True) -> None:
+    """
+    Stop the OCR workers, if they were started.
+
+    Args:
+        wait: Block until running jobs finish.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+            _pool = None
@@ -0,0 +1,183 @@
+"""
+openai_client.py
+
+Async OpenAI chat completions with bounded concurrency, a token-bucket
+rate limiter and retry with exponential backoff.
+
+Every call waits for a concurrency slot and a rate-limit token before it
+is sent. Rate-limit (429), server (5xx), timeout and connection errors
+are retried with jittered exponential backoff, honoring Retry-After when
+the server sends it. Other errors are raised immediately.
+
+Configuration (environment variables):
+    OPENAI_MAX_CONCURRENCY   Requests in flight at once (default 8).
+    OPENAI_REQUESTS_PER_MINUTE  Sustained request rate (default 500).
+    OPENAI_BURST             Requests that may start back to back (default
+                             OPENAI_MAX_CONCURRENCY).
+    OPENAI_MAX_RETRIES       Retries per call after the first attempt (default 5).
+    OPENAI_BASE_URL          Read by the OpenAI SDK; point it at a local
+                             OpenAI-compatible server to test without the API.
+"""
+
+import asyncio
+import os
+import random
+import time
+import weakref
+from typing import Optional
+
+import openai
+
+import metrics
+
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+OPENAI_REQUESTS_PER_MINUTE = float(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+OPENAI_BURST = int(os.getenv("OPENAI_BURST", str(OPENAI_MAX_CONCURRENCY)))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+
+# Backoff before retry n (0-based) is uniform in [0, min(cap, base * 2**n)].
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 20.0
+
+_RETRYABLE = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+
+RETRIES = metrics.Counter(
+    "openai_request_retries",
+    "OpenAI chat completion attempts that were retried.",
+    ["operation"],
+)
+
+
+class TokenBucket:
+    """
+    Async token bucket: refills at rate tokens per second up to capacity,
+    and acquire() waits until a whole token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one has accumulated if necessary."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class _LoopState:
+    """Client and limiters for one event loop (asyncio primitives are loop-bound)."""
+
+    def __init__(self) -> None:
+        self.client = openai.AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=0,  # retries are handled here, under the rate limiter
+        )
+        self.slots = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+        self.bucket = TokenBucket(OPENAI_REQUESTS_PER_MINUTE / 60.0, OPENAI_BURST)
+
+
+_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+
+def _state() -> _LoopState:
+    loop = asyncio.get_running_loop()
+    state = _states.get(loop)
+    if state is None:
+        state = _states[loop] = _LoopState()
+    return state
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the server's requested delay from a failed response, if any.
+
+    Args:
+        error: The exception raised by the SDK.
+
+    Returns:
+        Seconds to wait, or None when the response gives no hint.
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000.0
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
+
+
+def backoff_delay(attempt: int, error: Optional[Exception] = None) -> float:
+    """
+    Delay before retrying after the given failed attempt.
+
+    Args:
+        attempt: 0-based number of the attempt that failed.
+        error: The exception it raised, checked for Retry-After.
+
+    Returns:
+        Seconds to sleep.
+    """
+    hinted = _retry_after(error) if error is not None else None
+    if hinted is not None:
+        return min(hinted, BACKOFF_CAP_SECONDS)
+    return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+async def chat_completion(operation: str, **kwargs):
+    """
+    Create a chat completion, rate-limited and retried on transient errors.
+
+    Latency of each attempt is recorded under the given operation name;
+    retries and final failures are counted.
+
+    Args:
+        operation: Metrics label, e.g. "score".
+        **kwargs: Arguments for chat.completions.create.
+
+    Returns:
+        The chat completion response.
+
+    Raises:
+        openai.OpenAIError: If the call fails with a non-retryable error, or
+            still fails after OPENAI_MAX_RETRIES retries.
+    """
+    state = _state()
+    attempt = 0
+    while True:
+        async with state.slots:
+            await state.bucket.acquire()
+            try:
+                with metrics.OPENAI_REQUEST_SECONDS.time(operation=operation):
+                    return await state.client.chat.completions.create(**kwargs)
+            except _RETRYABLE as e:
+                if attempt >= OPENAI_MAX_RETRIES:
+                    metrics.OPENAI_ERRORS.inc(operation=operation)
+                    raise
+                error = e
+            except Exception:
+                metrics.OPENAI_ERRORS.inc(operation=operation)
+                raise
+        # Back off outside the slot so other calls can proceed meanwhile.
+        RETRIES.inc(operation=operation)
+        await asyncio.sleep(backoff_delay(attempt, error))
+        attempt += 1
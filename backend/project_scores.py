@@ -0,0 +1,315 @@
+"""
+project_scores.py
+
+In-process TF-IDF scoring of candidate projects. Replaces the Node
+helpers in utils/ with a sparse, incrementally maintained index so that
+scoring a new upload does not rebuild the whole corpus.
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+# Tokens as produced by natural's WordTokenizer (used by calc_uniq.js).
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+# natural's default English stopword list, which TfIdf strips from documents.
+_STOPWORDS = frozenset("""
+about above after again all also am an and another any are as at be because
+been before being below between both but by came can cannot come could did do
+does doing down during each few for from further get got had has have having
+he her here hers herself him himself his how if in into is it its itself just
+like make many me might more most much must my myself never no nor not now of
+off on once only or other our ours ourselves out over own said same see should
+since so some still such take than that the their theirs them themselves then
+there these they this those through to too under until up very was way we well
+were what when where which while who whom why will with would you your yours
+yourself yourselves a b c d e f g h i j k l m n o p q r s t u v w x y z _
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens with stopwords removed.
+
+    Args:
+        text: Raw project text.
+
+    Returns:
+        List of tokens in document order.
+    """
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class UniquenessIndex:
+    """
+    Incremental TF-IDF corpus of candidates' projects.
+
+    Each candidate is one document (all of its projects joined), stored as
+    one row of raw term counts in growable CSR buffers. Adding a candidate
+    appends a row and updates the document-frequency table for its terms;
+    removing one zeroes its row, which is dropped at the next compaction.
+    idf is applied when scoring, so no add or remove rebuilds the matrix.
+    Weights follow natural's TfIdf: tf is the raw term count and
+    idf(t) = 1 + ln(N / (1 + df(t))).
+    """
+
+    # Compact once dead rows outnumber live ones (and there are at least this many).
+    _MIN_COMPACT_ROWS = 64
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._vocab: Dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._data = np.zeros(0, dtype=np.float64)
+        self._rows = 0
+        self._nnz = 0
+        self._row_of: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._row_of
+
+    def ids(self) -> List[int]:
+        """Return the ids of all indexed candidates."""
+        return list(self._row_of)
+
+    @staticmethod
+    def _grow(buffer: np.ndarray, size: int) -> np.ndarray:
+        if size <= len(buffer):
+            return buffer
+        grown = np.zeros(max(size, 2 * len(buffer)), dtype=buffer.dtype)
+        grown[: len(buffer)] = buffer
+        return grown
+
+    def add(self, doc_id: int, projects: Optional[Iterable[str]]) -> None:
+        """
+        Index (or re-index) a candidate's projects.
+
+        Args:
+            doc_id: Candidate id.
+            projects: The candidate's project strings.
+        """
+        counts = Counter(tokenize("\n".join(projects or [])))
+        with self._lock:
+            self._discard(doc_id)
+            term_ids = []
+            for term in counts:
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    term_id = self._vocab[term] = len(self._vocab)
+                term_ids.append(term_id)
+            self._df = self._grow(self._df, len(self._vocab))
+            if term_ids:
+                self._df[term_ids] += 1
+
+            end = self._nnz + len(term_ids)
+            self._indices = self._grow(self._indices, end)
+            self._data = self._grow(self._data, end)
+            self._indices[self._nnz:end] = term_ids
+            self._data[self._nnz:end] = list(counts.values())
+            self._indptr = self._grow(self._indptr, self._rows + 2)
+            self._indptr[self._rows + 1] = end
+            self._row_of[doc_id] = self._rows
+            self._rows += 1
+            self._nnz = end
+
+    def remove(self, doc_id: int) -> None:
+        """
+        Drop a candidate from the index. Unknown ids are ignored.
+
+        Args:
+            doc_id: Candidate id.
+        """
+        with self._lock:
+            self._discard(doc_id)
+
+    def _discard(self, doc_id: int) -> None:
+        row = self._row_of.pop(doc_id, None)
+        if row is None:
+            return
+        start, end = self._indptr[row], self._indptr[row + 1]
+        self._df[self._indices[start:end]] -= 1
+        self._data[start:end] = 0.0
+        dead = self._rows - len(self._row_of)
+        if dead > len(self._row_of) and dead >= self._MIN_COMPACT_ROWS:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the buffers without the rows of removed candidates."""
+        live = sorted(self._row_of.items(), key=lambda item: item[1])
+        starts = self._indptr[[row for _, row in live]]
+        ends = self._indptr[[row + 1 for _, row in live]]
+        keep = np.concatenate([np.arange(a, b) for a, b in zip(starts, ends)]) if live else np.zeros(0, dtype=np.int64)
+        self._indices = self._indices[keep]
+        self._data = self._data[keep]
+        self._indptr = np.concatenate(([0], np.cumsum(ends - starts))).astype(np.int64)
+        self._row_of = {doc_id: row for row, (doc_id, _) in enumerate(live)}
+        self._rows = len(live)
+        self._nnz = len(keep)
+
+    def _weighted(self):
+        """
+        Apply current idf to the stored term counts.
+
+        Returns:
+            Tuple of (row index by doc id, L2-normalized TF-IDF rows, norms).
+            Rows of removed candidates are all zero.
+        """
+        n_docs = len(self._row_of)
+        df = self._df[: len(self._vocab)]
+        idf = 1.0 + np.log(n_docs / (1.0 + df))
+        indices = self._indices[: self._nnz]
+        weighted = sparse.csr_matrix(
+            (self._data[: self._nnz] * idf[indices], indices, self._indptr[: self._rows + 1]),
+            shape=(self._rows, len(self._vocab)),
+        )
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        inv = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        return self._row_of, sparse.diags(inv) @ weighted, norms
+
+    def score(self, doc_id: int) -> float:
+        """
+        Compute a 0–100 uniqueness score for one indexed candidate.
+
+        The score is (1 − mean cosine similarity to every other candidate)
+        × 100. The mean is a single sparse dot product against the sum of
+        all normalized document vectors.
+
+        Args:
+            doc_id: Id of a candidate already added to the index.
+
+        Returns:
+            Uniqueness rounded to two decimals. 100.0 when there is nobody
+            to compare against, 0.0 when the candidate has no project text.
+        """
+        with self._lock:
+            if doc_id not in self._row_of:
+                raise KeyError(doc_id)
+            return self._scores([doc_id])[doc_id]
+
+    def score_all(self) -> Dict[int, float]:
+        """
+        Compute uniqueness for every indexed candidate in one pass.
+
+        Returns:
+            Mapping of candidate id to its 0–100 uniqueness score.
+        """
+        with self._lock:
+            return self._scores(list(self._row_of))
+
+    def _scores(self, doc_ids: List[int]) -> Dict[int, float]:
+        others = len(self._row_of) - 1
+        if others <= 0:
+            return {doc_id: 100.0 for doc_id in doc_ids}
+
+        row_of, unit, norms = self._weighted()
+        centroid = np.asarray(unit.sum(axis=0)).ravel()
+        rows = [row_of[doc_id] for doc_id in doc_ids]
+        # Each row's similarity to the centroid includes itself (cosine 1).
+        total_sim = unit[rows] @ centroid - 1.0
+
+        scores = {}
+        for doc_id, row, sim in zip(doc_ids, rows, total_sim):
+            if norms[row] == 0:
+                scores[doc_id] = 0.0
+                continue
+            mean_sim = float(sim) / others
+            scores[doc_id] = round(max(0.0, 1.0 - mean_sim) * 100, 2)
+        return scores
+
+
+# Tokens as produced by /\b\w+\b/g in calc_variety.js.
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+
+
+def variety_scores(candidates_projects: List[Optional[List[str]]]) -> List[float]:
+    """
+    Compute 0–100 project variety scores for many candidates at once.
+
+    For each candidate, projects are weighted with a smoothed TF-IDF over
+    that candidate's own projects (idf(t) = ln(1 + N / df(t))), and variety
+    is (1 − mean pairwise cosine similarity) × 100. All candidates are
+    stacked into one sparse matrix; the per-candidate pair sums come from
+    one grouped sparse product using sum_{i<j} u_i·u_j = (|Σu|² − n) / 2
+    over unit-length rows, so no pairwise loop is needed.
+
+    Args:
+        candidates_projects: One list of project strings per candidate.
+
+    Returns:
+        Variety scores rounded to two decimals, in input order. Candidates
+        with fewer than two non-blank projects score 0.0.
+    """
+    vocab: Dict[str, int] = {}
+    owners, rows, cols, counts = [], [], [], []
+    n_projects = np.zeros(len(candidates_projects), dtype=np.float64)
+    row = 0
+    for owner, projects in enumerate(candidates_projects):
+        valid = [p for p in (projects or []) if isinstance(p, str) and p.strip()]
+        if len(valid) <= 1:
+            continue
+        n_projects[owner] = len(valid)
+        for project in valid:
+            for term, count in Counter(_WORD_RE.findall(project.lower())).items():
+                rows.append(row)
+                cols.append(vocab.setdefault(term, len(vocab)))
+                counts.append(count)
+            owners.append(owner)
+            row += 1
+
+    scores = [0.0] * len(candidates_projects)
+    if not row:
+        return scores
+
+    owners = np.asarray(owners, dtype=np.int64)
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    tf = np.asarray(counts, dtype=np.float64)
+
+    # Document frequency of each (candidate, term) pair, read back per entry.
+    keys = owners[rows] * len(vocab) + cols
+    _, inverse, df = np.unique(keys, return_inverse=True, return_counts=True)
+    weights = tf * np.log(1.0 + n_projects[owners[rows]] / df[inverse])
+
+    matrix = sparse.csr_matrix((weights, (rows, cols)), shape=(row, len(vocab)))
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    nonzero = norms > 0
+    inv = np.divide(1.0, norms, out=np.zeros_like(norms), where=nonzero)
+    unit = sparse.diags(inv) @ matrix
+
+    # Zero-vector projects have an undefined cosine and are skipped, as in JS.
+    groups = sparse.csr_matrix(
+        (np.ones(row), (owners, np.arange(row))),
+        shape=(len(candidates_projects), row),
+    )
+    summed = groups @ unit
+    sq_norm = np.asarray(summed.multiply(summed).sum(axis=1)).ravel()
+    n_valid = groups @ nonzero.astype(np.float64)
+    n_pairs = n_valid * (n_valid - 1) / 2
+
+    for owner in np.flatnonzero(n_projects):
+        mean_sim = (sq_norm[owner] - n_valid[owner]) / 2 / n_pairs[owner] if n_pairs[owner] else 0.0
+        scores[owner] = round(max(0.0, 1.0 - float(mean_sim)) * 100, 2)
+    return scores
+
+
+def variety_score(projects: Optional[List[str]]) -> float:
+    """
+    Compute the 0–100 project variety score for a single candidate.
+
+    Args:
+        projects: The candidate's project strings.
+
+    Returns:
+        Variety score rounded to two decimals.
+    """
+    return variety_scores([projects])[0]
@@ -7,18 +7,46 @@ sections and extract fields such as name, location, contact details,
 education, skills, projects, experience, and GPA.
 """
 
+import io
 import os
 import re
-from typing import List, Dict
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Union
 
 import fitz               # PyMuPDF for PDF text extraction
-import easyocr            # OCR for image-based resumes
 import spacy
-from dateparser.search import search_dates
 from docx import Document
+from spacy.tokens import Doc
 
-# Preinstantiate OCR reader once per process to minimize startup overhead.
-reader = easyocr.Reader(["en"])
+import ocr_service        # OCR for image-based resumes, in worker processes
+from metrics import PARSE_STAGE_SECONDS
+
+# Version of the parse_resume output. Bump it whenever extraction changes
+# in a way that should refresh stored parses; the backend then re-parses
+# every stored resume in the background.
+PARSER_VERSION = 2
+
+# Extensions handled by OCR rather than a text-layer parser.
+IMAGE_EXTENSIONS = {".jpg", ".png"}
+
+# Optional caps on PDF text extraction, so long portfolios cannot stall a
+# worker. 0 (the default) reads the whole document.
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "0"))
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "0"))
+
+# A PDF given as a file path or as the raw bytes of an upload.
+PdfSource = Union[str, bytes]
+
+# spaCy model used for the PERSON / GPE fallbacks. Only NER is needed, so
+# the tagger, parser and lemmatizer are never loaded.
+SPACY_MODEL = "en_core_web_sm"
+_SPACY_EXCLUDE = ["tagger", "parser", "senter", "attribute_ruler", "lemmatizer"]
+
+_nlp = None
+_nlp_lock = threading.Lock()
 
 # Section headers to identify resume segments.
 _HEADERS = [
@@ -37,12 +65,27 @@ _SECTION_RE = re.compile(
     re.MULTILINE,
 )
 
-def parse_docx_text(file_path: str) -> str:
+# Field patterns, compiled once and shared by the extractors and scan_text().
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(
+    r'(\+?\d{1,2}\s*)?'               # optional country code
+    r'(\(\d{3}\)|\d{3})[\s\-.]?'      # area code
+    r'\d{3}[\s\-.]?\d{4}'             # subscriber number
+)
+GPA_RE = re.compile(r"GPA[:\s]*([0-4](?:\.\d{1,2})?)", re.IGNORECASE)
+NAME_LABEL_RE = re.compile(r'(?mi)^Name[:\s]+(.+)$')
+LOCATION_PIN_RE = re.compile(r'📍\s*([^|]+)')
+CITY_STATE_RE = re.compile(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*,\s*[A-Z]{2})')
+_DIGIT_RE = re.compile(r'\d')
+# First characters a section header line can start with.
+_HEADER_INITIALS = frozenset(c for h in _HEADERS for c in (h[0].lower(), h[0].upper()))
+
+def parse_docx_text(file_path) -> str:
     """
     Extract all paragraph text from a .docx file.
     
     Args:
-        file_path: Path to the .docx file.
+        file_path: Path to the .docx file, or a file-like object.
         
     Returns:
         A single string with paragraphs joined by newline.
@@ -63,10 +106,11 @@ def split_into_strict_sections(text: str) -> Dict[str, str]:
         A dict mapping each uppercase header to its corresponding body text.
         Headers that do not appear are omitted.
     """
-    matches = list(_SECTION_RE.finditer(text))
-    if not matches:
-        return {}
+    return _sections_from_matches(text, list(_SECTION_RE.finditer(text)))
 
+
+def _sections_from_matches(text: str, matches: List[re.Match]) -> Dict[str, str]:
+    """Slice each section body between consecutive header matches."""
     sections: Dict[str, str] = {}
     for i, match in enumerate(matches):
         header = match.group(1).upper()
@@ -91,12 +135,62 @@ def getExt(file_name: str) -> str:
     return extension
 
 
-def parseFileToText(fileName: str) -> str:
+def _open_pdf(source: PdfSource) -> fitz.Document:
     """
-    Extract raw text from a file given its name. Supports PDF, TXT, JPG, PNG.
+    Open a PDF from a path, or straight from an in-memory buffer.
 
     Args:
-        fileName: Path to the input file.
+        source: File path or raw PDF bytes.
+
+    Returns:
+        The opened PyMuPDF document.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def extract_pdf_text(
+    source: PdfSource,
+    max_pages: int = PDF_MAX_PAGES,
+    max_chars: int = PDF_MAX_CHARS,
+) -> str:
+    """
+    Extract the text of a PDF, optionally capped at max_pages pages and
+    max_chars characters.
+
+    Pages are read in the calling process: uploads are already parsed in
+    parallel, one file per parse worker.
+
+    Args:
+        source: File path, or the raw bytes of an upload (no temp file needed).
+        max_pages: Maximum number of pages to read; 0 for all.
+        max_chars: Maximum number of characters to return; 0 for all.
+
+    Returns:
+        Concatenated page text.
+    """
+    pages, total = [], 0
+    with _open_pdf(source) as doc:
+        page_count = min(doc.page_count, max_pages) if max_pages > 0 else doc.page_count
+        for number in range(page_count):
+            page_text = doc[number].get_text()
+            pages.append(page_text)
+            total += len(page_text)
+            if 0 < max_chars <= total:
+                break
+    text = "".join(pages)
+    return text[:max_chars] if max_chars > 0 else text
+
+
+def parseFileToText(fileName: str, data: Optional[bytes] = None) -> str:
+    """
+    Extract raw text from a file given its name. Supports PDF, TXT, DOCX, JPG, PNG.
+
+    Args:
+        fileName: Path to the input file (its extension selects the parser).
+        data: The file's contents, if already in memory. The file is then
+            not read from disk.
 
     Returns:
         Concatenated text content of the file.
@@ -105,19 +199,17 @@ def parseFileToText(fileName: str) -> str:
     result_text = ""
 
     if extension == ".pdf":
-        doc = fitz.open(fileName)
-        for page in doc:
-            result_text += page.get_text()
+        result_text = extract_pdf_text(data if data is not None else fileName)
     elif extension == ".txt":
-        with open(fileName, encoding="utf-8") as f:
-            result_text = f.read()
+        if data is not None:
+            result_text = data.decode("utf-8")
+        else:
+            with open(fileName, encoding="utf-8") as f:
+                result_text = f.read()
     elif extension == ".docx":
-        result_text = parse_docx_text(fileName)
-    elif extension in {".jpg", ".png"}:
-        ocr_results = reader.readtext(fileName)
-        # Extract the text portion of each OCR result tuple.
-        texts = [item[1] for item in ocr_results]
-        result_text = " ".join(texts)
+        result_text = parse_docx_text(io.BytesIO(data) if data is not None else fileName)
+    elif extension in IMAGE_EXTENSIONS:
+        result_text = ocr_service.ocr_image(data if data is not None else fileName)
 
     return result_text
 
@@ -141,20 +233,120 @@ DEGREE_KEYWORDS = [
     r"\bMaster\b",   r"\bM\.S\.?\b", r"\bMA\b",  r"\bMSc\b",
     r"\bPh\.?D\b",   r"\bDoctor\b",      r"\bAssociate\b"
 ]
+# Every keyword starts with \b and a letter; the lookahead skips other positions quickly.
+_DEGREE_INITIALS = "".join(sorted({kw[2].lower() for kw in DEGREE_KEYWORDS}))
+DEGREE_RE = re.compile(rf"(?=[{_DEGREE_INITIALS}])(?:{'|'.join(DEGREE_KEYWORDS)})", re.IGNORECASE)
+IN_PROGRESS_RE = re.compile(r"expected|in progress|ongoing", re.IGNORECASE)
+
+# Common degree date formats: "May 15, 2020", "May 2024", "12/2025", "2019".
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+DATE_RE = re.compile(
+    rf"\b{_MONTH}\s+\d{{1,2}},\s*\d{{4}}\b"
+    rf"|\b{_MONTH}\s+\d{{4}}\b"
+    r"|\b(?:0?[1-9]|1[0-2])/\d{4}\b"
+    r"|\b(?:19|20)\d{2}\b",
+    re.IGNORECASE,
+)
+# Text left over after removing the dates above that dateparser may read as a
+# date of its own (stray numbers, month/day words, "Aug.").
+_AMBIGUOUS_DATE_RE = re.compile(
+    rf"\d|\b(?:{_MONTH}|mon|tue|wed|thu|fri|sat|sun|to|present|now|today|ago)\b|\w\.",
+    re.IGNORECASE,
+)
+# dateparser reads far more than dates: acronyms ("MIT", "MBA" look like
+# time zones), joining words next to a date ("Class of 2022" gives "of
+# 2022"), words it takes for another language ("Cum"), ":" and "/" as time
+# and date separators, and neighbouring dates run together ("10/2022, June").
+# So a line only skips it when it has one date, every word left after
+# removing it and the degree abbreviations dateparser ignores is one of
+# these, no joining word touches the date, and the only other characters
+# are plain punctuation.
+_SAFE_WORDS = frozenset("""
+    accounting administration aerospace agriculture analytics and
+    anthropology applied architecture arts associate associates bachelor
+    bachelors behavioral biochemistry biology biomedical business chain
+    chemical chemistry civil cognitive college commerce communication
+    communications community computer concentration data dean degree dental
+    design distinction doctor economic economics education electrical
+    electronics engineering english environmental film finance fine for
+    general geography geology graduate graduated health history honors
+    honours human in industrial information institute instrumentation
+    international journalism language languages laude law liberal life
+    linguistics list magna major management marketing master masters math
+    mathematical mathematics mechanical medical medicine minor music
+    neuroscience nursing of operations pharmacy philosophy physical physics
+    policy political production psychology public relations religion
+    research resources school science sciences social sociology software
+    state statistics studies summa supply systems technical technology
+    telecommunication theater undergraduate university veterinary with
+""".split())
+_WORD_RE = re.compile(r"([^\W\d_]+)(?:'s)?")
+_OTHER_CHAR_RE = re.compile(r"[^\w\s,;\-–—()']")
+_JOINED_DATE_RE = re.compile(
+    rf"\b(?:about|ad|and|at|by|from|in|of|on|the|to|with)[\s,;:\-–—/()]*(?:{DATE_RE.pattern})"
+    rf"|(?:{DATE_RE.pattern})[\s,;:\-–—/()]*(?:about|ad|and|at|by|from|in|of|on|the|to|with)\b",
+    re.IGNORECASE,
+)
+# dateparser finds no date at all in an unspaced range like "2019-2023".
+_HYPHEN_RANGE_RE = re.compile(r"\d-\d")
+_SAFE_DEGREE_RE = re.compile(r"(?<!\w)(?:B\.S\.?|Ph\.?D\.?|BSc|MSc|BS|BA)(?!\w)")
 
 
-def extract_name(text: str) -> str:
+def get_nlp():
     """
-    Identify candidate's name using a three-step strategy:
-      1) Heuristic on the first non-empty line (2–4 capitalized words).
-      2) Regex for 'Name: John Doe'.
-      3) spaCy NER for PERSON entities.
+    Return the process-wide spaCy NER pipeline, loading it on first use.
+
+    Returns:
+        The loaded spaCy Language object.
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                _nlp = spacy.load(SPACY_MODEL, exclude=_SPACY_EXCLUDE)
+    return _nlp
+
+
+@lru_cache(maxsize=8)
+def ner_doc(text: str) -> Doc:
+    """
+    Run NER over a resume once and share the result between extractors.
 
     Args:
         text: Full resume text.
 
     Returns:
-        Detected name in title case, or an empty string if none found.
+        The spaCy Doc for the text.
+    """
+    return get_nlp()(text)
+
+
+def ner_pipe(texts: Iterable[str], batch_size: int = 32) -> List[Doc]:
+    """
+    Run NER over many resumes in batches via nlp.pipe.
+
+    Args:
+        texts: Resume texts.
+        batch_size: Number of texts per spaCy batch.
+
+    Returns:
+        One Doc per input text, in order.
+    """
+    return list(get_nlp().pipe(texts, batch_size=batch_size))
+
+
+def _name_without_ner(text: str) -> str:
+    """
+    Apply the first-line heuristic and 'Name:' regex steps of extract_name.
+
+    Args:
+        text: Full resume text.
+
+    Returns:
+        The raw name match, or an empty string if NER would be needed.
     """
     # Step 1: first-line heuristic
     for line in text.splitlines():
@@ -163,30 +355,89 @@ def extract_name(text: str) -> str:
             continue
         parts = candidate.split()
         if 2 <= len(parts) <= 4 and all(p[0].isupper() for p in parts):
-            name = candidate
-            break
+            return candidate
         break
-    else:
-        name = ""
 
     # Step 2: regex fallback
-    if not name:
-        m = re.search(r'(?mi)^Name[:\s]+(.+)$', text)
-        if m:
-            name = m.group(1).strip()
+    m = NAME_LABEL_RE.search(text)
+    if m:
+        return m.group(1).strip()
+
+    return ""
+
+
+def _location_without_ner(text: str) -> str:
+    """
+    Apply the bullet and 'City, ST' regex steps of extract_location.
+
+    Args:
+        text: Full resume text.
+
+    Returns:
+        The location match, or an empty string if NER would be needed.
+    """
+    # Pattern 1: bullet icon
+    m = LOCATION_PIN_RE.search(text)
+    if m:
+        return m.group(1).strip()
+
+    # Pattern 2: City, ST
+    m = CITY_STATE_RE.search(text)
+    if m:
+        return m.group(1)
+
+    return ""
+
+
+def needs_ner(text: str) -> bool:
+    """
+    Tell whether name or location extraction will fall back to spaCy.
+
+    Args:
+        text: Full resume text.
+
+    Returns:
+        True if either extractor's regex steps come up empty.
+    """
+    return not _name_without_ner(text) or not _location_without_ner(text)
+
+
+def extract_name(text: str, doc: Optional[Doc] = None) -> str:
+    """
+    Identify candidate's name using a three-step strategy:
+      1) Heuristic on the first non-empty line (2–4 capitalized words).
+      2) Regex for 'Name: John Doe'.
+      3) spaCy NER for PERSON entities.
+
+    Args:
+        text: Full resume text.
+        doc: Optional precomputed NER Doc for the text.
+
+    Returns:
+        Detected name in title case, or an empty string if none found.
+    """
+    name = _name_without_ner(text)
 
     # Step 3: spaCy NER fallback
     if not name:
-        nlp = spacy.load("en_core_web_sm")
-        for ent in nlp(text).ents:
-            if ent.label_ == "PERSON":
-                name = ent.text
-                break
+        name = _first_entity(doc if doc is not None else ner_doc(text), "PERSON")
+
+    return _title_case(name)
+
 
+def _first_entity(doc: Doc, label: str) -> str:
+    """Return the text of the first entity with the given label, or ""."""
+    for ent in doc.ents:
+        if ent.label_ == label:
+            return ent.text
+    return ""
+
+
+def _title_case(name: str) -> str:
     return " ".join(part.capitalize() for part in name.lower().split())
 
 
-def extract_location(text: str) -> str:
+def extract_location(text: str, doc: Optional[Doc] = None) -> str:
     """
     Identify candidate's location using:
       1) Bullet symbol pattern '📍 City, State'.
@@ -195,27 +446,17 @@ def extract_location(text: str) -> str:
 
     Args:
         text: Full resume text.
+        doc: Optional precomputed NER Doc for the text.
 
     Returns:
         First matching location, or an empty string.
     """
-    # Pattern 1: bullet icon
-    m = re.search(r'📍\s*([^|]+)', text)
-    if m:
-        return m.group(1).strip()
-
-    # Pattern 2: City, ST
-    m = re.search(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*,\s*[A-Z]{2})', text)
-    if m:
-        return m.group(1)
+    location = _location_without_ner(text)
+    if location:
+        return location
 
     # Pattern 3: spaCy NER fallback
-    nlp = spacy.load("en_core_web_sm")
-    for ent in nlp(text).ents:
-        if ent.label_ == "GPE":
-            return ent.text
-
-    return ""
+    return _first_entity(doc if doc is not None else ner_doc(text), "GPE")
 
 
 def extract_email(text: str) -> str:
@@ -228,7 +469,7 @@ def extract_email(text: str) -> str:
     Returns:
         Email string if found, otherwise empty.
     """
-    m = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    m = EMAIL_RE.search(text)
     return m.group(0) if m else ""
 
 
@@ -248,15 +489,60 @@ def extract_phone(text: str) -> str:
     Returns:
         Phone number string if found, otherwise empty.
     """
-    pattern = (
-        r'(\+?\d{1,2}\s*)?'               # optional country code
-        r'(\(\d{3}\)|\d{3})[\s\-.]?'      # area code
-        r'\d{3}[\s\-.]?\d{4}'             # subscriber number
-    )
-    m = re.search(pattern, text)
+    m = PHONE_RE.search(text)
     return m.group(0) if m else ""
 
 
+def extract_gpa(text: str) -> Optional[float]:
+    """
+    Find the first GPA value in the text.
+
+    Args:
+        text: Full resume text.
+
+    Returns:
+        GPA as a float if found, otherwise None.
+    """
+    m = GPA_RE.search(text)
+    return float(m.group(1)) if m else None
+
+
+def _search_dates(line: str):
+    # dateparser loads its locale data on import, so only pay for it when needed.
+    from dateparser.search import search_dates
+    return search_dates(line)
+
+
+def extract_degree_date(line: str) -> str:
+    """
+    Find the first date on a degree line.
+
+    Lines with at most one date, in a format of DATE_RE, whose other words
+    are all plain degree words (_SAFE_WORDS), are resolved directly.
+    Anything else goes to dateparser, so the result matches what
+    dateparser returns.
+
+    Args:
+        line: A single resume line.
+
+    Returns:
+        The matched date text, or "" if there is none.
+    """
+    rest, date_count = DATE_RE.subn(" ", line)
+    rest = _SAFE_DEGREE_RE.sub(" ", rest)
+    if date_count <= 1 and not (
+        _AMBIGUOUS_DATE_RE.search(rest)
+        or _OTHER_CHAR_RE.search(rest)
+        or _HYPHEN_RANGE_RE.search(line)
+        or _JOINED_DATE_RE.search(line)
+        or any(word.lower() not in _SAFE_WORDS for word in _WORD_RE.findall(rest))
+    ):
+        m = DATE_RE.search(line)
+        return m.group(0) if m else ""
+    dates = _search_dates(line)
+    return dates[0][0] if dates else ""
+
+
 def extract_degrees(text: str):
     """
     Scan lines for academic degree indicators and optional dates.
@@ -269,19 +555,23 @@ def extract_degrees(text: str):
           earned      – [(degree_line, date_str), ...]
           in_progress – same format for ongoing studies.
     """
+    return classify_degree_lines(line for line in text.splitlines() if DEGREE_RE.search(line))
+
+
+def classify_degree_lines(lines: Iterable[str]):
+    """
+    Split degree lines into earned and in-progress, with their dates.
+
+    Args:
+        lines: Lines already known to mention a degree.
+
+    Returns:
+        The same (earned, in_progress) tuple as extract_degrees.
+    """
     earned, in_progress = [], []
-    for line in text.splitlines():
-        for pat in DEGREE_KEYWORDS:
-            if re.search(pat, line, re.IGNORECASE):
-                dates = search_dates(line)
-                date_str = dates[0][0] if dates else ""
-                target = (
-                    in_progress
-                    if re.search(r"expected|in progress|ongoing", line, re.IGNORECASE)
-                    else earned
-                )
-                target.append((line.strip(), date_str))
-                break
+    for line in lines:
+        target = in_progress if IN_PROGRESS_RE.search(line) else earned
+        target.append((line.strip(), extract_degree_date(line)))
     return earned, in_progress
 
 
@@ -315,7 +605,93 @@ def extract_skills_section(text: str) -> List[str]:
     return items
 
 
-def parse_resume(path: str) -> dict:
+def _search_from(pattern: re.Pattern, text: str, pos: Optional[int]) -> Optional[re.Match]:
+    """Search from pos, the start of the first line a match could begin on."""
+    return pattern.search(text, pos) if pos is not None else None
+
+
+def scan_text(text: str) -> dict:
+    """
+    Collect the regex-based resume fields in a single pass over the lines.
+
+    Each line is checked once with cheap tests that tell whether a field's
+    match could start on it (an '@' for email, a digit for phone, ...) and
+    whether it may be a section header. A field's compiled pattern then runs
+    once, from the first such line, so the results are exactly those of
+    extract_email, extract_phone, extract_gpa, the regex steps of
+    extract_name / extract_location, split_into_strict_sections and the
+    degree-line filter of extract_degrees.
+
+    Args:
+        text: Full resume text.
+
+    Returns:
+        Dict with keys 'name' and 'location' (regex steps only, "" when NER
+        is needed), 'email', 'phone', 'gpa', 'sections' and 'degree_lines'.
+    """
+    lines = text.splitlines()
+    starts = [0, *accumulate(map(len, text.splitlines(keepends=True)))]
+
+    first_line = None
+    email_at = phone_at = gpa_at = name_label_at = pin_at = city_at = None
+    headers: List[re.Match] = []
+    for line, offset in zip(lines, starts):
+        if first_line is None and line.strip():
+            first_line = line.strip()
+        if email_at is None and "@" in line:
+            email_at = offset
+        if phone_at is None and _DIGIT_RE.search(line):
+            phone_at = offset
+        if gpa_at is None and "gpa" in line.lower():
+            gpa_at = offset
+        if name_label_at is None and line[:4].lower() == "name":
+            name_label_at = offset
+        if pin_at is None and "📍" in line:
+            pin_at = offset
+        if city_at is None and "," in line:
+            city_at = offset
+        if line[:1] in _HEADER_INITIALS:
+            header = _SECTION_RE.match(text, offset)
+            if header:
+                headers.append(header)
+
+    # Degree keywords never span lines, so one search over the whole text
+    # finds every line that extract_degrees would keep.
+    degree_rows = sorted({bisect_right(starts, m.start()) - 1 for m in DEGREE_RE.finditer(text)})
+    degree_lines = [lines[row] for row in degree_rows]
+
+    # extract_name steps 1 and 2.
+    name = ""
+    parts = first_line.split() if first_line else []
+    if 2 <= len(parts) <= 4 and all(p[0].isupper() for p in parts):
+        name = first_line
+    else:
+        m = _search_from(NAME_LABEL_RE, text, name_label_at)
+        name = m.group(1).strip() if m else ""
+
+    # extract_location patterns 1 and 2.
+    m = _search_from(LOCATION_PIN_RE, text, pin_at)
+    if m:
+        location = m.group(1).strip()
+    else:
+        m = _search_from(CITY_STATE_RE, text, city_at)
+        location = m.group(1) if m else ""
+
+    email = _search_from(EMAIL_RE, text, email_at)
+    phone = _search_from(PHONE_RE, text, phone_at)
+    gpa = _search_from(GPA_RE, text, gpa_at)
+    return {
+        "name": name,
+        "location": location,
+        "email": email.group(0) if email else "",
+        "phone": phone.group(0) if phone else "",
+        "gpa": float(gpa.group(1)) if gpa else None,
+        "sections": _sections_from_matches(text, headers),
+        "degree_lines": degree_lines,
+    }
+
+
+def parse_resume(path: str, text: Optional[str] = None) -> dict:
     """
     Orchestrate full resume parsing pipeline.
 
@@ -328,6 +704,8 @@ def parse_resume(path: str) -> dict:
 
     Args:
         path: File path to the resume.
+        text: Already-extracted text for the file (e.g. from the OCR pool).
+            When given, step 1 is skipped.
 
     Returns:
         Dictionary with keys:
@@ -335,27 +713,80 @@ def parse_resume(path: str) -> dict:
           projects, experience, degrees_earned,
           degrees_in_progress, gpa.
     """
-    text = parseFileAtPathToText(path)
-    name = extract_name(text)
-    location = extract_location(text)
-    email = extract_email(text)
-    phone = extract_phone(text)
-    earned, in_progress = extract_degrees(text)
+    if text is None:
+        with PARSE_STAGE_SECONDS.time(stage="extraction"):
+            text = parseFileAtPathToText(path)
+    return parse_text(text)
+
+
+def parse_resumes(paths: List[str], batch_size: int = 32) -> List[dict]:
+    """
+    Parse many resumes, running spaCy NER in batches via nlp.pipe.
+
+    Image resumes are OCR'd concurrently in the OCR worker pool, and only
+    resumes whose name or location cannot be found by the regex steps are
+    sent through the NER pipeline.
+
+    Args:
+        paths: File paths to the resumes.
+        batch_size: Number of texts per spaCy batch.
+
+    Returns:
+        One parse_resume-style dictionary per path, in order.
+    """
+    # Images go to the OCR pool together so they are recognized in parallel.
+    images = [i for i, path in enumerate(paths) if getExt(path) in IMAGE_EXTENSIONS]
+    ocr_texts = dict(zip(images, ocr_service.ocr_images([paths[i] for i in images])))
+    texts = [
+        ocr_texts[i] if i in ocr_texts else parseFileAtPathToText(path)
+        for i, path in enumerate(paths)
+    ]
+    scans = [scan_text(text) for text in texts]
+    pending = [i for i, scan in enumerate(scans) if not scan["name"] or not scan["location"]]
+    docs = dict(zip(pending, ner_pipe((texts[i] for i in pending), batch_size)))
+    return [parse_text(text, docs.get(i), scans[i]) for i, text in enumerate(texts)]
+
+
+def parse_text(text: str, doc: Optional[Doc] = None, scan: Optional[dict] = None) -> dict:
+    """
+    Extract structured fields from already-extracted resume text.
 
-    sections = split_into_strict_sections(text)
+    Args:
+        text: Full resume text.
+        doc: Optional precomputed NER Doc for the text. When omitted and
+            NER is needed, the text is parsed once and shared by the
+            name and location extractors.
+        scan: Optional precomputed scan_text() result for the text.
+
+    Returns:
+        Dictionary with the same keys as parse_resume.
+    """
+    if scan is None:
+        with PARSE_STAGE_SECONDS.time(stage="scan"):
+            scan = scan_text(text)
+    name, location = scan["name"], scan["location"]
+    if doc is None and (not name or not location):
+        with PARSE_STAGE_SECONDS.time(stage="ner"):
+            doc = ner_doc(text)
+
+    name = _title_case(name or _first_entity(doc, "PERSON"))
+    location = location or _first_entity(doc, "GPE")
+    email = scan["email"]
+    phone = scan["phone"]
+    with PARSE_STAGE_SECONDS.time(stage="degrees"):
+        earned, in_progress = classify_degree_lines(scan["degree_lines"])
+
+    sections = scan["sections"]
     skills_raw = max(
         [sections.get("SKILLS", ""), sections.get("TECHNICAL SKILLS", "")],
         key=len
     )
     skills = skills_raw.strip()
-    projects = split_projects_by_bullets(sections.get("PROJECTS", ""))
-    experience = split_projects_by_bullets(sections.get("EXPERIENCE", ""))
-
-    def extract_gpa(txt: str) -> float | None:
-        m = re.search(r"GPA[:\s]*([0-4](?:\.\d{1,2})?)", txt, re.IGNORECASE)
-        return float(m.group(1)) if m else None
+    with PARSE_STAGE_SECONDS.time(stage="projects"):
+        projects = split_projects_by_bullets(sections.get("PROJECTS", ""))
+        experience = split_projects_by_bullets(sections.get("EXPERIENCE", ""))
 
-    gpa = extract_gpa(text)
+    gpa = scan["gpa"]
 
     return {
         "text": text,
@@ -0,0 +1,237 @@
+"""
+search_index.py
+
+Full-text keyword search over candidates with an SQLite FTS5 table.
+
+candidate_fts holds a copy of each candidate's text, skills, projects and
+experience, with the candidate id as its rowid. Triggers on the
+candidates table keep it in sync on every insert, update and delete, so
+uploads, background ingestion, re-parses and bulk deletes need no extra
+code. install() creates the table and triggers and fills the table from
+existing candidates the first time it runs, or again whenever their
+definitions change.
+
+The tokenizer keeps "+" and "#" inside words, so "C++" and "C#" are
+searchable words of their own rather than "c". Project and experience
+entries are indexed by their string values only, not their JSON keys.
+"""
+
+import html
+import re
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+FTS_TABLE = "candidate_fts"
+
+# bm25() weight per FTS column, in table order. job_id is only stored for
+# filtering; a match in skills counts for more than one in passing.
+COLUMN_WEIGHTS = {"job_id": 0.0, "text": 1.0, "skills": 2.0, "projects": 1.5, "experience": 1.5}
+
+# Tokens around each match in a snippet.
+SNIPPET_TOKENS = 12
+
+# Markers snippet() puts around matches; replaced with <mark> after escaping.
+_MATCH_START, _MATCH_END = "\x02", "\x03"
+
+_WORD_RE = re.compile(r"\w")
+
+# Terms of only these characters are matched as prefixes; others, like
+# "C++" or ".NET", only as whole words.
+_PREFIX_TERM_RE = re.compile(r"[\w\s]+")
+
+
+def _joined_list(column: str) -> str:
+    """SQL joining the strings in a JSON column with newlines, at any depth (NULL if none or invalid)."""
+    return (
+        f"(SELECT group_concat(value, char(10)) FROM json_tree("
+        f"CASE WHEN json_valid({column}) THEN {column} ELSE '[]' END) WHERE type = 'text')"
+    )
+
+
+_INSERT_ROW = f"""
+    INSERT INTO {FTS_TABLE}(rowid, job_id, text, skills, projects, experience)
+    VALUES (NEW.id, NEW.job_id, NEW.text, NEW.skills,
+            {_joined_list("NEW.projects")}, {_joined_list("NEW.experience")});
+"""
+
+_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        job_id UNINDEXED, text, skills, projects, experience,
+        tokenize = "unicode61 remove_diacritics 2 tokenchars '+#'",
+        prefix = '2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON candidates BEGIN
+        {_INSERT_ROW}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update
+    AFTER UPDATE OF job_id, text, skills, projects, experience ON candidates BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.id;
+        {_INSERT_ROW}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON candidates BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.id;
+    END
+    """,
+]
+
+
+_TRIGGERS = (f"{FTS_TABLE}_insert", f"{FTS_TABLE}_update", f"{FTS_TABLE}_delete")
+
+
+def install(engine: Engine) -> None:
+    """
+    Create the search table and its sync triggers if missing, and index
+    existing candidates when the table is new. Does nothing on databases
+    other than SQLite.
+
+    Args:
+        engine: Engine bound to the application database.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as conn:
+        stored = {
+            row.name: row.sql
+            for row in conn.execute(text(
+                "SELECT name, sql FROM sqlite_master WHERE name = :name OR tbl_name = 'candidates'"
+            ), {"name": FTS_TABLE})
+        }
+        is_new = FTS_TABLE not in stored
+        if not is_new and not _is_current(stored):
+            # Tokenizer or trigger changed: rebuild the index from scratch.
+            for name in _TRIGGERS:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+            is_new = True
+        for statement in _DDL:
+            conn.execute(text(statement))
+        if is_new:
+            conn.execute(text(f"""
+                INSERT INTO {FTS_TABLE}(rowid, job_id, text, skills, projects, experience)
+                SELECT id, job_id, text, skills,
+                       {_joined_list("projects")}, {_joined_list("experience")}
+                FROM candidates
+            """))
+
+
+def _normalized(sql: str) -> str:
+    return " ".join(sql.replace("IF NOT EXISTS ", "").split())
+
+
+def _is_current(stored: dict) -> bool:
+    """Whether the stored table and trigger definitions match _DDL."""
+    return all(
+        name in stored and _normalized(stored[name]) == _normalized(statement)
+        for name, statement in zip((FTS_TABLE, *_TRIGGERS), _DDL)
+    )
+
+
+def build_match(terms: List[str], mode: str) -> Optional[str]:
+    """
+    Turn search terms into an FTS5 MATCH expression.
+
+    Each term is matched as a phrase whose last word may be a prefix, so
+    "java" also finds "javascript" and "machine learn" finds "machine
+    learning". Terms with punctuation ("C++", "C#", ".NET") are matched
+    as whole words only, so "C++" does not find "cook".
+
+    Args:
+        terms: Words or phrases to look for.
+        mode: "any" to match candidates with at least one term, "all" for
+            candidates with every term.
+
+    Returns:
+        The MATCH expression, or None if no term has a searchable word.
+    """
+    phrases = [
+        '"' + term.replace('"', '""') + '"' + ("*" if _PREFIX_TERM_RE.fullmatch(term) else "")
+        for term in (t.strip() for t in terms)
+        if _WORD_RE.search(term)
+    ]
+    if not phrases:
+        return None
+    return (" AND " if mode == "all" else " OR ").join(phrases)
+
+
+def matching_ids(terms: List[str], mode: str = "any") -> Optional[TextClause]:
+    """
+    Build a subquery of the ids of candidates matching search terms, for
+    use in an IN filter.
+
+    Args:
+        terms: Words or phrases to look for (see build_match).
+        mode: "any" or "all".
+
+    Returns:
+        A SELECT of candidate ids, or None if no term has a searchable word.
+    """
+    match = build_match(terms, mode)
+    if match is None:
+        return None
+    return text(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match").bindparams(match=match)
+
+
+def search(
+    db: Session,
+    terms: List[str],
+    mode: str = "any",
+    job_id: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[dict]:
+    """
+    Find candidates matching search terms, best matches first.
+
+    Args:
+        db: Active database session.
+        terms: Words or phrases to look for (see build_match).
+        mode: "any" or "all".
+        job_id: Only search this job's candidates, if given.
+        limit: Maximum number of results; None for all.
+
+    Returns:
+        One {"id", "score", "snippet"} per match. score is the BM25
+        relevance (higher is better); snippet is HTML-escaped text around
+        the best match with matches wrapped in <mark>.
+    """
+    match = build_match(terms, mode)
+    if match is None:
+        return []
+
+    weights = ", ".join(str(w) for w in COLUMN_WEIGHTS.values())
+    sql = f"""
+        SELECT rowid AS id,
+               -bm25({FTS_TABLE}, {weights}) AS score,
+               snippet({FTS_TABLE}, -1, :start, :end, '…', :tokens) AS snippet
+        FROM {FTS_TABLE}
+        WHERE {FTS_TABLE} MATCH :match
+    """
+    params = {"match": match, "start": _MATCH_START, "end": _MATCH_END, "tokens": SNIPPET_TOKENS}
+    if job_id is not None:
+        sql += " AND job_id = :job_id"
+        params["job_id"] = job_id
+    sql += " ORDER BY score DESC, id"
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = limit
+
+    return [
+        {
+            "id": row.id,
+            "score": round(row.score, 4),
+            "snippet": html.escape(row.snippet or "")
+                .replace(_MATCH_START, "<mark>")
+                .replace(_MATCH_END, "</mark>"),
+        }
+        for row in db.execute(text(sql), params)
+    ]
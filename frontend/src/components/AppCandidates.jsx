@@ -65,6 +65,16 @@ const FILTERED_CITIES = cities.filter(
 // flatten to "City, State" strings
 const cityOptions = FILTERED_CITIES.map((c) => `${c.name}, ${c.admin1}`);
 
+// fields the table needs from /api/candidates (keyword search and the
+// entrepreneurial keyword count run on the server, so text is not needed)
+const CANDIDATE_FIELDS = [
+  "name", "location", "email", "phone", "gpa",
+  "degrees_earned", "degrees_in_progress", "projects", "experience",
+  "skills", "upload_date", "project_uniqueness", "project_variety",
+  "keyword_score", "entrepreneurial_score",
+].join(",");
+const CANDIDATE_PAGE_SIZE = 500;
+
 import { unparse } from "papaparse";
 
 export default function AppCandidates({ jobId }) {
@@ -98,6 +108,11 @@ export default function AppCandidates({ jobId }) {
   const [showEntrepreneurial, setShowEntrepreneurial] = useState(false);
   const [cityOptionsAsync, setCityOptionsAsync] = useState([]);
   const [cityLoading, setCityLoading] = useState(false);
+  // ids matching the keyword search, or null when there is no search term
+  const [searchMatches, setSearchMatches] = useState(null);
+  // ids within `distance` miles of the chosen location, or null when the
+  // distance filter is off
+  const [nearbyMatches, setNearbyMatches] = useState(null);
 
   // collapse state
   const [filtersCollapsed, setFiltersCollapsed] = useState(false);
@@ -117,6 +132,62 @@ export default function AppCandidates({ jobId }) {
       .catch(console.error);
   }, []);
 
+  // Keyword search runs on the server (full-text index over resume text,
+  // skills, projects and experience); debounced while typing
+  useEffect(() => {
+    const q = searchTerm
+      .split(",")
+      .map((t) => t.trim())
+      .filter(Boolean)
+      .join(",");
+    if (!q) {
+      setSearchMatches(null);
+      return;
+    }
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const { data } = await axios.get("/api/candidates/search", {
+          params: { q, jobId, mode: requireAll ? "all" : "any" },
+          signal: controller.signal,
+        });
+        setSearchMatches(new Set(data.map((m) => m.id)));
+      } catch (err) {
+        if (!axios.isCancel(err)) console.error("search failed:", err);
+      }
+    }, 250);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [searchTerm, requireAll, jobId, candidates.length]);
+
+  // Distance filter runs on the server too (candidate locations are
+  // geocoded at upload); debounced while typing the distance
+  useEffect(() => {
+    const miles = parseFloat(distance);
+    if (!userCoords || !(miles > 0)) {
+      setNearbyMatches(null);
+      return;
+    }
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const { data } = await axios.get("/api/candidates/nearby", {
+          params: { jobId, miles, lat: userCoords.lat, lng: userCoords.lng },
+          signal: controller.signal,
+        });
+        setNearbyMatches(new Set(data.map((m) => m.id)));
+      } catch (err) {
+        if (!axios.isCancel(err)) console.error("nearby search failed:", err);
+      }
+    }, 250);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [userCoords, distance, jobId, candidates.length]);
+
   // Fetch backend config to see if OPENAI_KEY is present
   useEffect(() => {
     fetch("/api/config")
@@ -194,31 +265,25 @@ export default function AppCandidates({ jobId }) {
     });
   }
 
-  // Haversine distance helper (meters)
-  const R = 6371e3;
-  function getDistance(p1, p2) {
-    const toRad = (d) => (d * Math.PI) / 180;
-    const φ1 = toRad(p1.lat),
-      φ2 = toRad(p2.lat);
-    const Δφ = toRad(p2.lat - p1.lat);
-    const Δλ = toRad(p2.lng - p1.lng);
-    const a =
-      Math.sin(Δφ / 2) ** 2 +
-      Math.cos(φ1) * Math.cos(φ2) * Math.sin(Δλ / 2) ** 2;
-    const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
-    return R * c;
-  }
-
   // ── Data Fetch & Upload ────────────────────────────────────────
   async function fetchCandidates() {
     try {
-      const { data } = await axios.get(`/api/candidates?jobId=${jobId}`);
+      // page through the job's candidates; the browser revalidates each
+      // page with its ETag, so unchanged pages come back as 304s
+      const data = [];
+      let after = null;
+      do {
+        const params = { jobId, fields: CANDIDATE_FIELDS, limit: CANDIDATE_PAGE_SIZE };
+        if (after !== null) params.after = after;
+        const res = await axios.get("/api/candidates", { params });
+        data.push(...res.data);
+        after = res.headers["x-next-cursor"] ?? null;
+      } while (after !== null);
       setCandidates(
         data.map((c) => ({
           ...c,
           starred: false,
           scores: {},
-          coords: lookupCoords(c.location),
         }))
       );
     } catch (err) {
@@ -231,8 +296,11 @@ export default function AppCandidates({ jobId }) {
     const form = new FormData();
     Array.from(files).forEach((f) => form.append("files", f));
     try {
-      await axios.post(`/api/upload?jobId=${jobId}`, form);
+      const { data } = await axios.post(`/api/upload?jobId=${jobId}`, form);
       fetchCandidates();
+      // files that could not be parsed come back with an error instead of an id
+      const failed = data.filter((f) => f.error).map((f) => f.filename);
+      if (failed.length) alert(`Could not parse: ${failed.join(", ")}`);
     } catch (err) {
       console.error("uploadResumes failed:", err);
       alert("Upload failed");
@@ -256,40 +324,64 @@ export default function AppCandidates({ jobId }) {
     }
     setIsApplyingReq(true);
     try {
-      // now include jobId so backend only processes that job’s resumes
-      const { data } = await axios.post(
-        `/api/requirements?jobId=${jobId}`, 
-        { requirements: lines }
-      );
+      // stream results: the nickname mapping first, then one line per
+      // candidate as soon as it has been scored
+      const res = await fetch(`/api/requirements/stream?jobId=${jobId}`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ requirements: lines }),
+      });
+      if (!res.ok) throw new Error(`HTTP ${res.status}`);
       // clear the requirements textarea after sending
       setReqText("");
-      // invert label→key into key→label:
-      const flipped = Object.entries(data.mapping).reduce(
-        (acc, [label, key]) => ({ ...acc, [key]: label }),
-        {}
-      );
-      // Merge new mappings into existing ones
-   setMapping(prev => ({ ...prev, ...flipped }));
-
-   // Append only brand-new requirement keys
-   setNicknames(prev => [
-     ...prev,
-     ...Object.keys(flipped).filter(k => !prev.includes(k))
-   ]);
-
-   // Merge each candidate’s new scores into existing scores
-   setCandidates(prev =>
-     prev.map(c => {
-       const scored = data.candidates.find(x => x.id === c.id);
-       return {
-         ...c,
-         scores: {
-           ...c.scores,               // keep old badges
-           ...(scored?.results || {}) // add new ones
-         }
-       };
-     })
-   );
+
+      const handleEvent = (event) => {
+        if (event.type === "mapping") {
+          // invert label→key into key→label:
+          const flipped = Object.entries(event.mapping).reduce(
+            (acc, [label, key]) => ({ ...acc, [key]: label }),
+            {}
+          );
+          // Merge new mappings into existing ones
+          setMapping(prev => ({ ...prev, ...flipped }));
+
+          // Append only brand-new requirement keys
+          setNicknames(prev => [
+            ...prev,
+            ...Object.keys(flipped).filter(k => !prev.includes(k))
+          ]);
+        } else if (event.type === "candidate") {
+          // Merge this candidate’s new scores into existing scores
+          setCandidates(prev =>
+            prev.map(c =>
+              c.id === event.id
+                ? {
+                    ...c,
+                    scores: {
+                      ...c.scores,     // keep old badges
+                      ...event.results // add new ones
+                    }
+                  }
+                : c
+            )
+          );
+        } else if (event.type === "error") {
+          console.error(`Scoring candidate ${event.id} failed:`, event.detail);
+        }
+      };
+
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      for (;;) {
+        const { done, value } = await reader.read();
+        buffer += decoder.decode(value, { stream: !done });
+        const parts = buffer.split("\n");
+        buffer = parts.pop();
+        parts.filter(Boolean).forEach(line => handleEvent(JSON.parse(line)));
+        if (done) break;
+      }
+      if (buffer.trim()) handleEvent(JSON.parse(buffer));
     } catch (err) {
       console.error(err);
       alert("Failed applying requirements");
@@ -481,152 +573,17 @@ export default function AppCandidates({ jobId }) {
   }, [location]);
 
   // ── Entrepreneurial Score Breakdown ────────────────────────────
+  // uniqueness, variety and keyword scores (0–100) are computed on the
+  // server; each becomes a 0–33 slice of the badge
   const entrepreneurialScores = useMemo(() => {
     if (!showEntrepreneurial) return {};
-
-    // build map of id → [{ firstLine, rest }]
-    const projMap = candidates.reduce((acc, c) => {
-      acc[c.id] = (c.projects || []).map((p) => {
-        const lines = p.split("\n").filter(Boolean);
-        const first = (lines[0] || "").replace(/\b\d{4}\b/g, "").trim();
-        const rest = lines
-          .slice(1)
-          .join(" ")
-          .replace(/\b\d{4}\b/g, "")
-          .trim();
-        return { firstLine: first, rest };
-      });
-      return acc;
-    }, {});
-
-    // flatten all firstLines for cross-candidate comparison
-    const allFirsts = Object.values(projMap).flatMap((arr) =>
-      arr.map((x) => x.firstLine)
-    );
-
-    // keyword list (same as before)
-    const keywords = [
-      "Founded",
-      "Founder",
-      "Co-founded",
-      "Self-employed",
-      "Sole proprietor",
-      "Independent contractor",
-      "Owner",
-      "Operator",
-      "Published",
-      "Designed and marketed",
-      "Creator of",
-      "Produced original content",
-      "Curated content",
-      "Personal project",
-      "Portfolio project",
-      "Monetized",
-      "Generated revenue",
-      "Built a customer base",
-      "Scaled a business",
-      "Grew user base",
-      "Started",
-      "Launched",
-      "Ran ads",
-      "Managed ad campaigns",
-      "Online marketplace",
-      "Identified a market gap",
-      "Spearheaded",
-      "Pitched",
-      "Investors",
-      "Freelance",
-      "Consultant",
-      "Contract work",
-      "Online business",
-      "™",
-      "®",
-      "mentored",
-      "Acquired Users",
-      "Built a Customer Base",
-      "market gap",
-      "Sold",
-      "Startup",
-      "Microstartup",
-      "Indie",
-      "independently",
-      "Acquisition offer",
-      "ran",
-      "owned",
-      "managed",
-      "from scratch",
-      "scaled",
-      "waitlist",
-      "Built user base",
-      "Patreon",
-      "Kickstarter",
-      "Kickstarted",
-      "Indiegogo",
-      "Gumroad",
-      "Product Hunt",
-      "Indie Hackers",
-      "BetaList",
-      "AppSumo",
-      "Hacker News",
-      "HN Launch",
-      "Show HN",
-      "MicroAcquire",
-      "Acquire.com",
-      "Shopify",
-      "Etsy",
-      "Teespring",
-      "Printful",
-      "RedBubble",
-      "Big Cartel",
-      "Sellfy",
-      "Stripe",
-      "Paddle",
-      "Lemon Squeezy",
-      "Podia",
-      "ThriveCart",
-      "SamCart",
-    ];
-
     const breakdowns = {};
-    for (const [id, arr] of Object.entries(projMap)) {
-const cand = candidates.find((c) => c.id === +id) || {};
-
-    // pull from backend
-    
-    const factor1 = (cand.project_uniqueness ?? 0) / 100;
-    const factor2 = (cand.project_variety   ?? 0) / 100;
-
-      // 3) keyword match over the entire resume text (projects, skills, experience, education…)
-      const allText = [
-        cand.text || "",
-        ...(cand.projects || []),
-        cand.skills || "",
-        (cand.experience || []).join(" "),
-        (cand.degrees_earned || []).map((d) => d[1]).join(" "),
-      ].join(" ");
-      const hits = keywords.filter((kw) =>
-        new RegExp(
-          `\\b${kw.replace(/[-/\\^$*+?.()|[\\]{}]/g, "\\$&")}\\b`,
-          "i"
-        ).test(allText)
-      ).length;
-      // exponential sensitivity control (lower → steeper)
-      const alpha = 1.8;
-      // raw [0–1]: 1 − e^(−hits/alpha)
-      const raw = 1 - Math.exp(-hits / alpha);
-      // scale into 0–33 point range
-      const keywordPoints = Math.round(raw * 33);
-      const factor3 = raw;
-
-      // convert each factor (0–1) into 0–33 slice, plus total
-      const u = Math.round(factor1 * 33);
-      const v = Math.round(factor2 * 33);
-      const k = Math.round(factor3 * 33);
-      breakdowns[id] = {
-        uniqueness: u,
-        variety: v,
-        keywords: k,
-        total: Math.round(((factor1 + factor2 + factor3) / 3) * 100),
+    for (const c of candidates) {
+      breakdowns[c.id] = {
+        uniqueness: Math.round(((c.project_uniqueness ?? 0) / 100) * 33),
+        variety: Math.round(((c.project_variety ?? 0) / 100) * 33),
+        keywords: Math.round(((c.keyword_score ?? 0) / 100) * 33),
+        total: Math.round(c.entrepreneurial_score ?? 0),
       };
     }
     return breakdowns;
@@ -635,19 +592,8 @@ const cand = candidates.find((c) => c.id === +id) || {};
   // ── Filtering & Sorting ────────────────────────────────────────
   // Apply client‐side filters first
   const filtered = candidates.filter((c) => {
-    // 1) text‐search
-    if (searchTerm.trim()) {
-      const terms = searchTerm
-        .split(",")
-        .map((t) => t.trim().toLowerCase())
-        .filter(Boolean);
-      const hay = c.text?.toLowerCase() || "";
-      if (requireAll) {
-        if (!terms.every((t) => hay.includes(t))) return false;
-      } else {
-        if (!terms.some((t) => hay.includes(t))) return false;
-      }
-    }
+    // 1) text‐search (matches come from the server)
+    if (searchMatches && !searchMatches.has(c.id)) return false;
 
     // 2) GPA filter
     const threshold =
@@ -655,13 +601,8 @@ const cand = candidates.find((c) => c.id === +id) || {};
     if (gpaListed && c.gpa == null) return false;
     if (threshold != null && c.gpa != null && c.gpa < threshold) return false;
 
-    // 3) Distance filter: drop anyone outside `distance` miles
-    if (userCoords && parseFloat(distance) > 0) {
-      if (!c.coords) return false;
-      const meters = getDistance(userCoords, c.coords);
-      const miles = meters / 1609.34;
-      if (miles > parseFloat(distance)) return false;
-    }
+    // 3) Distance filter (matches come from the server)
+    if (nearbyMatches && !nearbyMatches.has(c.id)) return false;
 
     return true;
   });